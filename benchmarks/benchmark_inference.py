@@ -0,0 +1,356 @@
+import os
+import sys
+import json
+import time
+import glob
+import platform
+import resource
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+import cv2
+
+# src/ altındaki modülleri kullanabilmek için
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+def artifact_runtimes(artifact_path):
+    """
+    Model dosyasının türüne göre ölçülebilecek çalışma ortamlarını döndürür.
+    """
+    if os.path.isdir(artifact_path) and os.path.exists(os.path.join(artifact_path, 'saved_model.pb')):
+        return ['savedmodel']
+    if artifact_path.endswith('.tflite'):
+        return ['tflite']
+    return ['keras', 'tf.function', 'tflite']
+
+def load_real_rois(roi_dir, limit=256):
+    """
+    Bir dizindeki (alt dizinler dahil) gerçek el kırpıntılarını yükler.
+    """
+    paths = sorted(path for path in glob.glob(os.path.join(roi_dir, '**', '*'), recursive=True)
+                   if path.lower().endswith(IMAGE_EXTENSIONS))[:limit]
+    rois = [image for image in (cv2.imread(path) for path in paths) if image is not None]
+    return rois
+
+def synthetic_rois(count=64, size=200, seed=0):
+    """
+    Rastgele uint8 BGR kırpıntıları üretir.
+    """
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, size=(size, size, 3), dtype=np.uint8) for _ in range(count)]
+
+def _preprocess(rois, input_shape):
+    """
+    ASLPredictor.preprocess_image ile aynı ön işleme (batch halinde).
+    """
+    height, width, channels = input_shape
+    batch = []
+    for roi in rois:
+        resized = cv2.resize(roi, (width, height))
+        if channels == 1:
+            resized = cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY).reshape(height, width, 1)
+        batch.append(resized)
+    return np.array(batch, dtype='float32') / 255.0
+
+def _load_runtime(artifact_path, runtime):
+    """
+    Modeli istenen çalışma ortamında yükler.
+
+    Returns:
+        infer: uint8 kırpıntı listesi alıp olasılıkları döndüren fonksiyon
+    """
+    import tensorflow as tf
+
+    if runtime == 'savedmodel':
+        loaded = tf.saved_model.load(artifact_path)
+        serve = loaded.signatures['serving_default']
+
+        def infer(rois):
+            # Gömülü ön işleme aynı boyutta kırpıntı bekler; kırpıntılar ilk kırpıntının boyutuna getirilir
+            height, width = rois[0].shape[:2]
+            images = np.stack([cv2.resize(roi, (width, height)) for roi in rois])
+            return serve(images=tf.constant(images))['probabilities'].numpy()
+        infer.loaded = loaded
+        return infer
+
+    if runtime == 'tflite':
+        interpreter = tf.lite.Interpreter(model_path=artifact_path, num_threads=os.cpu_count())
+        input_detail = interpreter.get_input_details()[0]
+        output_detail = interpreter.get_output_details()[0]
+        input_shape = tuple(input_detail['shape'][1:])
+        allocated = {'batch_size': None}
+
+        def infer(rois):
+            if allocated['batch_size'] != len(rois):
+                interpreter.resize_tensor_input(input_detail['index'], (len(rois),) + input_shape)
+                interpreter.allocate_tensors()
+                allocated['batch_size'] = len(rois)
+            interpreter.set_tensor(input_detail['index'], _preprocess(rois, input_shape))
+            interpreter.invoke()
+            return interpreter.get_tensor(output_detail['index'])
+        return infer
+
+    from model_optimization import load_optimized_model
+    model = load_optimized_model(artifact_path)
+    input_shape = tuple(model.input_shape[1:])
+
+    if runtime == 'keras':
+        # ASLPredictor'ın kullandığı yol
+        def infer(rois):
+            return model.predict(_preprocess(rois, input_shape), verbose=0)
+        return infer
+
+    if runtime == 'tf.function':
+        function = tf.function(lambda x: model(x, training=False),
+                               input_signature=[tf.TensorSpec((None,) + input_shape, tf.float32)])
+
+        def infer(rois):
+            return function(_preprocess(rois, input_shape)).numpy()
+        return infer
+
+    raise ValueError(f"Bilinmeyen çalışma ortamı: {runtime}")
+
+def _peak_rss_mb():
+    """
+    Sürecin en yüksek bellek kullanımı (MB). Linux'ta ru_maxrss exec sonrasında
+    ana sürecin değerini taşıdığından /proc/self/status içindeki VmHWM kullanılır.
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    # Linux'ta ru_maxrss kilobayt cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+def run_worker(spec):
+    """
+    Tek bir (model, çalışma ortamı) çiftini ayrı bir süreçte ölçer. Soğuk yükleme
+    süresi ve en yüksek bellek kullanımı (RSS) süreç başına ölçülür.
+
+    Args:
+        spec: artifact, runtime, batch_sizes, warmup, runs, roi_dir
+
+    Returns:
+        results: Her girdi türü ve batch boyutu için ölçümler
+    """
+    start = time.perf_counter()
+    infer = _load_runtime(spec['artifact'], spec['runtime'])
+    cold_load_ms = (time.perf_counter() - start) * 1000.0
+
+    inputs = {'synthetic': synthetic_rois()}
+    if spec.get('roi_dir'):
+        rois = load_real_rois(spec['roi_dir'])
+        if rois:
+            inputs['real'] = rois
+
+    results = []
+    first_inference_ms = None
+    for input_name, rois in inputs.items():
+        for batch_size in spec['batch_sizes']:
+            batches = [[rois[(i * batch_size + j) % len(rois)] for j in range(batch_size)]
+                       for i in range(spec['warmup'] + spec['runs'])]
+
+            start = time.perf_counter()
+            infer(batches[0])
+            first_call_ms = (time.perf_counter() - start) * 1000.0
+            if first_inference_ms is None:
+                first_inference_ms = first_call_ms
+
+            for batch in batches[1:spec['warmup']]:
+                infer(batch)
+
+            timings = []
+            for batch in batches[spec['warmup']:]:
+                start = time.perf_counter()
+                infer(batch)
+                timings.append((time.perf_counter() - start) * 1000.0)
+
+            results.append({
+                'artifact': spec['artifact'],
+                'runtime': spec['runtime'],
+                'input': input_name,
+                'batch_size': batch_size,
+                'cold_load_ms': cold_load_ms,
+                'first_inference_ms': first_inference_ms,
+                'first_call_ms': first_call_ms,
+                'p50_ms': float(np.percentile(timings, 50)),
+                'p99_ms': float(np.percentile(timings, 99)),
+                'throughput_per_sec': float(batch_size * len(timings) / (sum(timings) / 1000.0))
+            })
+
+    peak_rss_mb = _peak_rss_mb()
+    for result in results:
+        result['peak_rss_mb'] = peak_rss_mb
+
+    return results
+
+def convert_to_tflite(model_path, output_dir):
+    """
+    Keras modelini TFLite biçimine çevirir (ölçümden önce, ana süreçte).
+    """
+    import tensorflow as tf
+    from model_optimization import load_optimized_model
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(load_optimized_model(model_path))
+    tflite_path = os.path.join(output_dir, os.path.splitext(os.path.basename(model_path))[0] + '.tflite')
+    with open(tflite_path, 'wb') as f:
+        f.write(converter.convert())
+    return tflite_path
+
+def _run_in_subprocess(spec):
+    """
+    Ölçümü temiz bir Python sürecinde çalıştırır (soğuk yükleme ve RSS birbirini etkilemesin).
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        spec_path = os.path.join(temp_dir, 'spec.json')
+        output_path = os.path.join(temp_dir, 'results.json')
+        with open(spec_path, 'w') as f:
+            json.dump(spec, f)
+
+        environment = dict(os.environ, TF_CPP_MIN_LOG_LEVEL='2')
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', spec_path, output_path],
+                                   env=environment)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Ölçüm başarısız: {spec['artifact']} ({spec['runtime']})")
+
+        with open(output_path, 'r') as f:
+            return json.load(f)
+
+def _result_key(result):
+    return (os.path.basename(os.path.normpath(result['artifact'])), result['runtime'], result['input'],
+            result['batch_size'])
+
+def check_regressions(results, baseline_path, max_regression):
+    """
+    Sonuçları temel ölçümle karşılaştırır. p50 gecikmesi veya verim belirtilen
+    orandan fazla kötüleşmişse gerilemeleri döndürür.
+
+    Args:
+        results: Güncel ölçümler
+        baseline_path: Önceki çalıştırmanın JSON çıktısı
+        max_regression: İzin verilen en büyük kötüleşme oranı (ör. 0.1 = %10)
+
+    Returns:
+        regressions: Gerileme açıklamaları
+    """
+    with open(baseline_path, 'r') as f:
+        baseline = {_result_key(result): result for result in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        reference = baseline.get(_result_key(result))
+        if reference is None:
+            continue
+
+        name = '/'.join(str(part) for part in _result_key(result))
+        if result['p50_ms'] > reference['p50_ms'] * (1.0 + max_regression):
+            regressions.append(f"{name}: p50 {reference['p50_ms']:.2f} -> {result['p50_ms']:.2f} ms")
+        if result['throughput_per_sec'] < reference['throughput_per_sec'] * (1.0 - max_regression):
+            regressions.append(f"{name}: verim {reference['throughput_per_sec']:.1f} -> "
+                               f"{result['throughput_per_sec']:.1f} /sn")
+
+    return regressions
+
+def print_results(results):
+    """
+    Ölçüm tablosunu yazdırır.
+    """
+    print(f"\n{'Model':28} {'Ortam':12} {'Girdi':10} {'Batch':>5} {'Yükleme':>9} {'İlk':>8} "
+          f"{'p50':>8} {'p99':>8} {'Verim/sn':>10} {'RSS MB':>8}")
+    for result in results:
+        print(f"{os.path.basename(os.path.normpath(result['artifact']))[:28]:28} {result['runtime']:12} "
+              f"{result['input']:10} {result['batch_size']:>5} {result['cold_load_ms']:9.1f} "
+              f"{result['first_call_ms']:8.1f} {result['p50_ms']:8.2f} {result['p99_ms']:8.2f} "
+              f"{result['throughput_per_sec']:10.1f} {result['peak_rss_mb']:8.1f}")
+
+def main():
+    """
+    Çıkarım ölçüm betiği ana fonksiyonu.
+    """
+    if len(sys.argv) == 4 and sys.argv[1] == '--worker':
+        with open(sys.argv[2], 'r') as f:
+            spec = json.load(f)
+        with open(sys.argv[3], 'w') as f:
+            json.dump(run_worker(spec), f)
+        return
+
+    parser = argparse.ArgumentParser(description='ASL modeli çıkarım ölçümleri')
+    parser.add_argument('--models', type=str, nargs='+', default=['models/asl_model.h5'],
+                        help='Ölçülecek modeller (.h5, .tflite veya SavedModel dizini)')
+    parser.add_argument('--runtimes', type=str, nargs='+', choices=['keras', 'tf.function', 'tflite', 'savedmodel'],
+                        help='Yalnızca bu çalışma ortamlarını ölç (varsayılan: modele uygun tümü)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8, 32],
+                        help='Batch boyutları')
+    parser.add_argument('--warmup', type=int, default=5,
+                        help='Ölçüme katılmayan ısınma çağrısı sayısı')
+    parser.add_argument('--runs', type=int, default=50,
+                        help='Ölçüm tekrar sayısı')
+    parser.add_argument('--roi-dir', type=str,
+                        help='Gerçek el kırpıntılarının bulunduğu dizin (alt dizinler dahil)')
+    parser.add_argument('--output', type=str, default='benchmarks/results.json',
+                        help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--baseline', type=str,
+                        help='Karşılaştırılacak önceki sonuç dosyası')
+    parser.add_argument('--max-regression', type=float, default=0.1,
+                        help='İzin verilen en büyük kötüleşme oranı (p50 ve verim için)')
+
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for artifact in args.models:
+            runtimes = [runtime for runtime in artifact_runtimes(artifact)
+                        if args.runtimes is None or runtime in args.runtimes]
+
+            for runtime in runtimes:
+                artifact_path = artifact
+                if runtime == 'tflite' and not artifact.endswith('.tflite'):
+                    artifact_path = convert_to_tflite(artifact, temp_dir)
+
+                print(f"Ölçülüyor: {artifact} ({runtime})")
+                for result in _run_in_subprocess({
+                    'artifact': artifact_path,
+                    'runtime': runtime,
+                    'batch_sizes': args.batch_sizes,
+                    'warmup': args.warmup,
+                    'runs': args.runs,
+                    'roi_dir': args.roi_dir
+                }):
+                    # Dönüştürülen geçici dosya yerine kaynak model adı kaydedilir
+                    result['artifact'] = artifact
+                    results.append(result)
+
+    print_results(results)
+
+    import tensorflow as tf
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'environment': {
+                'python': platform.python_version(),
+                'tensorflow': tf.__version__,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count()
+            },
+            'results': results
+        }, f, indent=2)
+    print(f"\nSonuçlar kaydedildi: {args.output}")
+
+    if args.baseline:
+        regressions = check_regressions(results, args.baseline, args.max_regression)
+        if regressions:
+            print(f"\n%{100 * args.max_regression:.0f} eşiğini aşan gerilemeler:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("Gerileme yok.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import os
+import json
+import numpy as np
+from sklearn.metrics import confusion_matrix, precision_recall_fscore_support
+from sklearn.model_selection import StratifiedKFold
+
+from parallel_training import prepare_shared_dataset, run_parallel, train_candidate
+
+def aggregate_folds(fold_results, classes):
+    """
+    Katman sonuçlarını birleştirir: doğruluğun ortalaması/standart sapması,
+    sınıf başına kesinlik/duyarlılık/F1 ortalaması ve toplam karışıklık matrisi.
+
+    Args:
+        fold_results: y_true ve y_pred içeren katman sonuçları
+        classes: Sınıf adları (etiket kodu sırasıyla)
+
+    Returns:
+        summary: Birleştirilmiş metrikler
+    """
+    labels = list(range(len(classes)))
+    accuracies = []
+    precisions, recalls, f1_scores = [], [], []
+    total_matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+
+    for result in fold_results:
+        y_true = np.asarray(result['y_true'])
+        y_pred = np.asarray(result['y_pred'])
+
+        accuracies.append(float(np.mean(y_true == y_pred)))
+        precision, recall, f1, _ = precision_recall_fscore_support(y_true, y_pred, labels=labels, zero_division=0)
+        precisions.append(precision)
+        recalls.append(recall)
+        f1_scores.append(f1)
+
+        matrix = confusion_matrix(y_true, y_pred, labels=labels)
+        result['confusion_matrix'] = matrix.tolist()
+        total_matrix += matrix
+
+    precisions, recalls, f1_scores = np.array(precisions), np.array(recalls), np.array(f1_scores)
+    per_class = {
+        label: {
+            'precision_mean': float(precisions[:, code].mean()),
+            'precision_std': float(precisions[:, code].std()),
+            'recall_mean': float(recalls[:, code].mean()),
+            'recall_std': float(recalls[:, code].std()),
+            'f1_mean': float(f1_scores[:, code].mean()),
+            'f1_std': float(f1_scores[:, code].std()),
+            'support': int(total_matrix[code].sum())
+        }
+        for code, label in enumerate(classes)
+    }
+
+    return {
+        'folds': len(fold_results),
+        'fold_accuracies': accuracies,
+        'accuracy_mean': float(np.mean(accuracies)),
+        'accuracy_std': float(np.std(accuracies)),
+        'per_class': per_class,
+        'confusion_matrix': total_matrix.tolist()
+    }
+
+def print_cv_summary(summary, classes):
+    """
+    Çapraz doğrulama özetini yazdırır.
+    """
+    print(f"\nDoğruluk: {summary['accuracy_mean']:.4f} ± {summary['accuracy_std']:.4f} "
+          f"({', '.join(f'{accuracy:.4f}' for accuracy in summary['fold_accuracies'])})")
+    print(f"{'Sınıf':>8} {'Kesinlik':>16} {'Duyarlılık':>16} {'F1':>16} {'Örnek':>7}")
+    for label in classes:
+        metrics = summary['per_class'][label]
+        print(f"{label:>8} {metrics['precision_mean']:8.3f} ± {metrics['precision_std']:5.3f} "
+              f"{metrics['recall_mean']:8.3f} ± {metrics['recall_std']:5.3f} "
+              f"{metrics['f1_mean']:8.3f} ± {metrics['f1_std']:5.3f} {metrics['support']:7}")
+
+def plot_confusion_matrix(matrix, classes, save_path, title='Karışıklık Matrisi (tüm katmanlar)'):
+    """
+    Satırları normalize edilmiş karışıklık matrisini görselleştirir.
+    """
+    import matplotlib.pyplot as plt
+
+    matrix = np.asarray(matrix, dtype=np.float64)
+    normalized = matrix / np.maximum(matrix.sum(axis=1, keepdims=True), 1)
+
+    size = max(6, len(classes) * 0.35)
+    plt.figure(figsize=(size, size))
+    plt.imshow(normalized, cmap='Blues', vmin=0, vmax=1)
+    plt.colorbar(fraction=0.046)
+    plt.xticks(range(len(classes)), classes, rotation=90)
+    plt.yticks(range(len(classes)), classes)
+    plt.xlabel('Tahmin')
+    plt.ylabel('Gerçek')
+    plt.title(title)
+    plt.tight_layout()
+
+    os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
+    plt.savefig(save_path)
+    plt.close()
+
+def run_cross_validation(data_dir, dataset_dir, output_dir, folds=5, image_size=64, arch='cnn', width_multiplier=1.0,
+                         learning_rate=0.001, batch_size=32, epochs=10, augment=False, workers=2,
+                         threads_per_worker=None, seed=42):
+    """
+    Katmanlı k-katlı çapraz doğrulamayı paralel süreçlerde çalıştırır. Katmanlar
+    aynı parçalı veri setini salt okunur bellek eşlemesiyle paylaşır.
+
+    Args:
+        data_dir: Veri setinin yolu
+        dataset_dir: Paylaşılan parçalı veri setinin klasörü
+        output_dir: Sonuçların yazılacağı klasör
+        folds: Katman sayısı
+        image_size: Görüntü boyutu
+        arch, width_multiplier, learning_rate, batch_size, epochs, augment: Eğitim ayarları
+        workers: Paralel süreç sayısı
+        threads_per_worker: Süreç başına iş parçacığı sayısı
+        seed: Katman bölme ve eğitim için rastgele tohum
+
+    Returns:
+        summary: Birleştirilmiş metrikler
+    """
+    dataset = prepare_shared_dataset(data_dir, dataset_dir, (image_size, image_size))
+    all_indices = dataset.valid_indices()
+    splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+
+    tasks = []
+    for fold, (train_positions, val_positions) in enumerate(splitter.split(all_indices, dataset.labels[all_indices])):
+        tasks.append({
+            'dataset_dir': dataset_dir,
+            'train_indices': all_indices[train_positions],
+            'val_indices': all_indices[val_positions],
+            'arch': arch,
+            'width_multiplier': width_multiplier,
+            'learning_rate': learning_rate,
+            'batch_size': batch_size,
+            'image_size': image_size,
+            'augment': augment,
+            'epochs': epochs,
+            'seed': seed + fold,
+            'return_predictions': True
+        })
+
+    fold_results = [None] * len(tasks)
+    for fold, result in run_parallel(train_candidate, tasks, workers=workers, threads_per_worker=threads_per_worker):
+        print(f"Katman {fold + 1}/{folds}: doğruluk {result['val_accuracy']:.4f}")
+        result['fold'] = fold
+        fold_results[fold] = result
+
+    summary = aggregate_folds(fold_results, dataset.classes)
+    summary['settings'] = {
+        'arch': arch, 'width_multiplier': width_multiplier, 'learning_rate': learning_rate,
+        'batch_size': batch_size, 'image_size': image_size, 'epochs': epochs, 'augment': augment, 'seed': seed
+    }
+    summary['fold_results'] = [
+        {key: value for key, value in result.items() if key not in ('y_true', 'y_pred')}
+        for result in fold_results
+    ]
+    print_cv_summary(summary, dataset.classes)
+
+    os.makedirs(output_dir, exist_ok=True)
+    results_path = os.path.join(output_dir, 'cv_results.json')
+    with open(results_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    plot_confusion_matrix(summary['confusion_matrix'], dataset.classes, os.path.join(output_dir, 'cv_confusion_matrix.png'))
+    print(f"Çapraz doğrulama sonuçları kaydedildi: {results_path}")
+
+    return summary
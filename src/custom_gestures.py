@@ -0,0 +1,194 @@
+import os
+import pickle
+import hashlib
+import numpy as np
+
+from gesture_recognizer import landmarks_to_array
+
+# Varsayılan kayıt yeri: proje kökündeki models klasörü
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models",
+                                  "custom_gestures.npz")
+
+def normalize_landmarks(points):
+    """
+    Landmark noktalarını konumdan ve el boyutundan bağımsız bir vektöre çevirir:
+    bilek orijine taşınır, koordinatlar bilek-orta parmak kökü mesafesine bölünür.
+    Elin yönü korunur (ör. başparmak yukarı/aşağı ayrı kalır).
+
+    Args:
+        points: (..., 21, 3) landmark dizisi
+
+    Returns:
+        vectors: (..., 60) normalize edilmiş vektörler (bilek hariç)
+    """
+    relative = points[..., 1:, :] - points[..., :1, :]
+    palm_size = np.linalg.norm(relative[..., 8, :2], axis=-1)  # Orta parmak kökü (9)
+    relative = relative / np.maximum(palm_size, 1e-6)[..., np.newaxis, np.newaxis]
+    return relative.reshape(relative.shape[:-2] + (60,))
+
+class CustomGestureStore:
+    """
+    Kullanıcının kaydettiği özel el hareketlerini saklar ve en yakın komşu
+    araması ile sınıflandırır. Örnekler .npz dosyasında, KD-ağacı indeksi ise
+    yanındaki .pkl dosyasında saklanır; ikisi de ilk ihtiyaç duyulduğunda yüklenir.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, max_distance=1.0, k=3):
+        """
+        Args:
+            path: Örneklerin saklandığı .npz dosyası
+            max_distance: Eşleşme sayılacak en büyük normalize edilmiş mesafe
+            k: Oylamaya katılan komşu sayısı
+        """
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + "_index.pkl"
+        self.max_distance = max_distance
+        self.k = k
+
+        # Tembel yüklenen veriler
+        self._vectors = None
+        self._labels = None
+        self._names = None
+        self._index = None
+
+    def _load(self):
+        if self._vectors is not None:
+            return
+        if os.path.exists(self.path):
+            with np.load(self.path) as data:
+                self._vectors = data['vectors']
+                self._labels = data['labels']
+                self._names = [str(name) for name in data['names']]
+        else:
+            self._vectors = np.zeros((0, 60))
+            self._labels = np.zeros(0, dtype=np.int64)
+            self._names = []
+
+    @property
+    def names(self):
+        """
+        Kayıtlı özel hareketlerin adları.
+        """
+        self._load()
+        return list(self._names)
+
+    def __len__(self):
+        self._load()
+        return len(self._vectors)
+
+    def _fingerprint(self):
+        # İndeksin örneklerle uyumlu olup olmadığını anlamak için içerik özeti
+        digest = hashlib.sha1(self._vectors.tobytes())
+        digest.update(self._labels.tobytes())
+        return digest.hexdigest()
+
+    def _get_index(self):
+        """
+        KD-ağacını diskten yükler; yoksa veya örnekler değiştiyse yeniden oluşturup kaydeder.
+        """
+        if self._index is not None:
+            return self._index
+
+        self._load()
+        fingerprint = self._fingerprint()
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'rb') as f:
+                stored = pickle.load(f)
+            if stored['fingerprint'] == fingerprint:
+                self._index = stored['index']
+                return self._index
+
+        from sklearn.neighbors import KDTree
+
+        self._index = KDTree(self._vectors)
+        os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+        with open(self.index_path, 'wb') as f:
+            pickle.dump({'fingerprint': fingerprint, 'index': self._index}, f)
+        return self._index
+
+    def add_gesture(self, name, landmark_frames, max_samples=20):
+        """
+        Kaydedilen karelerden özel hareket örnekleri ekler. Ardışık kareler
+        birbirine çok benzediği için eşit aralıklı en fazla max_samples kare saklanır.
+
+        Args:
+            name: Hareket adı
+            landmark_frames: MediaPipe el landmark noktaları veya (21, 3) dizi listesi
+            max_samples: Saklanacak en fazla örnek sayısı
+
+        Returns:
+            num_samples: Eklenen örnek sayısı
+        """
+        if not landmark_frames:
+            return 0
+
+        self._load()
+        points = np.array([landmarks_to_array(frame) for frame in landmark_frames])
+        chosen = np.unique(np.linspace(0, len(points) - 1, min(max_samples, len(points))).round().astype(int))
+        vectors = normalize_landmarks(points[chosen])
+
+        if name not in self._names:
+            self._names.append(name)
+        code = self._names.index(name)
+
+        self._vectors = np.concatenate((self._vectors, vectors))
+        self._labels = np.concatenate((self._labels, np.full(len(vectors), code, dtype=np.int64)))
+        self._index = None
+        return len(vectors)
+
+    def remove_gesture(self, name):
+        """
+        Bir özel hareketin tüm örneklerini siler.
+        """
+        self._load()
+        if name not in self._names:
+            return
+
+        code = self._names.index(name)
+        keep = self._labels != code
+        self._vectors = self._vectors[keep]
+        # Sonraki hareketlerin kodları bir kayar
+        self._labels = np.where(self._labels[keep] > code, self._labels[keep] - 1, self._labels[keep])
+        self._names.pop(code)
+        self._index = None
+
+    def save(self):
+        """
+        Örnekleri ve KD-ağacı indeksini diske yazar.
+        """
+        self._load()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        np.savez(self.path, vectors=self._vectors, labels=self._labels, names=np.array(self._names))
+        if len(self._vectors):
+            self._get_index()
+        elif os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+    def classify(self, hand_landmarks):
+        """
+        Eli kayıtlı özel hareketlerle karşılaştırır.
+
+        Args:
+            hand_landmarks: MediaPipe el landmark noktaları veya (21, 3) dizi
+
+        Returns:
+            gesture_name: Eşleşen özel hareket (yoksa "unknown")
+            confidence: Tanıma güveni (0.6-1.0 arası, eşleşme yoksa 0)
+        """
+        if len(self) == 0:
+            return "unknown", 0.0
+
+        vector = normalize_landmarks(landmarks_to_array(hand_landmarks))[np.newaxis]
+        k = min(self.k, len(self._vectors))
+        distances, indices = self._get_index().query(vector, k=k)
+        distances, labels = distances[0], self._labels[indices[0]]
+
+        # Yalnızca eşik içindeki komşular oy verir; çoğunluğu alan hareket kazanır
+        close = distances <= self.max_distance
+        if not close.any():
+            return "unknown", 0.0
+
+        votes = np.bincount(labels[close], minlength=len(self._names))
+        code = int(np.argmax(votes))
+        nearest = distances[close][labels[close] == code].min()
+        return self._names[code], float(1.0 - 0.4 * nearest / self.max_distance)
@@ -1,8 +1,9 @@
 import os
 import cv2
 import numpy as np
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import train_test_split, StratifiedGroupKFold
 from sklearn.preprocessing import LabelEncoder
+from dataset_dedup import hash_images, find_droppable_duplicates, cluster_ids
 
 def load_data(data_dir, image_size=(64, 64)):
     """
@@ -43,7 +44,7 @@ def load_data(data_dir, image_size=(64, 64)):
     
     return np.array(images), np.array(labels)
 
-def preprocess_data(images, labels, test_size=0.2, random_state=42):
+def preprocess_data(images, labels, test_size=0.2, random_state=42, groups=None):
     """
     Veri setini ön işlemden geçirir ve eğitim/test setlerine ayırır.
     
@@ -52,6 +53,7 @@ def preprocess_data(images, labels, test_size=0.2, random_state=42):
         labels: Etiket dizisi
         test_size: Test seti oranı
         random_state: Rastgele durum (tekrarlanabilirlik için)
+        groups: Grup numaraları (belirtilirse aynı gruptaki örnekler aynı tarafta kalır)
         
     Returns:
         X_train, X_test: Eğitim ve test görüntüleri
@@ -66,7 +68,14 @@ def preprocess_data(images, labels, test_size=0.2, random_state=42):
     y = label_encoder.fit_transform(labels)
     
     # Eğitim ve test setlerine ayırın
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state, stratify=y)
+    if groups is None:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state, stratify=y)
+    else:
+        # Gruplar bölünmeden katmanlı ayırma: test oranına en yakın katlama sayısının ilk katı
+        n_splits = max(2, int(round(1 / test_size)))
+        splitter = StratifiedGroupKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+        train_idx, test_idx = next(splitter.split(X, y, groups))
+        X_train, X_test, y_train, y_test = X[train_idx], X[test_idx], y[train_idx], y[test_idx]
     
     return X_train, X_test, y_train, y_test, label_encoder
 
@@ -112,7 +121,8 @@ def augment_data(images, labels):
     
     return np.array(augmented_images), np.array(augmented_labels)
 
-def prepare_data_for_training(data_dir, image_size=(64, 64), test_size=0.2, apply_augmentation=True):
+def prepare_data_for_training(data_dir, image_size=(64, 64), test_size=0.2, apply_augmentation=True,
+                              duplicates=None, max_hash_distance=4):
     """
     Eğitim için veriyi hazırlar.
     
@@ -121,6 +131,10 @@ def prepare_data_for_training(data_dir, image_size=(64, 64), test_size=0.2, appl
         image_size: Görüntü boyutu
         test_size: Test seti oranı
         apply_augmentation: Veri çoğaltma uygulansın mı?
+        duplicates: Yakın kopyalar için davranış: None (dokunma), 'drop' (tutulan bir
+            örneğin aynı sınıftaki yakın kopyalarını çıkar) veya 'group' (aynı sınıftaki
+            her kümeyi bölmenin tek tarafında tut)
+        max_hash_distance: Yakın kopya sayılacak en büyük özet (dHash) mesafesi
         
     Returns:
         X_train, X_test: Eğitim ve test görüntüleri
@@ -131,8 +145,23 @@ def prepare_data_for_training(data_dir, image_size=(64, 64), test_size=0.2, appl
     # Veriyi yükle
     images, labels = load_data(data_dir, image_size)
     
+    # Yakın kopyaları bul
+    groups = None
+    if duplicates is not None:
+        hashes = hash_images(images)
+        if duplicates == 'drop':
+            dropped, num_representatives = find_droppable_duplicates(hashes, max_hash_distance, labels)
+            keep = np.setdiff1d(np.arange(len(images)), dropped)
+            print(f"{len(dropped)} yakın kopya görüntü çıkarıldı ({num_representatives} küme).")
+            images, labels = images[keep], labels[keep]
+        elif duplicates == 'group':
+            groups = cluster_ids(hashes, max_hash_distance, labels)
+            print(f"{len(images) - len(np.unique(groups))} yakın kopya görüntü kümeleriyle aynı tarafta tutulacak.")
+        else:
+            raise ValueError(f"Bilinmeyen kopya davranışı: {duplicates}")
+    
     # Veriyi ön işlemden geçir
-    X_train, X_test, y_train, y_test, label_encoder = preprocess_data(images, labels, test_size)
+    X_train, X_test, y_train, y_test, label_encoder = preprocess_data(images, labels, test_size, groups=groups)
     
     # Veri çoğaltma uygula
     if apply_augmentation:
@@ -0,0 +1,264 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+
+def dhash(image, hash_size=8):
+    """
+    Görüntünün fark özetini (difference hash) hesaplar. Birbirine çok benzeyen
+    kareler küçük Hamming mesafeli özetler üretir.
+
+    Args:
+        image: BGR veya gri tonlamalı görüntü
+        hash_size: Özet kenar uzunluğu (hash_size*hash_size bit)
+
+    Returns:
+        hash_value: Tamsayı olarak özet
+    """
+    if len(image.shape) == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    # Yatay komşu pikselleri karşılaştırmak için bir sütun fazla
+    resized = cv2.resize(image, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (resized[:, 1:] > resized[:, :-1]).flatten()
+
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+def hamming_distance(hash1, hash2):
+    """
+    İki özet arasındaki farklı bit sayısını döndürür.
+    """
+    return bin(hash1 ^ hash2).count('1')
+
+def _hash_file(image_path):
+    """
+    Dosyayı okuyup özetini döndürür. Okunamayan dosyalar için None döner.
+    """
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+    return dhash(image)
+
+def hash_image_files(image_paths, workers=None):
+    """
+    Görüntü dosyalarının özetlerini paralel olarak hesaplar.
+    OpenCV okuma ve yeniden boyutlandırma sırasında GIL'i bıraktığı için
+    iş parçacıkları tüm çekirdekleri kullanabilir.
+
+    Args:
+        image_paths: Dosya yolları
+        workers: İş parçacığı sayısı (None ise çekirdek sayısı)
+
+    Returns:
+        hashes: Her dosya için özet (okunamayanlar için None)
+    """
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_hash_file, image_paths))
+
+def hash_images(images):
+    """
+    Bellekteki görüntülerin özetlerini hesaplar.
+
+    Args:
+        images: Görüntü dizisi
+
+    Returns:
+        hashes: Özet listesi
+    """
+    return [dhash(image) for image in images]
+
+class BKTree:
+    """
+    Hamming mesafesi üzerine kurulu BK ağacı. Bir özete belirli bir mesafe
+    içindeki tüm özetleri, tüm çiftleri karşılaştırmadan bulur.
+    """
+
+    def __init__(self):
+        # Düğüm: [özet, öğe listesi, {mesafe: çocuk düğüm}]
+        self.root = None
+
+    def add(self, hash_value, item):
+        """
+        Ağaca bir özet ve ilişkili öğeyi ekler.
+        """
+        if self.root is None:
+            self.root = [hash_value, [item], {}]
+            return
+
+        node = self.root
+        while True:
+            distance = hamming_distance(hash_value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [hash_value, [item], {}]
+                return
+            node = child
+
+    def search(self, hash_value, max_distance):
+        """
+        Verilen özete en fazla max_distance uzaklıktaki öğeleri döndürür.
+        """
+        results = []
+        if self.root is None:
+            return results
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(hash_value, node[0])
+            if distance <= max_distance:
+                results.extend(node[1])
+
+            # Üçgen eşitsizliği: yalnızca [d-max, d+max] aralığındaki dallara in
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+
+        return results
+
+def find_duplicate_clusters(hashes, max_distance=4, labels=None):
+    """
+    Özetleri birbirine max_distance uzaklıkta olan örnekleri kümeler. Eşleşmeler
+    geçişli birleştirilir (A~B, B~C ise A, B ve C aynı kümededir); bu yüzden
+    kümenin uçları birbirinden max_distance'tan uzak olabilir.
+
+    Args:
+        hashes: Özet listesi (None olanlar atlanır)
+        max_distance: Yakın kopya sayılacak en büyük Hamming mesafesi
+        labels: Etiketler (belirtilirse yalnızca aynı etiketli örnekler kümelenir)
+
+    Returns:
+        clusters: Birden fazla örnek içeren kümeler (indeks listeleri)
+    """
+    parent = list(range(len(hashes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    tree = BKTree()
+    for i, hash_value in enumerate(hashes):
+        if hash_value is None:
+            continue
+
+        # Önceden eklenmiş yakın özetlerle birleştir
+        for j in tree.search(hash_value, max_distance):
+            if labels is not None and labels[i] != labels[j]:
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[root_i] = root_j
+
+        tree.add(hash_value, i)
+
+    groups = {}
+    for i in range(len(hashes)):
+        if hashes[i] is not None:
+            groups.setdefault(find(i), []).append(i)
+
+    return [sorted(members) for members in groups.values() if len(members) > 1]
+
+def find_droppable_duplicates(hashes, max_distance=4, labels=None):
+    """
+    Çıkarılabilecek yakın kopyaları seçer. Örnekler sırayla dolaşılır; henüz
+    seçilmemiş her örnek temsilci olarak tutulur ve ona en fazla max_distance
+    uzaklıktaki (aynı etiketli) örnekler çıkarılır. Geçişli kümelerden farklı
+    olarak her çıkarılan örnek tutulan bir temsilcinin yakın kopyasıdır.
+
+    Args:
+        hashes: Özet listesi (None olanlar atlanır)
+        max_distance: Yakın kopya sayılacak en büyük Hamming mesafesi
+        labels: Etiketler (belirtilirse yalnızca aynı etiketli örnekler çıkarılır)
+
+    Returns:
+        dropped: Çıkarılacak örneklerin sıralı indeksleri
+        num_representatives: Kopyası çıkarılan temsilci sayısı
+    """
+    tree = BKTree()
+    for i, hash_value in enumerate(hashes):
+        if hash_value is not None:
+            tree.add(hash_value, i)
+
+    assigned = np.zeros(len(hashes), dtype=bool)
+    dropped = []
+    num_representatives = 0
+    for i, hash_value in enumerate(hashes):
+        if hash_value is None or assigned[i]:
+            continue
+        assigned[i] = True
+
+        duplicates = [j for j in tree.search(hash_value, max_distance)
+                      if not assigned[j] and (labels is None or labels[i] == labels[j])]
+        if duplicates:
+            assigned[duplicates] = True
+            dropped.extend(duplicates)
+            num_representatives += 1
+
+    return sorted(dropped), num_representatives
+
+def cluster_ids(hashes, max_distance=4, labels=None):
+    """
+    Her örnek için küme numarası döndürür. Kopyası olmayan örnekler kendi
+    kümelerinde kalır.
+
+    Returns:
+        groups: Küme numaraları dizisi
+    """
+    groups = np.arange(len(hashes))
+    for cluster in find_duplicate_clusters(hashes, max_distance, labels):
+        groups[cluster] = cluster[0]
+    return groups
+
+def find_dataset_duplicates(data_dir, max_distance=4, workers=None, output_path=None):
+    """
+    Veri setindeki kopya ve yakın kopya görüntüleri bulur ve raporlar.
+
+    Args:
+        data_dir: Veri setinin yolu (load_data klasör düzeni)
+        max_distance: Yakın kopya sayılacak en büyük Hamming mesafesi
+        workers: Özet hesaplama için iş parçacığı sayısı
+        output_path: Kümelerin yazılacağı JSON dosyası (isteğe bağlı)
+
+    Returns:
+        clusters: Göreli dosya yollarından oluşan kümeler
+    """
+    from dataset_shards import list_dataset_files
+
+    files = list_dataset_files(data_dir)
+    paths = [os.path.join(data_dir, relative_path) for relative_path, _ in files]
+
+    print(f"{len(paths)} görüntünün özeti hesaplanıyor...")
+    hashes = hash_image_files(paths, workers)
+
+    clusters = []
+    for cluster in find_duplicate_clusters(hashes, max_distance):
+        clusters.append([files[i][0] for i in cluster])
+
+    clusters.sort(key=len, reverse=True)
+    duplicate_count = sum(len(cluster) - 1 for cluster in clusters)
+
+    print(f"Kopya kümesi sayısı: {len(clusters)}")
+    print(f"Çıkarılabilecek kopya görüntü sayısı: {duplicate_count} / {len(paths)}")
+
+    # Farklı sınıflara dağılmış kümeler etiket hatasına işaret edebilir
+    mixed = [cluster for cluster in clusters if len(set(os.path.dirname(p) for p in cluster)) > 1]
+    if mixed:
+        print(f"Uyarı: {len(mixed)} küme birden fazla sınıf içeriyor.")
+
+    for cluster in clusters[:10]:
+        print(f"  {len(cluster)} görüntü: {', '.join(cluster[:5])}{' ...' if len(cluster) > 5 else ''}")
+
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump({'max_distance': max_distance, 'clusters': clusters}, f, indent=2)
+        print(f"Kümeler kaydedildi: {output_path}")
+
+    return clusters
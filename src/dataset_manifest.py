@@ -0,0 +1,235 @@
+import os
+import json
+import math
+import cv2
+import numpy as np
+import tensorflow as tf
+
+from dataset_shards import list_dataset_files
+
+def build_manifest(data_dir):
+    """
+    Veri seti manifestini yalnızca dizin listesinden (görüntüleri çözümlemeden)
+    oluşturur.
+
+    Args:
+        data_dir: Veri setinin yolu (load_data klasör düzeni)
+
+    Returns:
+        manifest: Sınıflar, sınıf başına örnek sayıları ve dosya listeleri
+    """
+    files = {}
+    for relative_path, label in list_dataset_files(data_dir):
+        files.setdefault(label, []).append(relative_path)
+
+    classes = sorted(files)
+
+    return {
+        'data_dir': os.path.abspath(data_dir),
+        'classes': classes,
+        'counts': {label: len(files[label]) for label in classes},
+        'files': files
+    }
+
+def save_manifest(manifest, path):
+    """
+    Manifesti JSON olarak kaydeder.
+    """
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+def load_manifest(path):
+    """
+    JSON manifesti yükler.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def print_manifest_statistics(manifest):
+    """
+    Sınıf başına örnek sayılarını ve dengesizlik oranını yazdırır.
+    """
+    counts = manifest['counts']
+    total = sum(counts.values())
+
+    print(f"Toplam {total} görüntü, {len(counts)} sınıf")
+    for label in manifest['classes']:
+        print(f"  {label}: {counts[label]} ({100.0 * counts[label] / max(total, 1):.1f}%)")
+
+    if counts:
+        smallest = min(counts.values())
+        largest = max(counts.values())
+        print(f"En az: {smallest}, en çok: {largest}, dengesizlik oranı: {largest / max(smallest, 1):.2f}")
+
+def manifest_samples(manifest):
+    """
+    Manifesti düz (dosya yolu, etiket kodu) dizilerine çevirir.
+    Etiket kodları LabelEncoder ile aynı sıradadır (sıralı sınıf listesi).
+
+    Returns:
+        paths: Tam dosya yolları
+        labels: Etiket kodları
+    """
+    paths = []
+    labels = []
+
+    for code, label in enumerate(manifest['classes']):
+        for relative_path in manifest['files'][label]:
+            paths.append(os.path.join(manifest['data_dir'], relative_path))
+            labels.append(code)
+
+    return np.array(paths), np.array(labels, dtype=np.int32)
+
+def split_manifest(manifest, test_size=0.2, random_state=42):
+    """
+    Manifest örneklerini preprocess_data ile aynı şekilde katmanlı olarak böler.
+
+    Returns:
+        (train_paths, train_labels), (test_paths, test_labels)
+    """
+    from sklearn.model_selection import train_test_split
+
+    paths, labels = manifest_samples(manifest)
+    train_paths, test_paths, train_labels, test_labels = train_test_split(
+        paths, labels, test_size=test_size, random_state=random_state, stratify=labels
+    )
+    return (train_paths, train_labels), (test_paths, test_labels)
+
+def class_sampling_probabilities(counts, mode='balanced'):
+    """
+    Sınıf başına örnekleme olasılıklarını hesaplar.
+
+    Args:
+        counts: Sınıf başına örnek sayıları
+        mode: 'balanced' (tüm sınıflar eşit), 'sqrt' (sayının kareköküyle orantılı)
+            veya 'natural' (veri setindeki dağılım)
+
+    Returns:
+        probabilities: Sınıf olasılıkları
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+
+    if mode == 'balanced':
+        weights = (counts > 0).astype(np.float64)
+    elif mode == 'sqrt':
+        weights = np.sqrt(counts)
+    elif mode == 'natural':
+        weights = counts
+    else:
+        raise ValueError(f"Bilinmeyen örnekleme modu: {mode}")
+
+    return weights / weights.sum()
+
+class ClassBalancedSampler:
+    """
+    Veri setini belleğe yüklemeden, sınıf dengeli veya yeniden ağırlıklandırılmış
+    batch indeksleri üretir. Önce sınıflar olasılıklara göre, sonra her sınıftan
+    rastgele örnekler seçilir.
+    """
+
+    def __init__(self, labels, mode='balanced', seed=None):
+        """
+        Args:
+            labels: Her örneğin etiket kodu
+            mode: class_sampling_probabilities ile aynı modlar
+            seed: Rastgele tohum
+        """
+        labels = np.asarray(labels)
+        self.num_classes = int(labels.max()) + 1 if len(labels) else 0
+        self.class_indices = [np.flatnonzero(labels == code) for code in range(self.num_classes)]
+        self.counts = np.array([len(indices) for indices in self.class_indices])
+        self.probabilities = class_sampling_probabilities(self.counts, mode)
+        self.rng = np.random.default_rng(seed)
+
+    def sample(self, batch_size):
+        """
+        Bir batch için örnek indeksleri (labels dizisine göre) döndürür.
+        """
+        classes = self.rng.choice(self.num_classes, size=batch_size, p=self.probabilities)
+        indices = np.empty(batch_size, dtype=np.int64)
+
+        for code in np.unique(classes):
+            mask = classes == code
+            pool = self.class_indices[code]
+            indices[mask] = pool[self.rng.integers(0, len(pool), size=int(mask.sum()))]
+
+        return indices
+
+    def get_state(self):
+        """
+        Rastgele sayı üretecinin durumunu döndürür (kontrol noktasına yazmak için).
+        """
+        return {'rng': self.rng.bit_generator.state}
+
+    def set_state(self, state):
+        """
+        get_state ile alınan durumu geri yükler.
+        """
+        self.rng.bit_generator.state = state['rng']
+
+class ManifestSequence(tf.keras.utils.Sequence):
+    """
+    Görüntüleri diskten batch batch okuyan Keras Sequence sınıfı.
+    Sampler verilirse batch'ler sınıf dengeli olarak çekilir, verilmezse
+    örnekler sırayla okunur.
+    """
+
+    def __init__(self, paths, labels, num_classes, image_size=(64, 64), batch_size=32, sampler=None,
+                 grayscale=False):
+        """
+        Args:
+            paths: Görüntü dosya yolları
+            labels: Etiket kodları
+            num_classes: Sınıf sayısı
+            image_size: Görüntü boyutu (genişlik, yükseklik)
+            batch_size: Batch boyutu
+            sampler: ClassBalancedSampler nesnesi (isteğe bağlı)
+            grayscale: Görüntüler tek kanallı gri tonlamalı okunsun mu?
+        """
+        super().__init__()
+        self.paths = np.asarray(paths)
+        self.labels = np.asarray(labels)
+        self.num_classes = num_classes
+        self.image_size = image_size
+        self.batch_size = batch_size
+        self.sampler = sampler
+        self.grayscale = grayscale
+
+    def __len__(self):
+        # Bir dönem, örnekleme yapılsa da veri seti boyutu kadar örnek içerir
+        return math.ceil(len(self.paths) / self.batch_size)
+
+    def __getitem__(self, index):
+        if self.sampler is not None:
+            batch_indices = self.sampler.sample(self.batch_size)
+        else:
+            batch_indices = np.arange(index * self.batch_size, min((index + 1) * self.batch_size, len(self.paths)))
+
+        read_flag = cv2.IMREAD_GRAYSCALE if self.grayscale else cv2.IMREAD_COLOR
+        channels = 1 if self.grayscale else 3
+        images = []
+        labels = []
+        for i in batch_indices:
+            image = cv2.imread(self.paths[i], read_flag)
+            if image is None:
+                continue
+            images.append(cv2.resize(image, self.image_size))
+            labels.append(self.labels[i])
+
+        # Normalize et (0-1 aralığına) ve etiketleri one-hot kodla
+        X = np.array(images, dtype='float32').reshape((-1, self.image_size[1], self.image_size[0], channels)) / 255.0
+        y = tf.keras.utils.to_categorical(labels, num_classes=self.num_classes)
+        return X, y
+
+    def get_state(self):
+        """
+        Örnekleyicinin rastgele durumunu döndürür (kontrol noktasına yazmak için).
+        """
+        return {'sampler': self.sampler.get_state() if self.sampler is not None else None}
+
+    def set_state(self, state):
+        """
+        get_state ile alınan durumu geri yükler.
+        """
+        if self.sampler is not None:
+            self.sampler.set_state(state['sampler'])
@@ -0,0 +1,512 @@
+import os
+import json
+import math
+import hashlib
+import cv2
+import numpy as np
+import tensorflow as tf
+
+# Manifest dosyasının adı ve biçim sürümü
+MANIFEST_FILE = 'manifest.json'
+LABELS_FILE = 'labels.npy'
+VALID_FILE = 'valid.npy'
+INDEX_FILE = 'index.json'
+MANIFEST_VERSION = 2
+
+def list_dataset_files(data_dir):
+    """
+    Veri seti klasöründeki görüntü dosyalarını (çözümlemeden) listeler.
+    load_data ile aynı klasör düzenini ve dosya uzantılarını kullanır.
+
+    Args:
+        data_dir: Veri setinin yolu
+
+    Returns:
+        files: (göreli_yol, etiket) çiftlerinden oluşan liste
+    """
+    files = []
+
+    for label in sorted(os.listdir(data_dir)):
+        label_dir = os.path.join(data_dir, label)
+
+        if os.path.isdir(label_dir):
+            for image_file in sorted(os.listdir(label_dir)):
+                if image_file.endswith('.jpeg') or image_file.endswith('.jpg'):
+                    files.append((os.path.join(label, image_file), label))
+
+    return files
+
+def _shard_file_name(shard_index):
+    """
+    Parça (shard) dosyasının adını döndürür.
+    """
+    return f"shard_{shard_index:05d}.npy"
+
+def _read_image(image_path, image_size):
+    """
+    Dosyayı bir kez okuyup hem özetini (SHA-1) hem de yeniden boyutlandırılmış
+    görüntüsünü döndürür.
+
+    Returns:
+        image: Yeniden boyutlandırılmış görüntü (okunamazsa None)
+        sha1: Dosya içeriğinin SHA-1 özeti
+    """
+    with open(image_path, 'rb') as f:
+        data = f.read()
+
+    sha1 = hashlib.sha1(data).hexdigest()
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        return None, sha1
+
+    return cv2.resize(image, image_size), sha1
+
+def _file_sha1(image_path):
+    """
+    Dosya içeriğinin SHA-1 özetini hesaplar.
+    """
+    with open(image_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _write_shards(data_dir, output_dir, files, image_size, shard_size, first_shard_index):
+    """
+    Dosyaları parça parça çözümleyip yeni parça dosyalarına yazar.
+    Okunamayan dosyalar atlanır.
+
+    Args:
+        data_dir: Veri setinin yolu
+        output_dir: Parçaların yazılacağı klasör
+        files: (göreli_yol, etiket) çiftleri
+        image_size: Görüntü boyutu (genişlik, yükseklik)
+        shard_size: Parça başına görüntü sayısı
+        first_shard_index: İlk yeni parçanın numarası
+
+    Returns:
+        shards: Yazılan parçaların manifest girdileri
+        written: Yazılan her dosya için (göreli_yol, etiket, sha1) listesi
+    """
+    shards = []
+    written = []
+
+    # Her seferde yalnızca bir parça bellekte tutulur
+    for start in range(0, len(files), shard_size):
+        batch_files = files[start:start + shard_size]
+        images = np.empty((len(batch_files), image_size[1], image_size[0], 3), dtype=np.uint8)
+        count = 0
+
+        for relative_path, label in batch_files:
+            image, sha1 = _read_image(os.path.join(data_dir, relative_path), image_size)
+            if image is None:
+                continue
+
+            images[count] = image
+            written.append((relative_path, label, sha1))
+            count += 1
+
+        if count == 0:
+            continue
+
+        shard_name = _shard_file_name(first_shard_index + len(shards))
+        np.save(os.path.join(output_dir, shard_name), images[:count])
+        shards.append({'file': shard_name, 'count': count})
+
+        print(f"Parça yazıldı: {shard_name} ({count} görüntü)")
+
+    return shards, written
+
+def _save_dataset_state(output_dir, manifest, labels, valid, index):
+    """
+    Etiketleri, geçerlilik maskesini, dosya indeksini ve manifesti yazar.
+    Manifest en son yazılır; böylece yarıda kalan bir güncelleme eski durumu bozmaz.
+    """
+    np.save(os.path.join(output_dir, LABELS_FILE), np.asarray(labels, dtype=np.int32))
+    np.save(os.path.join(output_dir, VALID_FILE), np.asarray(valid, dtype=bool))
+
+    with open(os.path.join(output_dir, INDEX_FILE), 'w') as f:
+        json.dump(index, f)
+
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+def build_sharded_dataset(data_dir, output_dir, image_size=(64, 64), shard_size=4096):
+    """
+    load_data klasör düzenindeki veri setini sabit boyutlu uint8 parçalara
+    (shard) ve bir etiket/indeks manifest dosyasına dönüştürür.
+
+    Parçalar .npy olarak yazılır, böylece eğitim sırasında np.load(mmap_mode='r')
+    ile belleğe eşlenebilir ve JPEG çözümlemesi tekrar yapılmaz.
+
+    Args:
+        data_dir: Veri setinin yolu
+        output_dir: Parçaların yazılacağı klasör
+        image_size: Görüntü boyutu (genişlik, yükseklik)
+        shard_size: Parça başına görüntü sayısı
+
+    Returns:
+        manifest: Oluşturulan manifest sözlüğü
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Eski bir derlemeden kalan parçaları temizle
+    for file_name in os.listdir(output_dir):
+        if file_name.startswith('shard_') and file_name.endswith('.npy'):
+            os.remove(os.path.join(output_dir, file_name))
+
+    files = list_dataset_files(data_dir)
+    classes = sorted(set(label for _, label in files))
+    class_index = {label: i for i, label in enumerate(classes)}
+
+    shards, written = _write_shards(data_dir, output_dir, files, image_size, shard_size, 0)
+
+    samples = []
+    labels = []
+    index = {}
+
+    for sample_index, (relative_path, label, sha1) in enumerate(written):
+        stat = os.stat(os.path.join(data_dir, relative_path))
+        samples.append(relative_path)
+        labels.append(class_index[label])
+        index[relative_path] = {
+            'sha1': sha1,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'label': label,
+            'index': sample_index
+        }
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'data_dir': os.path.abspath(data_dir),
+        'image_size': list(image_size),
+        'shard_size': shard_size,
+        'classes': classes,
+        'num_samples': len(samples),
+        'shards': shards,
+        'samples': samples
+    }
+
+    _save_dataset_state(output_dir, manifest, labels, np.ones(len(samples), dtype=bool), index)
+
+    print(f"Toplam {len(samples)} görüntü {len(shards)} parçaya yazıldı: {output_dir}")
+
+    return manifest
+
+def update_sharded_dataset(data_dir, output_dir, image_size=(64, 64), shard_size=4096):
+    """
+    Parçalı veri setini artımlı olarak günceller. Dosya indeksindeki boyut ve
+    değiştirilme zamanı (mtime) ile karşılaştırma yapılır; yalnızca bunlar
+    değişen dosyaların özeti hesaplanır ve yalnızca eklenen/değişen dosyalar
+    çözümlenip yeni parçalara eklenir. Silinen veya değişen dosyaların eski
+    kayıtları geçerlilik maskesinde işaretlenir.
+
+    Parçalı veri seti yoksa ya da farklı bir görüntü boyutuyla oluşturulmuşsa
+    tam derleme yapılır.
+
+    Args:
+        data_dir: Veri setinin yolu
+        output_dir: Parçalı veri seti klasörü
+        image_size: Görüntü boyutu (genişlik, yükseklik)
+        shard_size: Yeni parçalar için parça başına görüntü sayısı
+
+    Returns:
+        report: Eklenen, silinen ve değişen dosyaların listeleri
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    index_path = os.path.join(output_dir, INDEX_FILE)
+
+    if not os.path.exists(manifest_path) or not os.path.exists(index_path):
+        print("Mevcut parçalı veri seti bulunamadı, tam derleme yapılıyor...")
+        manifest = build_sharded_dataset(data_dir, output_dir, image_size, shard_size)
+        return {'added': list(manifest['samples']), 'removed': [], 'changed': [], 'rebuilt': True}
+
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != MANIFEST_VERSION or tuple(manifest['image_size']) != tuple(image_size):
+        print("Parçalı veri seti farklı bir sürüm veya görüntü boyutuyla oluşturulmuş, tam derleme yapılıyor...")
+        manifest = build_sharded_dataset(data_dir, output_dir, image_size, shard_size)
+        return {'added': list(manifest['samples']), 'removed': [], 'changed': [], 'rebuilt': True}
+
+    with open(index_path, 'r') as f:
+        index = json.load(f)
+
+    labels = list(np.load(os.path.join(output_dir, LABELS_FILE)))
+    valid = list(np.load(os.path.join(output_dir, VALID_FILE)))
+    label_names = [manifest['classes'][code] for code in labels]
+
+    # Dizini tara ve indeksle karşılaştır
+    current_files = list_dataset_files(data_dir)
+    current_paths = set(relative_path for relative_path, _ in current_files)
+
+    added = []
+    changed = []
+    to_decode = []
+
+    for relative_path, label in current_files:
+        entry = index.get(relative_path)
+        if entry is None:
+            added.append(relative_path)
+            to_decode.append((relative_path, label))
+            continue
+
+        stat = os.stat(os.path.join(data_dir, relative_path))
+        if stat.st_mtime == entry['mtime'] and stat.st_size == entry['size'] and label == entry['label']:
+            continue
+
+        # Yalnızca zaman damgası değiştiyse içerik özeti aynı kalır
+        if label == entry['label'] and _file_sha1(os.path.join(data_dir, relative_path)) == entry['sha1']:
+            entry['mtime'] = stat.st_mtime
+            entry['size'] = stat.st_size
+            continue
+
+        changed.append(relative_path)
+        to_decode.append((relative_path, label))
+
+    removed = [relative_path for relative_path in index if relative_path not in current_paths]
+
+    # Silinen ve değişen dosyaların eski kayıtlarını geçersiz kıl
+    for relative_path in removed + changed:
+        valid[index.pop(relative_path)['index']] = False
+
+    # Yalnızca farkı çözümle ve yeni parçalara ekle
+    new_shards, written = _write_shards(
+        data_dir, output_dir, to_decode, image_size, shard_size, len(manifest['shards'])
+    )
+    manifest['shards'].extend(new_shards)
+
+    for relative_path, label, sha1 in written:
+        stat = os.stat(os.path.join(data_dir, relative_path))
+        index[relative_path] = {
+            'sha1': sha1,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'label': label,
+            'index': len(labels)
+        }
+        manifest['samples'].append(relative_path)
+        label_names.append(label)
+        labels.append(-1)
+        valid.append(True)
+
+    # Sınıf listesini geçerli örneklerden yeniden oluştur (LabelEncoder ile aynı sıra)
+    classes = sorted(set(name for name, is_valid in zip(label_names, valid) if is_valid))
+    class_index = {label: i for i, label in enumerate(classes)}
+    labels = [class_index.get(name, -1) for name in label_names]
+    if classes != manifest['classes']:
+        print(f"Sınıf listesi güncellendi: {len(manifest['classes'])} -> {len(classes)} sınıf")
+    manifest['classes'] = classes
+    manifest['num_samples'] = len(labels)
+
+    _save_dataset_state(output_dir, manifest, labels, valid, index)
+
+    report = {'added': added, 'removed': removed, 'changed': changed, 'rebuilt': False}
+
+    print(f"Eklenen: {len(added)}, silinen: {len(removed)}, değişen: {len(changed)} dosya")
+    print(f"Geçerli örnek sayısı: {int(np.sum(valid))} / {len(valid)}")
+
+    return report
+
+class ShardedDataset:
+    """
+    Belleğe eşlenmiş (memory-mapped) parçalardan rastgele erişimli görüntü okuyucu.
+    Sıcak veri kümesi işletim sisteminin sayfa önbelleğinden sunulur.
+    """
+
+    def __init__(self, dataset_dir):
+        """
+        Args:
+            dataset_dir: build_sharded_dataset ile oluşturulan klasör
+        """
+        self.dataset_dir = dataset_dir
+
+        with open(os.path.join(dataset_dir, MANIFEST_FILE), 'r') as f:
+            self.manifest = json.load(f)
+
+        self.classes = self.manifest['classes']
+        self.image_size = tuple(self.manifest['image_size'])
+        self.labels = np.load(os.path.join(dataset_dir, LABELS_FILE))
+
+        # Artımlı güncellemede silinen/değişen örnekler geçersiz işaretlenir
+        valid_path = os.path.join(dataset_dir, VALID_FILE)
+        if os.path.exists(valid_path):
+            self.valid = np.load(valid_path)
+        else:
+            self.valid = np.ones(len(self.labels), dtype=bool)
+
+        # Parçaları salt okunur olarak belleğe eşle
+        self.shards = [np.load(os.path.join(dataset_dir, shard['file']), mmap_mode='r')
+                       for shard in self.manifest['shards']]
+
+        # Genel indeksi (parça, parça içi sıra) çiftine çevirmek için sınırlar
+        counts = [shard['count'] for shard in self.manifest['shards']]
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def valid_indices(self):
+        """
+        Geçerli (silinmemiş) örneklerin genel indekslerini döndürür.
+        """
+        return np.flatnonzero(self.valid)
+
+    @property
+    def num_classes(self):
+        return len(self.classes)
+
+    @property
+    def image_shape(self):
+        return self.shards[0].shape[1:] if self.shards else (self.image_size[1], self.image_size[0], 3)
+
+    def get_images(self, indices):
+        """
+        Verilen genel indekslerdeki görüntüleri uint8 olarak döndürür.
+
+        Args:
+            indices: Genel örnek indeksleri
+
+        Returns:
+            images: uint8 görüntü dizisi (len(indices), H, W, C)
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        images = np.empty((len(indices),) + tuple(self.image_shape), dtype=np.uint8)
+
+        shard_ids = np.searchsorted(self.offsets, indices, side='right') - 1
+
+        # Her parçadan tek bir gelişmiş indeksleme ile oku
+        for shard_id in np.unique(shard_ids):
+            mask = shard_ids == shard_id
+            local = indices[mask] - self.offsets[shard_id]
+            order = np.argsort(local)
+            positions = np.flatnonzero(mask)[order]
+            images[positions] = self.shards[shard_id][local[order]]
+
+        return images
+
+    def label_encoder(self):
+        """
+        Manifest sınıflarından eğitimdekiyle aynı sırada bir LabelEncoder oluşturur.
+        """
+        from sklearn.preprocessing import LabelEncoder
+
+        label_encoder = LabelEncoder()
+        label_encoder.fit(self.classes)
+        return label_encoder
+
+class ShardedSequence(tf.keras.utils.Sequence):
+    """
+    ShardedDataset üzerinden karıştırmalı batch üreten Keras Sequence sınıfı.
+    """
+
+    def __init__(self, dataset, indices, batch_size=32, shuffle=True, seed=None, sampler=None,
+                 image_size=None, augment=False):
+        """
+        Args:
+            dataset: ShardedDataset nesnesi
+            indices: Bu Sequence'ın kullanacağı genel örnek indeksleri
+            batch_size: Batch boyutu
+            shuffle: Her dönem sonunda sıralama karıştırılsın mı?
+            seed: Karıştırma için rastgele tohum
+            sampler: dataset.labels[indices] üzerine kurulmuş ClassBalancedSampler
+                (verilirse batch'ler sınıf dengeli çekilir ve karıştırma yapılmaz)
+            image_size: Görüntülerin yeniden boyutlandırılacağı boyut (genişlik, yükseklik);
+                None ise parçalardaki boyut kullanılır
+            augment: Her örneğe rastgele çevirme, döndürme veya gürültü uygulansın mı?
+                (augment_data ile aynı dönüşümler, veri seti büyütülmeden)
+        """
+        super().__init__()
+        self.dataset = dataset
+        self.base_indices = np.array(indices, dtype=np.int64)
+        self.indices = self.base_indices
+        self.batch_size = batch_size
+        self.sampler = sampler
+        self.shuffle = shuffle and sampler is None
+        self.rng = np.random.default_rng(seed)
+        self.augment = augment
+
+        stored_size = (dataset.image_shape[1], dataset.image_shape[0])
+        self.image_size = tuple(image_size) if image_size and tuple(image_size) != stored_size else None
+
+        if self.shuffle:
+            self.indices = self.rng.permutation(self.base_indices)
+
+    def __len__(self):
+        return math.ceil(len(self.indices) / self.batch_size)
+
+    def __getitem__(self, index):
+        if self.sampler is not None:
+            batch_indices = self.indices[self.sampler.sample(self.batch_size)]
+        else:
+            batch_indices = self.indices[index * self.batch_size:(index + 1) * self.batch_size]
+
+        images = self.dataset.get_images(batch_indices)
+        if self.image_size is not None:
+            images = np.array([cv2.resize(image, self.image_size) for image in images])
+
+        # Normalize et (0-1 aralığına) ve etiketleri one-hot kodla
+        X = images.astype('float32') / 255.0
+        if self.augment:
+            X = self._augment(X)
+        y = tf.keras.utils.to_categorical(self.dataset.labels[batch_indices],
+                                          num_classes=self.dataset.num_classes)
+        return X, y
+
+    def _augment(self, images):
+        """
+        Her görüntüye rastgele olarak hiçbir şey, yatay çevirme, 15 derece döndürme
+        veya gürültü uygular.
+        """
+        choices = self.rng.integers(0, 4, size=len(images))
+        rows, cols = images.shape[1:3]
+        rotation_matrix = cv2.getRotationMatrix2D((cols / 2, rows / 2), 15, 1)
+
+        for i, choice in enumerate(choices):
+            if choice == 1:
+                images[i] = cv2.flip(images[i], 1).reshape(images[i].shape)
+            elif choice == 2:
+                images[i] = cv2.warpAffine(images[i], rotation_matrix, (cols, rows)).reshape(images[i].shape)
+            elif choice == 3:
+                images[i] = np.clip(images[i] + self.rng.normal(0, 0.05, images[i].shape), 0, 1)
+
+        return images
+
+    def on_epoch_end(self):
+        # Sıra önceki dönemin sırasından değil yalnızca üreteç durumundan türetilir;
+        # böylece devam ederken sıralamayı saklamak gerekmez
+        if self.shuffle:
+            self.indices = self.rng.permutation(self.base_indices)
+
+    def get_state(self):
+        """
+        Rastgele sayı üreteçlerinin durumunu döndürür (kontrol noktasına yazmak için).
+        """
+        return {
+            'rng': self.rng.bit_generator.state,
+            'sampler': self.sampler.get_state() if self.sampler is not None else None
+        }
+
+    def set_state(self, state):
+        """
+        Bir dönem sonunda get_state ile alınan durumu geri yükler ve sonraki
+        dönemin sıralamasını kesintisiz eğitimdeki gibi hazırlar.
+        """
+        self.rng.bit_generator.state = state['rng']
+        if self.sampler is not None:
+            self.sampler.set_state(state['sampler'])
+        self.on_epoch_end()
+
+def split_sharded_dataset(dataset, test_size=0.2, random_state=42):
+    """
+    Parçalı veri setini preprocess_data ile aynı şekilde katmanlı olarak böler.
+    Yalnızca etiketler kullanılır, görüntüler okunmaz.
+
+    Returns:
+        train_indices, test_indices: Eğitim ve test örnek indeksleri
+    """
+    from sklearn.model_selection import train_test_split
+
+    all_indices = dataset.valid_indices()
+    train_indices, test_indices = train_test_split(
+        all_indices, test_size=test_size, random_state=random_state, stratify=dataset.labels[all_indices]
+    )
+    return train_indices, test_indices
@@ -0,0 +1,135 @@
+import tensorflow as tf
+from tensorflow.keras.optimizers import Adam
+from tensorflow.keras.utils import to_categorical
+
+from model import _create_callbacks
+
+def soften_probabilities(probabilities, temperature):
+    """
+    Softmax çıktısını sıcaklıkla yumuşatır. Modeller logit yerine olasılık
+    döndürdüğü için log(p) / T, softmax(logit / T) ile aynı dağılımı verir.
+
+    Args:
+        probabilities: Modelin softmax çıktısı
+        temperature: Sıcaklık (1'den büyük değerler dağılımı yumuşatır)
+
+    Returns:
+        softened: Yumuşatılmış olasılıklar
+    """
+    return tf.nn.softmax(tf.math.log(probabilities + 1e-7) / temperature)
+
+class Distiller(tf.keras.Model):
+    """
+    Öğretmen modelin yumuşak hedefleriyle küçük bir öğrenci modeli eğiten sarmalayıcı.
+    Kayıp, gerçek etiketlerle çapraz entropi ve yumuşatılmış dağılımlar arasındaki
+    KL ıraksamasının ağırlıklı toplamıdır. Kaydetme öğrenci model üzerinden yapılır.
+    """
+
+    def __init__(self, teacher, student, temperature=4.0, alpha=0.1, **kwargs):
+        """
+        Args:
+            teacher: Eğitilmiş öğretmen model (ağırlıkları dondurulur)
+            student: Eğitilecek öğrenci model
+            temperature: Yumuşak hedefler için sıcaklık
+            alpha: Gerçek etiket kaybının ağırlığı (kalanı damıtma kaybı)
+        """
+        super().__init__(**kwargs)
+        self.teacher = teacher
+        self.student = student
+        self.temperature = temperature
+        self.alpha = alpha
+        self.teacher.trainable = False
+
+        self.student_loss_fn = tf.keras.losses.CategoricalCrossentropy()
+        self.distillation_loss_fn = tf.keras.losses.KLDivergence()
+        self.loss_tracker = tf.keras.metrics.Mean(name='loss')
+        self.student_loss_tracker = tf.keras.metrics.Mean(name='student_loss')
+        self.distillation_loss_tracker = tf.keras.metrics.Mean(name='distillation_loss')
+        self.accuracy = tf.keras.metrics.CategoricalAccuracy(name='accuracy')
+
+    @property
+    def metrics(self):
+        # Dönem başında sıfırlanacak metrikler
+        return [self.loss_tracker, self.student_loss_tracker, self.distillation_loss_tracker, self.accuracy]
+
+    def call(self, inputs, training=None):
+        return self.student(inputs, training=training)
+
+    def _distillation_losses(self, y, teacher_predictions, student_predictions):
+        student_loss = self.student_loss_fn(y, student_predictions)
+        # T^2 ile ölçekleme, yumuşak hedef gradyanlarını sıcaklıktan bağımsız tutar
+        distillation_loss = self.distillation_loss_fn(
+            soften_probabilities(teacher_predictions, self.temperature),
+            soften_probabilities(student_predictions, self.temperature)
+        ) * (self.temperature ** 2)
+        loss = self.alpha * student_loss + (1.0 - self.alpha) * distillation_loss
+        return loss, student_loss, distillation_loss
+
+    def _update_metrics(self, y, student_predictions, loss, student_loss, distillation_loss):
+        self.loss_tracker.update_state(loss)
+        self.student_loss_tracker.update_state(student_loss)
+        self.distillation_loss_tracker.update_state(distillation_loss)
+        self.accuracy.update_state(y, student_predictions)
+        return {metric.name: metric.result() for metric in self.metrics}
+
+    def train_step(self, data):
+        x, y = data
+        teacher_predictions = self.teacher(x, training=False)
+
+        with tf.GradientTape() as tape:
+            student_predictions = self.student(x, training=True)
+            loss, student_loss, distillation_loss = self._distillation_losses(y, teacher_predictions, student_predictions)
+
+        gradients = tape.gradient(loss, self.student.trainable_variables)
+        self.optimizer.apply_gradients(zip(gradients, self.student.trainable_variables))
+
+        return self._update_metrics(y, student_predictions, loss, student_loss, distillation_loss)
+
+    def test_step(self, data):
+        x, y = data
+        teacher_predictions = self.teacher(x, training=False)
+        student_predictions = self.student(x, training=False)
+        loss, student_loss, distillation_loss = self._distillation_losses(y, teacher_predictions, student_predictions)
+
+        return self._update_metrics(y, student_predictions, loss, student_loss, distillation_loss)
+
+    def save(self, *args, **kwargs):
+        # Kontrol noktaları yalnızca düz öğrenci modeli kaydeder (ASLPredictor ile yüklenebilir)
+        return self.student.save(*args, **kwargs)
+
+def distill_model(teacher, student, X_train, y_train, X_test, y_test, temperature=4.0, alpha=0.1,
+                  batch_size=32, epochs=30, model_save_path='models/asl_student.h5'):
+    """
+    Öğrenci modeli öğretmen modelden damıtarak eğitir.
+
+    Args:
+        teacher: Eğitilmiş öğretmen model
+        student: create_model ile oluşturulmuş öğrenci model
+        X_train, y_train: Eğitim verileri
+        X_test, y_test: Test verileri
+        temperature: Yumuşak hedefler için sıcaklık
+        alpha: Gerçek etiket kaybının ağırlığı
+        batch_size: Batch boyutu
+        epochs: Eğitim dönem sayısı
+        model_save_path: Öğrenci modelin kaydedileceği yol
+
+    Returns:
+        history: Eğitim geçmişi
+        student: Eğitilmiş öğrenci model
+    """
+    num_classes = teacher.output_shape[-1]
+    y_train_categorical = to_categorical(y_train, num_classes=num_classes)
+    y_test_categorical = to_categorical(y_test, num_classes=num_classes)
+
+    distiller = Distiller(teacher, student, temperature=temperature, alpha=alpha)
+    distiller.compile(optimizer=Adam(learning_rate=0.001))
+
+    history = distiller.fit(
+        X_train, y_train_categorical,
+        batch_size=batch_size,
+        epochs=epochs,
+        validation_data=(X_test, y_test_categorical),
+        callbacks=_create_callbacks(model_save_path)
+    )
+
+    return history, student
@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import numpy as np
+import cv2
+from sklearn.metrics import confusion_matrix, precision_recall_fscore_support
+
+from cross_validation import plot_confusion_matrix
+
+def stream_image_batches(paths, labels, batch_size=64):
+    """
+    Görüntüleri diskten batch batch ve ham halleriyle (yeniden boyutlandırmadan)
+    okur; ön işleme tahmin edicide üretimdeki gibi yapılır.
+
+    Yields:
+        images: BGR görüntü listesi
+        labels: Okunabilen görüntülerin etiket kodları
+        read_seconds: Batch'in diskten okunma süresi
+    """
+    for start in range(0, len(paths), batch_size):
+        read_start = time.perf_counter()
+        images = []
+        batch_labels = []
+        for path, label in zip(paths[start:start + batch_size], labels[start:start + batch_size]):
+            image = cv2.imread(path)
+            if image is None:
+                print(f"Uyarı: Görüntü okunamadı: {path}")
+                continue
+            images.append(image)
+            batch_labels.append(label)
+
+        if images:
+            yield images, np.array(batch_labels), time.perf_counter() - read_start
+
+def classification_report(y_true, y_pred, classes):
+    """
+    Doğruluk, sınıf başına kesinlik/duyarlılık/F1 ve karışıklık matrisini hesaplar.
+    """
+    labels = list(range(len(classes)))
+    precision, recall, f1, support = precision_recall_fscore_support(y_true, y_pred, labels=labels, zero_division=0)
+
+    return {
+        'accuracy': float(np.mean(y_true == y_pred)) if len(y_true) else 0.0,
+        'per_class': {
+            label: {
+                'precision': float(precision[code]),
+                'recall': float(recall[code]),
+                'f1': float(f1[code]),
+                'support': int(support[code])
+            }
+            for code, label in enumerate(classes)
+        },
+        'confusion_matrix': confusion_matrix(y_true, y_pred, labels=labels).tolist()
+    }
+
+def print_evaluation_report(report, classes):
+    """
+    Ham (argmax) ve son işlenmiş tahminlerin sınıf başına karşılaştırmasını yazdırır.
+    """
+    raw, final = report['raw'], report['postprocessed']
+    print(f"\nDoğruluk: ham {raw['accuracy']:.4f}, son işlenmiş {final['accuracy']:.4f}")
+    print(f"Verim: {report['throughput_per_sec']:.1f} görüntü/sn "
+          f"(batch p50 {report['batch_latency_ms_p50']:.1f} ms, okuma {report['read_seconds']:.2f} sn)")
+
+    print(f"\n{'Sınıf':>8} {'Kesinlik':>17} {'Duyarlılık':>17} {'F1':>17} {'Örnek':>7}")
+    print(f"{'':>8} {'ham':>8} {'son':>8} {'ham':>8} {'son':>8} {'ham':>8} {'son':>8}")
+    for label in classes:
+        r, f = raw['per_class'][label], final['per_class'][label]
+        marker = ''
+        if f['f1'] > r['f1']:
+            marker = '  +'
+        elif f['f1'] < r['f1']:
+            marker = '  -'
+        print(f"{label:>8} {r['precision']:8.3f} {f['precision']:8.3f} {r['recall']:8.3f} {f['recall']:8.3f} "
+              f"{r['f1']:8.3f} {f['f1']:8.3f} {r['support']:7}{marker}")
+    print("(+/-: son işleme F1'i artırıyor/azaltıyor)")
+
+def evaluate_predictor(predictor, paths, label_names, batch_size=64, output_dir=None):
+    """
+    Test setini diskten akışla okuyarak ASLPredictor'ı üretimdeki tam son
+    işlemeyle (sınıf ağırlıkları, eşikler, 'b' düzeltmesi) değerlendirir ve
+    ham argmax tahminleriyle karşılaştırır.
+
+    Args:
+        predictor: ASLPredictor nesnesi
+        paths: Görüntü dosya yolları
+        label_names: Gerçek sınıf adları
+        batch_size: Batch boyutu
+        output_dir: Verilirse evaluation.json ve karışıklık matrisi buraya yazılır
+
+    Returns:
+        report: Ham ve son işlenmiş sınıflandırma raporları ile verim ölçümleri
+    """
+    classes = [str(name) for name in predictor.class_names]
+    codes = {name: code for code, name in enumerate(classes)}
+
+    # Tahmin edicinin bilmediği sınıflar değerlendirilemez
+    unknown = sorted(set(label_names) - set(codes))
+    if unknown:
+        print(f"Uyarı: Modelde olmayan sınıflar atlanıyor: {', '.join(unknown)}")
+    known = np.array([name in codes for name in label_names], dtype=bool)
+    paths = np.asarray(paths)[known]
+    labels = np.array([codes[name] for name in np.asarray(label_names)[known]], dtype=np.int64)
+
+    y_true, y_raw, y_final = [], [], []
+    batch_latencies = []
+    read_seconds = 0.0
+
+    for images, batch_labels, read_time in stream_image_batches(paths, labels, batch_size):
+        read_seconds += read_time
+
+        start = time.perf_counter()
+        predicted_indices, _, predictions = predictor.predict_batch(images)
+        batch_latencies.append(time.perf_counter() - start)
+
+        y_true.append(batch_labels)
+        y_raw.append(np.argmax(predictions, axis=1))
+        y_final.append(predicted_indices)
+
+        print(f"\r{sum(len(batch) for batch in y_true)}/{len(paths)} görüntü", end='', flush=True)
+    print()
+
+    y_true = np.concatenate(y_true) if y_true else np.array([], dtype=np.int64)
+    y_raw = np.concatenate(y_raw) if y_raw else np.array([], dtype=np.int64)
+    y_final = np.concatenate(y_final) if y_final else np.array([], dtype=np.int64)
+
+    report = {
+        'samples': int(len(y_true)),
+        'batch_size': batch_size,
+        # Süreler ön işleme, model ve son işlemeyi kapsar; disk okuması ayrı verilir
+        'throughput_per_sec': float(len(y_true) / max(sum(batch_latencies), 1e-9)),
+        'batch_latency_ms_p50': float(np.percentile(batch_latencies, 50) * 1000.0) if batch_latencies else 0.0,
+        'read_seconds': read_seconds,
+        'class_weights': {str(name): float(weight) for name, weight in predictor.class_weights.items()},
+        'class_thresholds': {str(name): float(threshold) for name, threshold in predictor.class_thresholds.items()},
+        'raw': classification_report(y_true, y_raw, classes),
+        'postprocessed': classification_report(y_true, y_final, classes),
+        # Son işlemenin tahmini değiştirdiği örnekler
+        'changed_predictions': int(np.sum(y_raw != y_final))
+    }
+    print_evaluation_report(report, classes)
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        report_path = os.path.join(output_dir, 'evaluation.json')
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        plot_confusion_matrix(report['postprocessed']['confusion_matrix'], classes,
+                              os.path.join(output_dir, 'evaluation_confusion_matrix.png'),
+                              title='Karışıklık Matrisi (son işlenmiş)')
+        print(f"Değerlendirme raporu kaydedildi: {report_path}")
+
+    return report
@@ -40,7 +40,17 @@ class GestureActions:
             "gun": self.action_gun,
             "count_one": self.action_count_one,
             "count_two": self.action_count_two,
-            "phone": self.action_phone
+            "phone": self.action_phone,
+            # Hareketli el hareketleri (MotionGestureRecognizer)
+            "swipe_left": self.action_swipe_left,
+            "swipe_right": self.action_swipe_right,
+            "wave": self.action_wave,
+            "circle": self.action_circle,
+            "pinch_drag": self.action_pinch_drag,
+            # İki elle yapılan hareketler
+            "frame": self.action_frame,
+            "clap": self.action_clap,
+            "timeout": self.action_timeout
         }
         
         # Eylem açıklamaları - Türkçe karakter sorunları için özel karakterleri değiştir
@@ -58,7 +68,15 @@ class GestureActions:
             "gun": "Silah isareti 👉",
             "count_one": "Bir 1️⃣",
             "count_two": "Iki 2️⃣",
-            "phone": "Telefon acildi ☎️"
+            "phone": "Telefon acildi ☎️",
+            "swipe_left": "Onceki ⬅️",
+            "swipe_right": "Sonraki ➡️",
+            "wave": "Gorusuruz! 👋",
+            "circle": "Yenilendi 🔄",
+            "pinch_drag": "Suruklendi ✋",
+            "frame": "Ekran goruntusu alindi 🖼️",
+            "clap": "Alkis! 👏",
+            "timeout": "Mola verildi ⏸️"
         }
         
         # Eylem geçmişi
@@ -147,6 +165,24 @@ class GestureActions:
         """
         return self.action_history
     
+    def register_action(self, gesture_name, action=None, description=None):
+        """
+        Koda dokunmadan yeni bir hareket (ör. kullanıcının kaydettiği özel hareket) için eylem kaydeder.
+        
+        Args:
+            gesture_name: Hareketin adı
+            action: confidence alan eylem fonksiyonu (verilmezse mesaj yazılır ve
+                    varsa <gesture_name>.wav çalınır)
+            description: Eylemin açıklaması
+        """
+        if action is None:
+            def action(confidence):
+                print(f"✨ {gesture_name} (Guven: {confidence:.2f})")
+                self._play_sound(f"{gesture_name}.wav")
+        
+        self.actions[gesture_name] = action
+        self.action_descriptions[gesture_name] = description or f"{gesture_name} ✨"
+    
     def action_thumbs_up(self, confidence):
         """
         Başparmak yukarı eylemini gerçekleştirir.
@@ -245,6 +281,62 @@ class GestureActions:
         print(f"Telefon acildi ☎️ (Guven: {confidence:.2f})")
         self._play_sound("phone.wav")
     
+    def action_swipe_left(self, confidence):
+        """
+        Sola kaydırma eylemini gerçekleştirir.
+        """
+        print(f"⬅️ Onceki (Guven: {confidence:.2f})")
+        self._play_sound("swipe_left.wav")
+    
+    def action_swipe_right(self, confidence):
+        """
+        Sağa kaydırma eylemini gerçekleştirir.
+        """
+        print(f"➡️ Sonraki (Guven: {confidence:.2f})")
+        self._play_sound("swipe_right.wav")
+    
+    def action_wave(self, confidence):
+        """
+        El sallama eylemini gerçekleştirir.
+        """
+        print(f"👋 Gorusuruz! (Guven: {confidence:.2f})")
+        self._play_sound("wave.wav")
+    
+    def action_circle(self, confidence):
+        """
+        Daire çizme eylemini gerçekleştirir.
+        """
+        print(f"🔄 Yenilendi (Guven: {confidence:.2f})")
+        self._play_sound("circle.wav")
+    
+    def action_pinch_drag(self, confidence):
+        """
+        Tutup sürükleme eylemini gerçekleştirir.
+        """
+        print(f"✋ Suruklendi (Guven: {confidence:.2f})")
+        self._play_sound("pinch_drag.wav")
+    
+    def action_frame(self, confidence):
+        """
+        İki elle çerçeve eylemini gerçekleştirir.
+        """
+        print(f"🖼️ Ekran goruntusu alindi (Guven: {confidence:.2f})")
+        self._play_sound("frame.wav")
+    
+    def action_clap(self, confidence):
+        """
+        Alkış eylemini gerçekleştirir.
+        """
+        print(f"👏 Alkis! (Guven: {confidence:.2f})")
+        self._play_sound("clap.wav")
+    
+    def action_timeout(self, confidence):
+        """
+        İki elle T (mola) eylemini gerçekleştirir.
+        """
+        print(f"⏸️ Mola verildi (Guven: {confidence:.2f})")
+        self._play_sound("timeout.wav")
+    
     def _play_sound(self, sound_file):
         """
         Belirtilen ses dosyasını çalar.
@@ -8,8 +8,12 @@ import time
 import argparse
 import locale
 import os
-from gesture_recognizer import GestureRecognizer
+from gesture_recognizer import GestureRecognizer, LandmarkFrame, print_profile_report
 from gesture_actions import GestureActions
+from motion_gestures import MotionGestureRecognizer
+from custom_gestures import CustomGestureStore, DEFAULT_STORE_PATH
+from hand_tracker import HandTracker
+from landmark_filter import OneEuroFilter
 
 def main():
     """
@@ -44,6 +48,12 @@ def main():
     parser.add_argument('--simple-ui', action='store_true', help='Basit kullanıcı arayüzü kullan')
     parser.add_argument('--dark-mode', action='store_true', help='Koyu tema kullan')
     parser.add_argument('--single-hand', action='store_true', help='Sadece tek el algılama modu')
+    parser.add_argument('--no-motion', action='store_true', help='Hareketli el hareketlerini (kaydırma, sallama vb.) devre dışı bırak')
+    parser.add_argument('--no-smoothing', action='store_true', help='Landmark titreşim filtresini (One-Euro) devre dışı bırak')
+    parser.add_argument('--profile', action='store_true', help='Kural değerlendirme sayaçlarını tut ve çıkışta raporla')
+    parser.add_argument('--record', type=str, default=None, help="'r' tuşuyla kaydedilecek özel hareketin adı")
+    parser.add_argument('--record-seconds', type=float, default=3.0, help='Özel hareket kayıt süresi (saniye)')
+    parser.add_argument('--custom-gestures', type=str, default=DEFAULT_STORE_PATH, help='Özel hareketlerin saklandığı dosya')
     args = parser.parse_args()
     
     # Varsayılan olarak basit UI ve koyu tema kullan
@@ -84,11 +94,24 @@ def main():
     mp_drawing_styles = mp.solutions.drawing_styles
     
     # El hareket tanıyıcıyı başlat
-    gesture_recognizer = GestureRecognizer()
+    gesture_recognizer = GestureRecognizer(profile=args.profile)
+    
+    # Hareketli el hareketleri için zamansal tanıyıcı
+    motion_recognizer = None if args.no_motion else MotionGestureRecognizer()
+    gesture_names = dict(gesture_recognizer.GESTURES)
+    if motion_recognizer:
+        gesture_names.update(motion_recognizer.GESTURES)
+    
+    # Kullanıcının kaydettiği özel hareketler (KD-ağacı indeksi ilk sorguda yüklenir)
+    custom_store = CustomGestureStore(args.custom_gestures)
+    for name in custom_store.names:
+        gesture_names[name] = name
     
     # Eylemleri başlat (eğer devre dışı bırakılmadıysa)
     if not args.no_actions:
         gesture_actions = GestureActions()
+        for name in custom_store.names:
+            gesture_actions.register_action(name)
         print("Eylemler etkinleştirildi.")
     else:
         gesture_actions = None
@@ -117,20 +140,25 @@ def main():
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
     cv2.resizeWindow(window_name, actual_width, actual_height)
     
-    # Tanınan son hareketi sakla
-    current_gesture = None
-    current_confidence = 0
+    # Elleri kareler arasında izler; her elin hareketi ancak birkaç kare
+    # tutarlı görülünce onaylanır ve eylemler yalnızca onaylı geçişlerde tetiklenir
+    hand_tracker = HandTracker()
     
-    # Kalp tespiti için değişkenler
-    left_hand_landmarks = None
-    right_hand_landmarks = None
-    heart_detected = False
+    # Karedeki ellerin landmark noktaları için yeniden kullanılan dizi
+    landmark_frame = LandmarkFrame(max_hands)
+    
+    # Landmark titreşimini iz başına yumuşatan filtre (eşik yakınındaki hareketlerin titremesini önler)
+    landmark_filter = None if args.no_smoothing else OneEuroFilter()
     
     # Son eylem bilgisi
     last_action_text = ""
     last_action_time = 0
     action_display_duration = 3.0  # saniye
     
+    # Özel hareket kaydı ('r' tuşu ile başlar)
+    recorded_frames = None
+    record_start_time = 0
+    
     # Basit kullanıcı arayüzü için font ve renkler
     # Türkçe karakter sorunları için FONT_HERSHEY_SIMPLEX yerine FONT_HERSHEY_COMPLEX kullanılabilir
     main_font = cv2.FONT_HERSHEY_COMPLEX
@@ -144,6 +172,8 @@ def main():
     text_color = (255, 255, 255)  # Beyaz
     
     print("Demo başlatıldı! Çıkmak için 'q' tuşuna basın.")
+    if args.record:
+        print(f"'{args.record}' hareketini kaydetmek için pozu yapıp 'r' tuşuna basın.")
     
     try:
         while cap.isOpened():
@@ -197,45 +227,38 @@ def main():
             cv2.putText(frame, hand_mode_text, 
                       (10, 20), main_font, 0.5, text_color, 1)
             
-            # İki el arasında kalp tespiti için değişkenleri sıfırla
-            left_hand_landmarks = None
-            right_hand_landmarks = None
-            heart_detected = False
+            # MediaPipe sonucu karede bir kez diziye çevrilir; sonraki tüm adımlar bu diziyi
+            # kullanır, protobuf landmark'ları yalnızca iskelet çizimi için tutulur
+            hand_points = landmark_frame.update(results)
+            multi_hand_landmarks = landmark_frame.hand_landmarks
+            
+            # Elleri izlerle eşleştir; kaybolan izlerin yörünge geçmişi silinir
+            track_ids = hand_tracker.assign(hand_points)
+            for track_id in hand_tracker.lost_ids:
+                if motion_recognizer:
+                    motion_recognizer.reset(track_id)
+                if landmark_filter:
+                    landmark_filter.reset(track_id)
+            
+            # Tanıyıcılar yumuşatılmış noktaları kullanır; iskelet ham noktalarla çizilir
+            if landmark_filter and len(hand_points):
+                hand_points = landmark_filter(hand_points, track_ids, time.time())
             
             # Eğer el tespit edildiyse
-            if results.multi_hand_landmarks:
-                # Her el için
-                multi_hand_landmarks = results.multi_hand_landmarks
-                
-                # Elleri belirleme (Sağ/Sol)
-                if len(multi_hand_landmarks) == 2 and not args.single_hand:
-                    # İki el varsa, hangi el sol/sağ olduğunu belirleme 
-                    hand1_x = multi_hand_landmarks[0].landmark[0].x
-                    hand2_x = multi_hand_landmarks[1].landmark[0].x
-                    
-                    # Ekranda solda görünen el (flip varsa gerçekte sağ el)
-                    if hand1_x < hand2_x:
-                        left_hand_landmarks = multi_hand_landmarks[0]
-                        right_hand_landmarks = multi_hand_landmarks[1]
-                    else:
-                        left_hand_landmarks = multi_hand_landmarks[1]
-                        right_hand_landmarks = multi_hand_landmarks[0]
-                    
-                    # İki elle kalp tespiti
-                    heart_detected = check_heart_gesture_two_hands(left_hand_landmarks, right_hand_landmarks)
-                    if heart_detected:
-                        current_gesture = "heart"
-                        current_confidence = 0.95  # İki elle kalp daha yüksek güven
-                        
-                        # Eylemi işle (eğer etkinse)
-                        if gesture_actions:
-                            action_performed, action_desc = gesture_actions.process_gesture("heart", current_confidence)
-                            if action_performed:
-                                last_action_text = action_desc
-                                last_action_time = time.time()
+            if multi_hand_landmarks:
+                # İki elle yapılan hareketler (kalp, alkış, mola, çerçeve); çifti oluşturan
+                # ellerin ikisi de bu hareketi gözler ve tek el tanımasına girmez
+                paired = ()
+                if len(multi_hand_landmarks) >= 2 and not args.single_hand:
+                    two_hand_gesture, two_hand_confidence, pair = gesture_recognizer.recognize_two_hand_gesture(
+                        hand_points, landmark_frame.handedness)
+                    if pair:
+                        paired = pair
+                        for index in pair:
+                            hand_tracker.observe(track_ids[index], two_hand_gesture, two_hand_confidence)
                 
                 # Tek elde tanıma için
-                for idx, hand_landmarks in enumerate(multi_hand_landmarks):
+                for index, (hand_landmarks, points, track_id) in enumerate(zip(multi_hand_landmarks, hand_points, track_ids)):
                     # El iskeletini çiz
                     mp_drawing.draw_landmarks(
                         frame,
@@ -244,35 +267,68 @@ def main():
                         mp_drawing_styles.get_default_hand_landmarks_style(),
                         mp_drawing_styles.get_default_hand_connections_style())
                     
-                    # İki elle kalp tespit edilmediyse, normal tanıma
-                    if not heart_detected:
-                        # Hareketi tanı
-                        gesture_name, confidence = gesture_recognizer.recognize_gesture(hand_landmarks)
+                    # İki el hareketine katılmadıysa, normal tanıma
+                    if index not in paired:
+                        # Kullanıcının kaydettiği özel hareketler kurallardan önce denenir
+                        gesture_name, confidence = custom_store.classify(points)
+                        if gesture_name == "unknown":
+                            # Hareketi tanı
+                            gesture_name, confidence = gesture_recognizer.recognize_gesture(points)
                         
-                        # Mevcut hareketi güncelle
-                        if gesture_name != "unknown" and confidence > 0.6:
-                            current_gesture = gesture_name
-                            current_confidence = confidence
-                            
-                            # Eylemi işle (eğer etkinse)
-                            if gesture_actions:
-                                action_performed, action_desc = gesture_actions.process_gesture(gesture_name, confidence)
-                                if action_performed:
-                                    last_action_text = action_desc
-                                    last_action_time = time.time()
+                        # Ham sonuç elin durum makinesine verilir
+                        hand_tracker.observe(track_id, gesture_name, confidence)
+                    
+                    # Hareketli el hareketleri (iz başına yörünge geçmişi); kendi tanıyıcısı onayladığı için doğrudan geçiş olur
+                    if motion_recognizer:
+                        motion_name, motion_confidence = motion_recognizer.update(track_id, points, time.time())
+                        if motion_name != "unknown":
+                            hand_tracker.trigger(track_id, motion_name, motion_confidence)
             else:
                 # El tespit edilemedi
                 cv2.putText(frame, "El tespit edilemedi", 
                           (int(actual_width/2) - 120, 30), main_font, 0.7, shadow_color, 2)
                 cv2.putText(frame, "El tespit edilemedi", 
                           (int(actual_width/2) - 120, 30), main_font, 0.7, (0, 0, 255), 1)
-                current_gesture = None
-                current_confidence = 0
             
-            # Mevcut hareketi büyük olarak göster (eğer varsa)
-            if current_gesture:
-                # Hareket adını Türkçe olarak al
-                gesture_display_name = gesture_recognizer.GESTURES.get(current_gesture, "Bilinmeyen Hareket")
+            # Yalnızca onaylanmış geçişler eylem tetikler (aynı karede aynı hareket bir kez)
+            performed = set()
+            for event in hand_tracker.pop_events():
+                if gesture_actions and event.gesture != "unknown" and event.gesture not in performed:
+                    performed.add(event.gesture)
+                    action_performed, action_desc = gesture_actions.process_gesture(event.gesture, event.confidence)
+                    if action_performed:
+                        last_action_text = action_desc
+                        last_action_time = time.time()
+            
+            # Özel hareket kaydı: ilk elin landmark noktaları toplanır
+            if recorded_frames is not None:
+                if len(landmark_frame):
+                    # Tampon sonraki karede yeniden kullanıldığı için kopyalanır
+                    recorded_frames.append(landmark_frame.points[0].copy())
+                
+                remaining = args.record_seconds - (time.time() - record_start_time)
+                if remaining > 0:
+                    record_text = f"Kayit: {args.record} ({remaining:.1f} sn)"
+                    cv2.putText(frame, record_text, 
+                              (10, 110), main_font, 0.6, (0, 0, 255), 1)
+                else:
+                    num_samples = custom_store.add_gesture(args.record, recorded_frames)
+                    if num_samples:
+                        custom_store.save()
+                        gesture_names[args.record] = args.record
+                        if gesture_actions:
+                            gesture_actions.register_action(args.record)
+                        print(f"'{args.record}' hareketi {num_samples} örnekle kaydedildi.")
+                    else:
+                        print("Kayıt sırasında el tespit edilemedi, hareket kaydedilmedi.")
+                    recorded_frames = None
+            
+            # Her elin onaylanmış hareketini büyük olarak göster (eğer varsa)
+            active_gestures = hand_tracker.active_gestures()
+            if active_gestures:
+                # Hareket adlarını Türkçe olarak al (iki elle yapılan hareket bir kez yazılır)
+                gesture_display_name = " + ".join(dict.fromkeys(gesture_names.get(gesture, "Bilinmeyen Hareket")
+                                                                for _, gesture, _ in active_gestures))
                 
                 # ASCII olmayan karakterleri temizle veya değiştir
                 # Bu sadece geçici bir çözüm, daha iyi bir yol FreeType2 kullanmak olacaktır
@@ -291,7 +347,8 @@ def main():
                           (text_x, 60), main_font, 1.2, main_color, 2)
                 
                 # Güven değerini daha küçük göster
-                confidence_text = f"Guven: %{int(current_confidence * 100)}"  # Türkçe karakterleri değiştir
+                confidence_text = "Guven: " + " / ".join(f"%{int(confidence * 100)}"
+                                                         for _, _, confidence in active_gestures)  # Türkçe karakterleri değiştir
                 conf_text_size = cv2.getTextSize(confidence_text, main_font, 0.6, 1)[0]
                 conf_x = (actual_width - conf_text_size[0]) // 2
                 
@@ -325,10 +382,15 @@ def main():
             # Sonuçları göster
             cv2.imshow(window_name, frame)
             
-            # Çıkış için 'q' tuşuna basılmasını kontrol et
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            # Çıkış için 'q' tuşuna, kayıt için 'r' tuşuna basılmasını kontrol et
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
                 print("Kullanıcı çıkışı...")
                 break
+            if key == ord('r') and args.record and recorded_frames is None:
+                print(f"'{args.record}' kaydediliyor ({args.record_seconds:.1f} sn)...")
+                recorded_frames = []
+                record_start_time = time.time()
     
     except KeyboardInterrupt:
         print("Kullanıcı programı durdurdu!")
@@ -341,57 +403,12 @@ def main():
         print("Temizleniyor...")
         if gesture_actions:
             gesture_actions.cleanup()
+        if args.profile:
+            print_profile_report(gesture_recognizer.profile_snapshot())
         cap.release()
         cv2.destroyAllWindows()
         print("Demo sonlandırıldı.")
 
 
-def check_heart_gesture_two_hands(left_hand_landmarks, right_hand_landmarks):
-    """
-    İki el kullanarak kalp hareketi yapılıp yapılmadığını kontrol eder.
-    
-    Args:
-        left_hand_landmarks: Sol el landmark noktaları
-        right_hand_landmarks: Sağ el landmark noktaları
-        
-    Returns:
-        bool: Kalp hareketi yapılıyorsa True, değilse False
-    """
-    if left_hand_landmarks is None or right_hand_landmarks is None:
-        return False
-    
-    # Sol elin başparmak ve işaret parmağı uçları
-    left_thumb_tip = left_hand_landmarks.landmark[4]
-    left_index_tip = left_hand_landmarks.landmark[8]
-    
-    # Sağ elin başparmak ve işaret parmağı uçları
-    right_thumb_tip = right_hand_landmarks.landmark[4]
-    right_index_tip = right_hand_landmarks.landmark[8]
-    
-    # Her elin başparmak ve işaret parmağı arasındaki mesafe
-    left_distance = ((left_thumb_tip.x - left_index_tip.x)**2 + 
-                    (left_thumb_tip.y - left_index_tip.y)**2)**0.5
-    
-    right_distance = ((right_thumb_tip.x - right_index_tip.x)**2 + 
-                     (right_thumb_tip.y - right_index_tip.y)**2)**0.5
-    
-    # İki elin birbirine yakınlığı
-    hand_distance = ((left_thumb_tip.x - right_thumb_tip.x)**2 + 
-                    (left_thumb_tip.y - right_thumb_tip.y)**2)**0.5
-    
-    # Başparmakların Y konumu (ekranda aşağı)
-    thumbs_down = (left_thumb_tip.y > left_hand_landmarks.landmark[0].y and 
-                  right_thumb_tip.y > right_hand_landmarks.landmark[0].y)
-    
-    # Kalp hareketi: 
-    # 1. Her elin başparmak ve işaret parmakları açık olmalı (kısa mesafe)
-    # 2. İki el birbirine yakın olmalı
-    # 3. İki elin başparmakları aşağı doğru olmalı
-    if left_distance < 0.15 and right_distance < 0.15 and hand_distance < 0.3 and thumbs_down:
-        return True
-    
-    return False
-
-
 if __name__ == "__main__":
     main() 
\ No newline at end of file
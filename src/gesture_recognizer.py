@@ -1,21 +1,337 @@
+import time
 import cv2
 import numpy as np
 import mediapipe as mp
-import math
+from collections import namedtuple
 
 # MediaPipe el izleme modüllerini başlat
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 mp_drawing_styles = mp.solutions.drawing_styles
 
+def landmarks_to_array(hand_landmarks):
+    """
+    MediaPipe el landmark noktalarını (21, 3) boyutlu bir diziye çevirir.
+    
+    Args:
+        hand_landmarks: MediaPipe el landmark noktaları veya (21, 3) dizi
+        
+    Returns:
+        points: (x, y, z) koordinatları, float64
+    """
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks.astype(np.float64, copy=False)
+    return np.fromiter(_landmark_values(hand_landmarks), np.float64, 63).reshape(21, 3)
+
+def _landmark_values(hand_landmarks):
+    # Protobuf alanlarının her biri yalnızca bir kez okunur
+    return (value for point in hand_landmarks.landmark for value in (point.x, point.y, point.z))
+
+class LandmarkFrame:
+    """
+    Bir karedeki tüm ellerin landmark noktalarını ve el taraflarını önceden
+    ayrılmış bir dizide tutar. MediaPipe sonucu karede bir kez dönüştürülür ve
+    sonraki tüm adımlar (izleme, filtre, tanıma, ROI) bu diziyi kullanır; tampon
+    kareler arasında yeniden kullanılır.
+    """
+    
+    def __init__(self, max_hands=2):
+        """
+        Args:
+            max_hands: Başlangıçta yer ayrılan el sayısı (gerekirse büyütülür)
+        """
+        self.buffer = np.zeros((max_hands, 21, 3))
+        self.points = self.buffer[:0]
+        self.handedness = None
+        self.hand_landmarks = []
+    
+    def __len__(self):
+        return len(self.points)
+    
+    def update(self, results):
+        """
+        MediaPipe sonucunu tampona yazar.
+        
+        Args:
+            results: MediaPipe Hands process() sonucu
+            
+        Returns:
+            points: (H, 21, 3) landmark dizisi (tamponun görünümü; sonraki karede
+                üzerine yazılır, saklanacaksa kopyalanmalı)
+        """
+        self.hand_landmarks = results.multi_hand_landmarks or []
+        count = len(self.hand_landmarks)
+        if count > len(self.buffer):
+            self.buffer = np.zeros((count, 21, 3))
+        
+        flat = self.buffer.reshape(len(self.buffer), 63)
+        for index, hand_landmarks in enumerate(self.hand_landmarks):
+            flat[index] = np.fromiter(_landmark_values(hand_landmarks), np.float64, 63)
+        
+        self.points = self.buffer[:count]
+        self.handedness = handedness_labels(results.multi_handedness) if count else None
+        return self.points
+
+def load_landmark_recording(path):
+    """
+    Kaydedilmiş landmark noktalarını yükler.
+    
+    Args:
+        path: (N, 21, 3) dizi içeren .npy dosyası veya 'landmarks' anahtarlı .npz dosyası
+        
+    Returns:
+        points: (N, 21, 3) landmark dizisi
+    """
+    if path.endswith('.npz'):
+        with np.load(path) as recording:
+            points = recording['landmarks']
+    else:
+        points = np.load(path)
+    
+    if points.ndim != 3 or points.shape[1:] != (21, 3):
+        raise ValueError(f"Landmark kaydı (N, 21, 3) boyutunda olmalı, bulunan: {points.shape}")
+    return points
+
+# Kural koşulları: _extract_features özelliklerinden hesaplanan, önde gelen
+# boyutlar üzerinde vektörel çalışan geometrik testler
+GESTURE_PREDICATES = {
+    'thumb_up': lambda f: f['thumb_direction'] == 0,
+    'thumb_down': lambda f: f['thumb_direction'] == 1,
+    'index_middle_spread': lambda f: f['tip_angles'][..., 1] > 20,  # Parmakların ayrılma açısı
+    'index_middle_together': lambda f: f['tip_angles'][..., 1] < 15,  # Bitişik parmaklar
+    'thumb_index_touching': lambda f: f['tip_distances'][..., 0, 1] < 0.07,
+    'thumb_index_close': lambda f: f['tip_distances'][..., 0, 1] < 0.1,
+    'thumb_index_wide': lambda f: f['tip_angles'][..., 0] > 45,
+    'fingers_spread': lambda f: f['tip_angles'].mean(axis=-1) > 15,  # Ortalama parmak açıklığı
+    'index_up': lambda f: f['tips_above_wrist'][..., 1],
+    'index_middle_up': lambda f: f['tips_above_wrist'][..., 1] & f['tips_above_wrist'][..., 2],
+    'pinky_near_ear': lambda f: f['pinky_near_ear'],
+    'thumb_pinky_down': lambda f: f['thumb_pinky_down'],
+    'thumb_pinky_close': lambda f: f['tip_distances'][..., 0, 4] < 0.15,
+    'thumb_inward': lambda f: f['thumb_inward']
+}
+
+# Hareket kuralı: parmak deseni başparmaktan serçeye '1' (açık), '0' (kapalı)
+# veya '*' (fark etmez); küçük öncelik değeri önce denenir
+GestureRule = namedtuple('GestureRule', ['name', 'confidence', 'fingers', 'priority', 'conditions'])
+
+GESTURE_RULES = [
+    GestureRule("thumbs_up", 0.9, "10000", 10, ("thumb_up",)),
+    GestureRule("thumbs_down", 0.9, "10000", 20, ("thumb_down",)),
+    GestureRule("peace", 0.85, "01100", 30, ("index_middle_spread",)),
+    # Tamam: başparmak ve işaret parmağı uçları birleşik
+    GestureRule("ok", 0.85, "1****", 40, ("thumb_index_touching",)),
+    GestureRule("fist", 0.85, "00000", 50, ()),
+    GestureRule("open_hand", 0.8, "11111", 60, ("fingers_spread",)),
+    GestureRule("pointing", 0.85, "01000", 70, ()),
+    GestureRule("rock", 0.85, "01001", 80, ()),
+    # Tutma: işaret parmağı açık, başparmak ucu yakın
+    GestureRule("pinch", 0.8, "*1***", 90, ("thumb_index_close",)),
+    GestureRule("gun", 0.85, "11000", 100, ("thumb_up", "thumb_index_wide")),
+    # Not: "pointing" ile aynı desen ve koşulsuz "pointing" önce denendiği için erişilemez
+    GestureRule("count_one", 0.9, "01000", 110, ("index_up",)),
+    GestureRule("count_two", 0.9, "01100", 120, ("index_middle_up", "index_middle_together")),
+    # Telefon ("alo" pozisyonu): serçe parmak kulak bölgesinde
+    GestureRule("phone", 0.85, "10001", 130, ("pinky_near_ear",)),
+    # Tek elle kalp: başparmak ve serçe aşağıda, uçları yakın, başparmak içe doğru
+    GestureRule("heart", 0.75, "*00**", 140, ("thumb_pinky_down", "thumb_pinky_close", "thumb_inward"))
+]
+
+# İki el koşulları: _extract_pair_features özelliklerinden el çiftleri üzerinde
+# vektörel hesaplanır; (P, 2) özelliklerde ikinci eksen çiftin iki elidir
+TWO_HAND_PREDICATES = {
+    # Aynı elin iki kez tespit edilmesini eler: bilekler neredeyse çakışıyor. El tarafı
+    # etiketine bakılmaz; MediaPipe eller üst üste geldiğinde (kalp, alkış) etiketi sık karıştırır
+    'distinct_hands': lambda f: f['wrist_distance'] > 0.15,
+    # Kalp: başparmak-işaret uçları her elde birleşik ve başparmaklar birbirine yakın
+    'heart_tips_joined': lambda f: (f['thumb_index_gaps'] < 0.15).all(axis=-1) & (f['thumb_tips_distance'] < 0.3),
+    'thumbs_below_wrists': lambda f: f['thumbs_below_wrist'].all(axis=-1),
+    'palms_touching': lambda f: f['palm_distance'] < 0.6,
+    'hands_parallel': lambda f: f['direction_dot'] > 0.8,
+    'hands_straight': lambda f: f['hands_straight'].all(axis=-1),
+    # T (mola): bir elin parmak uçları diğer yatay elin avucuna değiyor
+    't_shape': lambda f: f['t_shape'],
+    # Çerçeve: iki el de L şeklinde, işaret parmakları zıt yönde ve eller ayrık
+    'l_shapes': lambda f: f['l_shapes'].all(axis=-1),
+    'index_opposite': lambda f: f['index_dot'] < -0.7,
+    'hands_apart': lambda f: f['wrist_distance'] > 2.0
+}
+
+# İki el hareketi kuralı: listede önce gelen kural önce denenir
+TwoHandRule = namedtuple('TwoHandRule', ['name', 'confidence', 'conditions'])
+
+TWO_HAND_RULES = [
+    TwoHandRule("heart", 0.95, ("distinct_hands", "heart_tips_joined", "thumbs_below_wrists")),
+    TwoHandRule("clap", 0.85, ("distinct_hands", "palms_touching", "hands_parallel", "hands_straight")),
+    TwoHandRule("timeout", 0.85, ("distinct_hands", "t_shape")),
+    TwoHandRule("frame", 0.85, ("distinct_hands", "l_shapes", "index_opposite", "hands_apart"))
+]
+
+def handedness_labels(multi_handedness):
+    """
+    MediaPipe multi_handedness sonucunu el tarafı etiketlerine ('Left'/'Right') çevirir.
+    """
+    if multi_handedness is None:
+        return None
+    return [label if isinstance(label, str) else label.classification[0].label for label in multi_handedness]
+
+def _pattern_masks(fingers):
+    """
+    Parmak desenine uyan 5 bitlik parmak maskelerini döndürür (bit i: i. parmak açık).
+    """
+    return [mask for mask in range(32)
+            if all(symbol == '*' or int(symbol) == (mask >> i) & 1 for i, symbol in enumerate(fingers))]
+
+def compile_gesture_rules(rules):
+    """
+    Kuralları 5 bitlik parmak maskesiyle indekslenen 32 girişlik bir tabloya
+    derler. Her giriş, o maskede denenecek kuralları öncelik sırasıyla içerir;
+    koşulsuz bir kuraldan sonraki kurallar o maskede hiçbir zaman denenmez.
+    
+    Args:
+        rules: GestureRule listesi
+        
+    Returns:
+        table: Maske -> kural indeksleri (öncelik sırasıyla) listesi
+        report: Çakışan ve erişilemeyen kuralların raporu
+    """
+    for rule in rules:
+        if len(rule.fingers) != 5 or set(rule.fingers) - set('01*'):
+            raise ValueError(f"Geçersiz parmak deseni: {rule.name} ({rule.fingers})")
+        unknown = set(rule.conditions) - set(GESTURE_PREDICATES)
+        if unknown:
+            raise ValueError(f"Bilinmeyen koşul: {rule.name} ({', '.join(sorted(unknown))})")
+    
+    order = sorted(range(len(rules)), key=lambda i: rules[i].priority)
+    pattern_masks = {i: set(_pattern_masks(rules[i].fingers)) for i in order}
+    
+    table = []
+    for mask in range(32):
+        entry = []
+        for i in order:
+            if mask in pattern_masks[i]:
+                entry.append(i)
+                if not rules[i].conditions:
+                    break
+        table.append(tuple(entry))
+    
+    reachable = {i: {mask for mask in range(32) if i in table[mask]} for i in order}
+    
+    # Aynı maskede birlikte denenen kurallar: sonuç öncelik sırasına bağlıdır
+    overlaps = []
+    for a, first in enumerate(order):
+        for second in order[a + 1:]:
+            shared = sorted(reachable[first] & reachable[second])
+            if shared:
+                overlaps.append({
+                    'rules': (rules[first].name, rules[second].name),
+                    'masks': [format(mask, '05b')[::-1] for mask in shared]
+                })
+    
+    report = {
+        'unreachable': [rules[i].name for i in order if not reachable[i]],
+        'shadowed': {rules[i].name: [format(mask, '05b')[::-1] for mask in sorted(pattern_masks[i] - reachable[i])]
+                     for i in order if reachable[i] and pattern_masks[i] - reachable[i]},
+        'overlaps': overlaps,
+        'empty_masks': [format(mask, '05b')[::-1] for mask in range(32) if not table[mask]]
+    }
+    return table, report
+
+def print_rule_report(report):
+    """
+    Kural derleme raporunu yazdırır. Maskeler başparmaktan serçeye yazılır.
+    """
+    print(f"Erişilemeyen kurallar: {', '.join(report['unreachable']) or 'yok'}")
+    for name, masks in report['shadowed'].items():
+        print(f"Kısmen gölgelenen: {name} ({', '.join(masks)} desenlerinde hiç denenmez)")
+    print(f"Çakışan kural çiftleri ({len(report['overlaps'])}):")
+    for overlap in report['overlaps']:
+        print(f"  {overlap['rules'][0]} > {overlap['rules'][1]}: {', '.join(overlap['masks'])}")
+    print(f"Kuralı olmayan desenler: {', '.join(report['empty_masks']) or 'yok'}")
+
+class RecognizerProfile:
+    """
+    Kural değerlendirme sayaçları: kural başına deneme/eşleşme sayısı ve süre,
+    koşul (predicate) ve aşama (özellik çıkarma, iki el çiftleri vb.) başına süre.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        # Ad -> [deneme, eşleşme, saniye]
+        self.rules = {}
+        self.two_hand_rules = {}
+        # Ad -> [çağrı, saniye]
+        self.predicates = {}
+        self.stages = {}
+    
+    @staticmethod
+    def add_rule(table, name, evaluations, matches, seconds):
+        entry = table.setdefault(name, [0, 0, 0.0])
+        entry[0] += evaluations
+        entry[1] += matches
+        entry[2] += seconds
+    
+    @staticmethod
+    def add_time(table, name, seconds, calls=1):
+        entry = table.setdefault(name, [0, 0.0])
+        entry[0] += calls
+        entry[1] += seconds
+    
+    def snapshot(self):
+        """
+        Sayaçların kopyasını sözlük olarak döndürür.
+        """
+        def rules(table):
+            return {name: {'evaluations': evaluations, 'matches': matches, 'seconds': seconds}
+                    for name, (evaluations, matches, seconds) in table.items()}
+        
+        def timings(table):
+            return {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in table.items()}
+        
+        return {
+            'rules': rules(self.rules),
+            'two_hand_rules': rules(self.two_hand_rules),
+            'predicates': timings(self.predicates),
+            'stages': timings(self.stages)
+        }
+
+def print_profile_report(snapshot):
+    """
+    Kural değerlendirme sayaçlarını toplam süreye göre sıralı yazdırır.
+    """
+    for title, key in (("Kurallar", 'rules'), ("İki el kuralları", 'two_hand_rules')):
+        if not snapshot[key]:
+            continue
+        print(f"\n{title}:")
+        print(f"{'Kural':>14} {'Deneme':>9} {'Eşleşme':>9} {'Oran':>7} {'Toplam ms':>10} {'µs/deneme':>10}")
+        for name, entry in sorted(snapshot[key].items(), key=lambda item: -item[1]['seconds']):
+            evaluations = max(entry['evaluations'], 1)
+            print(f"{name:>14} {entry['evaluations']:9} {entry['matches']:9} {entry['matches'] / evaluations:7.1%} "
+                  f"{entry['seconds'] * 1000:10.2f} {entry['seconds'] * 1e6 / evaluations:10.1f}")
+    
+    for title, key in (("Koşullar", 'predicates'), ("Aşamalar", 'stages')):
+        if not snapshot[key]:
+            continue
+        print(f"\n{title}:")
+        print(f"{'Ad':>26} {'Çağrı':>9} {'Toplam ms':>10} {'µs/çağrı':>10}")
+        for name, entry in sorted(snapshot[key].items(), key=lambda item: -item[1]['seconds']):
+            print(f"{name:>26} {entry['calls']:9} {entry['seconds'] * 1000:10.2f} "
+                  f"{entry['seconds'] * 1e6 / max(entry['calls'], 1):10.1f}")
+
 class GestureRecognizer:
     """
     Temel el hareketlerini (kalp, başparmak yukarı, başparmak aşağı, ok vb.) tanımak için sınıf.
     """
     
-    def __init__(self):
+    def __init__(self, rules=None, profile=False):
         """
         Hareket tanıma sınıfını başlatır.
+        
+        Args:
+            rules: GestureRule listesi (varsayılan: GESTURE_RULES)
+            profile: Kural değerlendirme sayaçları tutulsun mu? (kapalıyken ek maliyet yok)
         """
         # El noktaları indeksleri:
         # MediaPipe el izleme noktaları: https://developers.google.com/mediapipe/solutions/vision/hand_landmarker
@@ -44,8 +360,11 @@ class GestureRecognizer:
         # Bilek
         self.WRIST = 0
         
-        # Tanınabilecek hareketler - Türkçe karakter sorunlarını önlemek için ASCII karakterlere çevir
-        self.GESTURES = {
+        # Parmak maskesindeki bit değerleri (başparmak: bit 0, serçe: bit 4)
+        self.FINGER_BITS = 1 << np.arange(5)
+        
+        # Hareketlerin görünen adları - Türkçe karakter sorunlarını önlemek için ASCII karakterlere çevir
+        display_names = {
             "thumbs_up": "Basparmak Yukari",
             "thumbs_down": "Basparmak Asagi",
             "peace": "Baris Isareti",
@@ -59,19 +378,65 @@ class GestureRecognizer:
             "gun": "Silah Isareti",
             "count_one": "Bir",
             "count_two": "Iki",
-            "phone": "Telefon"
+            "phone": "Telefon",
+            # İki elle yapılan hareketler (recognize_two_hand_gesture)
+            "frame": "Cerceve",
+            "clap": "Alkis",
+            "timeout": "Mola"
         }
         
+        # _extract_features'ın döndürdüğü başparmak yönü indeksleri
+        self.THUMB_DIRECTIONS = ("up", "down", "right", "left")
+        
+        # Kurallar parmak maskesine göre aday listelerine derlenir
+        self.rules = list(GESTURE_RULES if rules is None else rules)
+        self.rule_table, self.rule_report = compile_gesture_rules(self.rules)
+        
+        # Tanınabilecek hareketler kurallardan oluşturulur: bilinen hareketler tablodaki
+        # sırayla (varsayılan kurallarda kimlikler sabit kalır), ardından görünen adı
+        # olmayan yeni kurallar kendi adlarıyla
+        names = [rule.name for rule in self.rules] + [rule.name for rule in TWO_HAND_RULES]
+        self.GESTURES = {name: display for name, display in display_names.items() if name in names}
+        for name in names:
+            self.GESTURES.setdefault(name, name)
+        
+        # recognize_gestures'ın döndürdüğü hareket kimlikleri (0: tanınamadı)
+        self.GESTURE_IDS = ("unknown",) + tuple(self.GESTURES)
+        
+        # Toplu tanımada kural -> maskede aday mı? (kural sayısı, 32), kuralların
+        # öncelik sırası ve her kuralın hareket kimliği
+        self.rule_candidates = np.zeros((len(self.rules), 32), dtype=bool)
+        for mask, entry in enumerate(self.rule_table):
+            self.rule_candidates[list(entry), mask] = True
+        self.rule_order = sorted(range(len(self.rules)), key=lambda i: self.rules[i].priority)
+        self.rule_gesture_ids = np.array([self.GESTURE_IDS.index(rule.name) for rule in self.rules], dtype=np.int64)
+        
         # Hareket tanıma için güven eşikleri
         self.angle_threshold = 60  # Derece cinsinden
         self.distance_threshold = 0.1  # Normalize edilmiş mesafe
+        
+        # İsteğe bağlı kural değerlendirme sayaçları
+        self.profile = RecognizerProfile() if profile else None
+    
+    def profile_snapshot(self):
+        """
+        Kural değerlendirme sayaçlarının kopyasını döndürür (profil kapalıysa None).
+        """
+        return self.profile.snapshot() if self.profile else None
+    
+    def reset_profile(self):
+        """
+        Kural değerlendirme sayaçlarını sıfırlar.
+        """
+        if self.profile:
+            self.profile.reset()
     
     def recognize_gesture(self, hand_landmarks, img_shape=None):
         """
         El landmark noktalarından hareketi tanır.
         
         Args:
-            hand_landmarks: MediaPipe el landmark noktaları
+            hand_landmarks: MediaPipe el landmark noktaları veya (21, 3) dizi
             img_shape: Görüntü boyutu (isteğe bağlı)
             
         Returns:
@@ -81,277 +446,300 @@ class GestureRecognizer:
         if hand_landmarks is None:
             return "unknown", 0.0
         
-        # Parmak açıklıklarını kontrol et
-        fingers_extended = self._count_fingers_extended(hand_landmarks)
-        
-        # Başparmak yönünü kontrol et
-        thumb_direction = self._check_thumb_direction(hand_landmarks)
-        
-        # Özel el hareketlerini kontrol et
-        
-        # Başparmak Yukarı: Sadece başparmak açık, diğerleri kapalı ve başparmak yukarı yönde
-        if fingers_extended == [1, 0, 0, 0, 0] and thumb_direction == "up":
-            return "thumbs_up", 0.9
-        
-        # Başparmak Aşağı: Sadece başparmak açık, diğerleri kapalı ve başparmak aşağı yönde
-        if fingers_extended == [1, 0, 0, 0, 0] and thumb_direction == "down":
-            return "thumbs_down", 0.9
-        
-        # Barış İşareti: İşaret ve orta parmak açık, diğerleri kapalı
-        if fingers_extended == [0, 1, 1, 0, 0]:
-            # İşaret ve orta parmağın ayrılma açısını kontrol et
-            angle = self._calculate_angle_between_fingers(hand_landmarks, 8, 12)
-            if angle > 20:  # Parmakların ayrılma açısı
-                return "peace", 0.85
-        
-        # Tamam İşareti: Başparmak ve işaret parmağı birleşik, diğerleri açık
-        if fingers_extended[0] == 1:  # Başparmak açık
-            # Başparmak ve işaret parmağı uçları arasındaki mesafeyi kontrol et
-            distance = self._calculate_distance(hand_landmarks, 4, 8)
-            if distance < 0.07:  # Daha hassas mesafe kontrolü
-                return "ok", 0.85
-        
-        # Yumruk: Tüm parmaklar kapalı
-        if fingers_extended == [0, 0, 0, 0, 0]:
-            return "fist", 0.85
-        
-        # Açık El: Tüm parmaklar açık
-        if fingers_extended == [1, 1, 1, 1, 1]:
-            # Parmaklar arasındaki açının çok dar olmamasını kontrol et
-            angles = []
-            for i in range(1, 5):  # İşaret-serçe arası parmaklar
-                angles.append(self._calculate_angle_between_fingers(hand_landmarks, 
-                                                                  self.FINGER_TIPS[i-1], 
-                                                                  self.FINGER_TIPS[i]))
-            avg_angle = sum(angles) / len(angles)
-            if avg_angle > 15:  # Ortalama parmak açıklığı
-                return "open_hand", 0.8
-        
-        # İşaret: Sadece işaret parmağı açık
-        if fingers_extended == [0, 1, 0, 0, 0]:
-            return "pointing", 0.85
-        
-        # Rock İşareti: Sadece serçe parmak ve işaret parmağı açık
-        if fingers_extended == [0, 1, 0, 0, 1]:
-            return "rock", 0.85
-        
-        # Tutma Hareketi: Başparmak ve işaret parmağı uçları yakın
-        if fingers_extended[1] == 1:  # İşaret parmağı açık
-            # Başparmak ve işaret parmağı uçları arasındaki mesafeyi kontrol et
-            distance = self._calculate_distance(hand_landmarks, 4, 8)
-            if distance < 0.1:  # Normalize edilmiş mesafe
-                return "pinch", 0.8
-        
-        # Silah İşareti: Başparmak yukarı, işaret parmağı açık, diğerleri kapalı
-        if fingers_extended == [1, 1, 0, 0, 0] and thumb_direction == "up":
-            angle = self._calculate_angle_between_fingers(hand_landmarks, 4, 8)
-            if angle > 45:  # Başparmak ve işaret arasındaki açı
-                return "gun", 0.85
-        
-        # Bir Sayma: Sadece işaret parmağı açık, elin yönü yukarı
-        if fingers_extended == [0, 1, 0, 0, 0]:
-            # İşaret parmağı yukarı doğru mu?
-            index_tip = hand_landmarks.landmark[8]
-            wrist = hand_landmarks.landmark[0]
-            if index_tip.y < wrist.y:  # Parmak ucu bilekten yukarıda
-                return "count_one", 0.9
-        
-        # İki Sayma: İşaret ve orta parmak açık, diğerleri kapalı
-        if fingers_extended == [0, 1, 1, 0, 0]:
-            # İşaret ve orta parmak yukarı doğru mu?
-            index_tip = hand_landmarks.landmark[8]
-            middle_tip = hand_landmarks.landmark[12]
-            wrist = hand_landmarks.landmark[0]
-            if index_tip.y < wrist.y and middle_tip.y < wrist.y:
-                # Parmakların arasındaki açı küçük mü? (Bitişik sayma)
-                angle = self._calculate_angle_between_fingers(hand_landmarks, 8, 12)
-                if angle < 15:  # Parmaklar birbirine yakın
-                    return "count_two", 0.9
-        
-        # Telefon İşareti: Başparmak ve serçe parmak açık, diğerleri kapalı
-        if fingers_extended == [1, 0, 0, 0, 1]:
-            # "Alo" pozisyonu
-            thumb_tip = hand_landmarks.landmark[4]
-            pinky_tip = hand_landmarks.landmark[20]
-            ear_region = hand_landmarks.landmark[0].y - 0.1  # Kulak bölgesi tahmini
-            
-            # Başparmak ağız bölgesinde, serçe parmak kulak bölgesinde mi?
-            if pinky_tip.y < ear_region:
-                return "phone", 0.85
+        if self.profile:
+            return self._recognize_gesture_profiled(hand_landmarks)
+        
+        # Landmark noktaları bir kez diziye çevrilir, tüm kurallar aynı özellikleri okur
+        features = self._extract_features(landmarks_to_array(hand_landmarks))
         
-        # Kalp İşareti: Bu biraz karmaşık, başparmaklar ve işaret parmakları belirli bir şekilde
-        # Kalp için özel bir hesaplama yapılabilir
-        is_heart = self._check_heart_gesture(hand_landmarks)
-        if is_heart:
-            return "heart", 0.75
+        # Yalnızca bu parmak maskesinin aday kurallarının koşulları denenir
+        for rule_index in self.rule_table[int(features['finger_mask'])]:
+            rule = self.rules[rule_index]
+            if all(GESTURE_PREDICATES[condition](features) for condition in rule.conditions):
+                return rule.name, rule.confidence
         
         # Tanınamadı
         return "unknown", 0.4
     
-    def _count_fingers_extended(self, hand_landmarks):
+    def _recognize_gesture_profiled(self, hand_landmarks):
         """
-        Açık parmakları sayar.
-        
-        Args:
-            hand_landmarks: MediaPipe el landmark noktaları
-            
-        Returns:
-            extended_fingers: Her parmağın açık (1) veya kapalı (0) olduğunu gösteren liste
+        recognize_gesture ile aynı sonucu verir; kural, koşul ve aşama sürelerini sayar.
         """
-        extended_fingers = []
-        
-        # Başparmak kontrolü (diğer parmaklardan farklı)
-        # Başparmak CMC-MCP-IP açısını kontrol et
-        finger_points = [hand_landmarks.landmark[self.THUMB_CMC],
-                         hand_landmarks.landmark[self.THUMB_MCP],
-                         hand_landmarks.landmark[self.THUMB_IP],
-                         hand_landmarks.landmark[self.THUMB_TIP]]
-        
-        # Başparmak açılma yönünü kontrol et
-        wrist_x = hand_landmarks.landmark[self.WRIST].x
-        thumb_tip_x = hand_landmarks.landmark[self.THUMB_TIP].x
-        
-        # Sağ el için başparmak açıklığı kontrolü
-        if wrist_x > thumb_tip_x:  # Sağ el
-            extended_fingers.append(1 if finger_points[3].x < finger_points[1].x else 0)
-        else:  # Sol el
-            extended_fingers.append(1 if finger_points[3].x > finger_points[1].x else 0)
-        
-        # Diğer parmaklar (işaret, orta, yüzük, serçe) için
-        for i in range(1, 5):
-            finger_points = [
-                hand_landmarks.landmark[self.FINGER_BASE[i]],  # Taban
-                hand_landmarks.landmark[self.FINGER_MIDDLE[i]],  # Orta
-                hand_landmarks.landmark[self.FINGER_TIPS[i]]   # Uç
-            ]
-            
-            # Parmak ucu, orta eklemden daha yukarıdaysa parmak açıktır
-            # Not: Y koordinatı ekranda yukarıdan aşağıya artar, yani daha küçük y daha yukarıdadır
-            if finger_points[2].y < finger_points[1].y:
-                extended_fingers.append(1)
-            else:
-                extended_fingers.append(0)
-        
-        return extended_fingers
+        profile = self.profile
+        start = time.perf_counter()
+        features = self._extract_features(landmarks_to_array(hand_landmarks))
+        profile.add_time(profile.stages, 'extract_features', time.perf_counter() - start)
+        
+        result = ("unknown", 0.4)
+        for rule_index in self.rule_table[int(features['finger_mask'])]:
+            rule = self.rules[rule_index]
+            rule_start = time.perf_counter()
+            matched = True
+            for condition in rule.conditions:
+                condition_start = time.perf_counter()
+                value = GESTURE_PREDICATES[condition](features)
+                profile.add_time(profile.predicates, condition, time.perf_counter() - condition_start)
+                if not value:
+                    matched = False
+                    break
+            profile.add_rule(profile.rules, rule.name, 1, int(matched), time.perf_counter() - rule_start)
+            if matched:
+                result = (rule.name, rule.confidence)
+                break
+        
+        profile.add_time(profile.stages, 'recognize_gesture', time.perf_counter() - start)
+        return result
     
-    def _check_thumb_direction(self, hand_landmarks):
+    def recognize_gestures(self, landmarks, chunk_size=65536):
         """
-        Başparmağın yönünü kontrol eder.
+        Birden fazla elin hareketini vektörel kurallarla tek seferde tanır.
+        Sonuçlar her el için recognize_gesture ile aynıdır.
         
         Args:
-            hand_landmarks: MediaPipe el landmark noktaları
+            landmarks: (N, 21, 3) landmark dizisi, MediaPipe el landmark listesi
+                veya load_landmark_recording ile okunabilen kayıt dosyası
+            chunk_size: Bellek kullanımını sınırlamak için bir seferde işlenen el sayısı
             
         Returns:
-            direction: Başparmağın yönü ('up', 'down', 'left', 'right')
+            gesture_ids: GESTURE_IDS içindeki hareket indeksleri (N,)
+            confidences: Tanıma güvenleri (N,)
         """
-        thumb_tip = hand_landmarks.landmark[self.THUMB_TIP]
-        thumb_base = hand_landmarks.landmark[self.THUMB_CMC]
-        
-        # Başparmak ucunun tabana göre konumu
-        dx = thumb_tip.x - thumb_base.x
-        dy = thumb_tip.y - thumb_base.y
-        
-        # Baskın yönü belirle
-        if abs(dy) > abs(dx):  # Dikey hareket daha belirgin
-            return "up" if dy < 0 else "down"
-        else:  # Yatay hareket daha belirgin
-            return "right" if dx > 0 else "left"
+        if isinstance(landmarks, str):
+            points = load_landmark_recording(landmarks)
+        elif isinstance(landmarks, np.ndarray):
+            points = landmarks
+        else:
+            points = np.array([landmarks_to_array(hand_landmarks) for hand_landmarks in landmarks]).reshape(-1, 21, 3)
+        points = points.astype(np.float64, copy=False)
+        
+        gesture_ids = np.zeros(len(points), dtype=np.int64)
+        confidences = np.full(len(points), 0.4)
+        
+        for start in range(0, len(points), chunk_size):
+            extract_start = time.perf_counter() if self.profile else 0.0
+            features = self._extract_features(points[start:start + chunk_size])
+            if self.profile:
+                self.profile.add_time(self.profile.stages, 'extract_features (toplu)', time.perf_counter() - extract_start)
+            masks = features['finger_mask']
+            ids = gesture_ids[start:start + chunk_size]
+            chunk_confidences = confidences[start:start + chunk_size]
+            
+            # Kurallar öncelik sırasıyla denenir; koşullar yalnızca aday ellerde ve
+            # parça başına bir kez hesaplanır
+            remaining = np.ones(len(ids), dtype=bool)
+            predicates = {}
+            for rule_index in self.rule_order:
+                candidates = remaining & self.rule_candidates[rule_index][masks]
+                if not candidates.any():
+                    continue
+                
+                rule = self.rules[rule_index]
+                rule_start = time.perf_counter() if self.profile else 0.0
+                evaluations = int(candidates.sum()) if self.profile else 0
+                for condition in rule.conditions:
+                    if condition not in predicates:
+                        condition_start = time.perf_counter() if self.profile else 0.0
+                        predicates[condition] = GESTURE_PREDICATES[condition](features)
+                        if self.profile:
+                            self.profile.add_time(self.profile.predicates, condition,
+                                                  time.perf_counter() - condition_start)
+                    candidates &= predicates[condition]
+                if self.profile:
+                    self.profile.add_rule(self.profile.rules, rule.name, evaluations, int(candidates.sum()),
+                                          time.perf_counter() - rule_start)
+                
+                ids[candidates] = self.rule_gesture_ids[rule_index]
+                chunk_confidences[candidates] = rule.confidence
+                remaining &= ~candidates
+        
+        return gesture_ids, confidences
     
-    def _calculate_angle_between_fingers(self, hand_landmarks, tip_idx1, tip_idx2):
+    def recognize_two_hand_gesture(self, hands, handedness=None):
         """
-        İki parmak ucu arasındaki açıyı hesaplar.
+        İki elle yapılan hareketleri (kalp, alkış, mola, çerçeve) tanır. Tüm el
+        çiftlerinin özellikleri tek seferde vektörel hesaplanır.
         
         Args:
-            hand_landmarks: MediaPipe el landmark noktaları
-            tip_idx1: İlk parmak ucu indeksi
-            tip_idx2: İkinci parmak ucu indeksi
+            hands: (H, 21, 3) landmark dizisi veya MediaPipe el landmark listesi
+            handedness: MediaPipe multi_handedness veya 'Left'/'Right' etiket listesi (isteğe bağlı)
             
         Returns:
-            angle: İki parmak arasındaki açı (derece)
+            gesture_name: Tanınan iki el hareketi (yoksa "unknown")
+            confidence: Tanıma güveni
+            pair: Hareketi yapan ellerin hands içindeki indeksleri (yoksa None)
         """
-        wrist = hand_landmarks.landmark[self.WRIST]
-        tip1 = hand_landmarks.landmark[tip_idx1]
-        tip2 = hand_landmarks.landmark[tip_idx2]
-        
-        # İki parmak ve bilek arasındaki vektörler
-        v1 = [tip1.x - wrist.x, tip1.y - wrist.y]
-        v2 = [tip2.x - wrist.x, tip2.y - wrist.y]
-        
-        # Vektörlerin modülleri
-        v1_mag = math.sqrt(v1[0]**2 + v1[1]**2)
-        v2_mag = math.sqrt(v2[0]**2 + v2[1]**2)
-        
-        # Vektörler arasındaki açının kosinüsü
-        cos_angle = (v1[0]*v2[0] + v1[1]*v2[1]) / (v1_mag * v2_mag)
-        
-        # Kosinüs değerini -1 ile 1 arasında sınırla (sayısal hatalardan kaçınmak için)
-        cos_angle = max(-1, min(1, cos_angle))
-        
-        # Açıyı derece cinsinden hesapla
-        angle = math.degrees(math.acos(cos_angle))
-        
-        return angle
+        if isinstance(hands, np.ndarray):
+            points = hands.astype(np.float64, copy=False)
+        else:
+            points = np.array([landmarks_to_array(hand_landmarks) for hand_landmarks in hands]).reshape(-1, 21, 3)
+        if len(points) < 2:
+            return "unknown", 0.0, None
+        
+        profile = self.profile
+        start = time.perf_counter() if profile else 0.0
+        features, pairs = self._extract_pair_features(points, handedness_labels(handedness))
+        if profile:
+            profile.add_time(profile.stages, 'two_hand_features', time.perf_counter() - start)
+        
+        # Kurallar sırayla denenir; ilk eşleşen çift seçilir
+        result = ("unknown", 0.0, None)
+        predicates = {}
+        for rule in TWO_HAND_RULES:
+            rule_start = time.perf_counter() if profile else 0.0
+            matches = np.ones(len(pairs), dtype=bool)
+            for condition in rule.conditions:
+                if condition not in predicates:
+                    condition_start = time.perf_counter() if profile else 0.0
+                    predicates[condition] = TWO_HAND_PREDICATES[condition](features)
+                    if profile:
+                        profile.add_time(profile.predicates, condition, time.perf_counter() - condition_start)
+                matches &= predicates[condition]
+            if profile:
+                profile.add_rule(profile.two_hand_rules, rule.name, len(pairs), int(matches.sum()),
+                                 time.perf_counter() - rule_start)
+            if matches.any():
+                first, second = pairs[np.argmax(matches)]
+                result = (rule.name, rule.confidence, (int(first), int(second)))
+                break
+        
+        if profile:
+            profile.add_time(profile.stages, 'recognize_two_hand_gesture', time.perf_counter() - start)
+        return result
     
-    def _calculate_distance(self, hand_landmarks, idx1, idx2):
+    def _extract_pair_features(self, points, labels=None):
         """
-        İki landmark noktası arasındaki normalize edilmiş mesafeyi hesaplar.
+        Tüm el çiftleri için iki el kurallarının kullandığı özellikleri hesaplar.
+        Uzunluklar iki elin ortalama avuç boyuna (bilek - orta parmak kökü) bölünür.
         
         Args:
-            hand_landmarks: MediaPipe el landmark noktaları
-            idx1: İlk nokta indeksi
-            idx2: İkinci nokta indeksi
+            points: (H, 21, 3) landmark dizisi
+            labels: Her elin el tarafı etiketi (isteğe bağlı)
             
         Returns:
-            distance: İki nokta arasındaki normalize edilmiş mesafe
+            features: Çift başına özellik sözlüğü ((P,) veya (P, 2))
+            pairs: (P, 2) el indeksi çiftleri; el tarafı farklıysa önce sol el,
+                değilse ekranda solda görünen el
         """
-        point1 = hand_landmarks.landmark[idx1]
-        point2 = hand_landmarks.landmark[idx2]
-        
-        # 3D mesafe hesapla
-        distance = math.sqrt((point1.x - point2.x)**2 + 
-                           (point1.y - point2.y)**2 + 
-                           (point1.z - point2.z)**2)
-        
-        return distance
+        pairs = np.transpose(np.triu_indices(len(points), 1))
+        if labels is not None:
+            labels = np.array(labels)
+            by_label = labels[pairs[:, 0]] != labels[pairs[:, 1]]
+            swap = np.where(by_label, labels[pairs[:, 0]] == "Right",
+                            points[pairs[:, 0], self.WRIST, 0] > points[pairs[:, 1], self.WRIST, 0])
+        else:
+            swap = points[pairs[:, 0], self.WRIST, 0] > points[pairs[:, 1], self.WRIST, 0]
+        pairs = np.where(swap[:, np.newaxis], pairs[:, ::-1], pairs)
+        
+        # (P, 2, 21, 2): her çiftin iki elinin ekran koordinatları
+        xy = points[pairs][..., :2]
+        wrist = xy[..., self.WRIST, :]
+        thumb_tip = xy[..., self.THUMB_TIP, :]
+        index_tip = xy[..., 8, :]
+        middle_tip = xy[..., 12, :]
+        palm_center = xy[..., [0, 5, 9, 13, 17], :].mean(axis=-2)
+        
+        hand_vectors = xy[..., 9, :] - wrist
+        palm_size = np.linalg.norm(hand_vectors, axis=-1)
+        scale = np.maximum(palm_size.mean(axis=-1), 1e-6)
+        
+        def unit(vectors):
+            return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-9)
+        
+        hand_directions = unit(hand_vectors)
+        index_directions = unit(index_tip - xy[..., 5, :])
+        
+        # Parmak ucunun bileğe uzaklığı avuç boyuna göre: düz parmak ~1.9, kıvrık ~1
+        reach = np.linalg.norm(xy[..., self.FINGER_TIPS, :] - wrist[..., np.newaxis, :], axis=-1) / \
+            np.maximum(palm_size, 1e-6)[..., np.newaxis]
+        vertical = np.abs(hand_directions[..., 1]) > 2 * np.abs(hand_directions[..., 0])
+        horizontal = np.abs(hand_directions[..., 0]) > 2 * np.abs(hand_directions[..., 1])
+        
+        # Bir elin orta parmak ucunun diğer elin avuç merkezine uzaklığı (ilk -> ikinci, ikinci -> ilk)
+        tip_to_palm = np.linalg.norm(middle_tip - palm_center[:, ::-1], axis=-1) / scale[:, np.newaxis]
+        
+        features = {
+            'thumb_index_gaps': np.linalg.norm(thumb_tip - index_tip, axis=-1),
+            'thumb_tips_distance': np.linalg.norm(thumb_tip[:, 0] - thumb_tip[:, 1], axis=-1),
+            'thumbs_below_wrist': thumb_tip[..., 1] > wrist[..., 1],
+            'palm_distance': np.linalg.norm(palm_center[:, 0] - palm_center[:, 1], axis=-1) / scale,
+            'wrist_distance': np.linalg.norm(wrist[:, 0] - wrist[:, 1], axis=-1) / scale,
+            'direction_dot': np.sum(hand_directions[:, 0] * hand_directions[:, 1], axis=-1),
+            'index_dot': np.sum(index_directions[:, 0] * index_directions[:, 1], axis=-1),
+            'hands_straight': reach[..., 2] > 1.5,
+            't_shape': ((vertical & horizontal[:, ::-1] & (reach[..., 2] > 1.5) & (tip_to_palm < 0.7)).any(axis=-1)),
+            # L: işaret parmağı düz, orta ve yüzük kıvrık, başparmak işaret kökünden uzak
+            'l_shapes': (reach[..., 1] > 1.4) & (reach[..., 2] < 1.2) & (reach[..., 3] < 1.2) &
+                        (np.linalg.norm(thumb_tip - xy[..., 5, :], axis=-1) > 0.6 * palm_size)
+        }
+        return features, pairs
     
-    def _check_heart_gesture(self, hand_landmarks):
+    def _extract_features(self, points):
         """
-        Kalp işareti olup olmadığını kontrol eder.
-        Bu genellikle başparmaklar ve işaret parmakları ile yapılır.
+        Kuralların kullandığı tüm özellikleri tek geçişte hesaplar.
         
         Args:
-            hand_landmarks: MediaPipe el landmark noktaları
+            points: (..., 21, 3) landmark dizisi
             
         Returns:
-            is_heart: Kalp işareti ise True, değilse False
+            features: Özellik sözlüğü (önde gelen boyutlar korunur):
+                fingers_extended: Her parmağın açık olup olmadığı (5,)
+                finger_mask: 5 bitlik parmak maskesi (bit i: i. parmak açık)
+                thumb_direction: THUMB_DIRECTIONS içindeki yön indeksi
+                tip_distances: Parmak uçları arasındaki 3B mesafeler (5, 5)
+                tip_angles: Bileğe göre komşu parmak uçları arasındaki açılar (4,),
+                    derece (başparmak-işaret, işaret-orta, orta-yüzük, yüzük-serçe)
+                tips_above_wrist: Parmak ucu bilekten yukarıda mı? (5,)
+                pinky_near_ear: Serçe parmak ucu kulak bölgesinde mi?
+                thumb_pinky_down: Başparmak ve serçe parmak uçları bilekten aşağıda mı?
+                thumb_inward: Başparmak avuç içine doğru mu?
         """
-        # Not: Bu basit bir implementasyon. Gerçek bir kalp hareketi tanıma için
-        # iki el birden gerekir veya başparmak ve işaret parmağı özel konumlandırılmalıdır.
-        # Bu basit sürümde, başparmak ve serçe parmağın yönü ve konumunu kontrol ediyoruz
-        
-        # Parmak uçları
-        thumb_tip = hand_landmarks.landmark[self.THUMB_TIP]
-        pinky_tip = hand_landmarks.landmark[self.FINGER_TIPS[4]]
-        
-        # Bilek
-        wrist = hand_landmarks.landmark[self.WRIST]
-        
-        # Başparmak ve serçe parmak aşağı doğru mu?
-        if thumb_tip.y > wrist.y and pinky_tip.y > wrist.y:
-            # Parmakların konumları birbirine yakın mı?
-            distance = self._calculate_distance(hand_landmarks, self.THUMB_TIP, self.FINGER_TIPS[4])
-            
-            # Parmakların yönü içe doğru mu?
-            thumb_dir = self._check_thumb_direction(hand_landmarks)
-            is_inward = (thumb_dir == "right" and thumb_tip.x < wrist.x) or (thumb_dir == "left" and thumb_tip.x > wrist.x)
-            
-            # İşaret ve orta parmaklar kapalı mı?
-            fingers_extended = self._count_fingers_extended(hand_landmarks)
-            if fingers_extended[1] == 0 and fingers_extended[2] == 0:
-                return distance < 0.15 and is_inward
-        
-        return False
-        
+        wrist = points[..., self.WRIST, :]
+        tips = points[..., self.FINGER_TIPS, :]
+        thumb_tip = points[..., self.THUMB_TIP, :]
+        thumb_cmc = points[..., self.THUMB_CMC, :]
+        
+        # Başparmak: ucun MCP eklemine göre yatay konumu el tarafına göre değerlendirilir
+        # (bilek başparmak ucunun sağındaysa sağ el)
+        thumb_mcp_x = points[..., self.THUMB_MCP, 0]
+        right_hand = wrist[..., 0] > thumb_tip[..., 0]
+        thumb_extended = np.where(right_hand, thumb_tip[..., 0] < thumb_mcp_x, thumb_tip[..., 0] > thumb_mcp_x)
+        
+        # Diğer parmaklar: uç orta eklemden yukarıdaysa açık
+        # Not: Y koordinatı ekranda yukarıdan aşağıya artar, yani daha küçük y daha yukarıdadır
+        others_extended = points[..., self.FINGER_TIPS[1:], 1] < points[..., self.FINGER_MIDDLE[1:], 1]
+        fingers_extended = np.concatenate((thumb_extended[..., np.newaxis], others_extended), axis=-1)
+        finger_mask = np.sum(fingers_extended * self.FINGER_BITS, axis=-1)
+        
+        # Başparmak yönü: ucun tabana göre baskın ekseni (0: up, 1: down, 2: right, 3: left)
+        dx = thumb_tip[..., 0] - thumb_cmc[..., 0]
+        dy = thumb_tip[..., 1] - thumb_cmc[..., 1]
+        thumb_direction = np.where(np.abs(dy) > np.abs(dx), np.where(dy < 0, 0, 1), np.where(dx > 0, 2, 3))
+        
+        # Parmak uçları arasındaki tüm mesafeler
+        differences = tips[..., :, np.newaxis, :] - tips[..., np.newaxis, :, :]
+        tip_distances = np.sqrt(np.sum(differences * differences, axis=-1))
+        
+        # Komşu parmak uçlarının bileğe göre (2B) açıları
+        vectors = tips[..., :2] - wrist[..., np.newaxis, :2]
+        magnitudes = np.sqrt(np.sum(vectors * vectors, axis=-1))
+        dots = np.sum(vectors[..., :-1, :] * vectors[..., 1:, :], axis=-1)
+        denominators = magnitudes[..., :-1] * magnitudes[..., 1:]
+        cos_angles = dots / np.where(denominators > 0, denominators, np.inf)
+        tip_angles = np.degrees(np.arccos(np.minimum(np.maximum(cos_angles, -1), 1)))
+        
+        return {
+            'fingers_extended': fingers_extended,
+            'finger_mask': finger_mask,
+            'thumb_direction': thumb_direction,
+            'tip_distances': tip_distances,
+            'tip_angles': tip_angles,
+            'tips_above_wrist': tips[..., 1] < wrist[..., np.newaxis, 1],
+            'pinky_near_ear': tips[..., 4, 1] < wrist[..., 1] - 0.1,
+            'thumb_pinky_down': (thumb_tip[..., 1] > wrist[..., 1]) & (tips[..., 4, 1] > wrist[..., 1]),
+            'thumb_inward': ((thumb_direction == 2) & (thumb_tip[..., 0] < wrist[..., 0])) |
+                            ((thumb_direction == 3) & (thumb_tip[..., 0] > wrist[..., 0]))
+        }
+    
     def visualize_gesture(self, frame, hand_landmarks, gesture_name):
         """
         El hareketi tanımayı görselleştirir.
@@ -378,9 +766,13 @@ class GestureRecognizer:
                   (10, 30), cv2.FONT_HERSHEY_COMPLEX, 0.8, (0, 255, 0), 2)
         
         # Parmak açık/kapalı durumu
-        fingers_extended = self._count_fingers_extended(hand_landmarks)
+        fingers_extended = self._extract_features(landmarks_to_array(hand_landmarks))['fingers_extended']
         fingers_text = "Parmaklar: " + "".join(["🖐️" if f else "👊" for f in fingers_extended])
         cv2.putText(frame, fingers_text, 
                   (10, 60), cv2.FONT_HERSHEY_COMPLEX, 0.6, (255, 0, 0), 2)
         
-        return frame 
\ No newline at end of file
+        return frame
+
+if __name__ == '__main__':
+    # Kural tablosunun derleme raporunu yazdır
+    print_rule_report(GestureRecognizer().rule_report)
@@ -0,0 +1,183 @@
+from collections import namedtuple
+import numpy as np
+
+from gesture_recognizer import landmarks_to_array
+
+# Onaylanmış hareket geçişi: iz kimliği, yeni hareket ("unknown" = hareket bitti) ve güven
+GestureEvent = namedtuple('GestureEvent', ['track_id', 'gesture', 'confidence'])
+
+class HandTrack:
+    """
+    Kareler boyunca aynı ele ait iz ve onun hareket durum makinesi.
+    """
+
+    def __init__(self, track_id, wrist):
+        self.track_id = track_id
+        self.wrist = wrist
+        self.missed = 0
+
+        # Onaylanmış hareket
+        self.gesture = "unknown"
+        self.confidence = 0.0
+
+        # Onay bekleyen aday hareket ve art arda görüldüğü kare sayısı
+        self.candidate = "unknown"
+        self.candidate_frames = 0
+
+        # Onaylanmış hareketin art arda görülmediği kare sayısı
+        self.exit_count = 0
+
+class HandTracker:
+    """
+    Elleri bilek konumlarına göre en yakın eşleştirme ile kareler arasında
+    izler ve her iz için giriş/çıkış histerezisli bir hareket durum makinesi
+    tutar. Titreşimden kaynaklanan tek karelik tanımalar olay üretmez; yalnızca
+    onaylanmış geçişler pop_events ile alınır.
+    """
+
+    def __init__(self, max_distance=0.15, max_missed=5, enter_confidence=0.7, exit_confidence=0.5,
+                 min_hold_frames=3, exit_frames=5):
+        """
+        Args:
+            max_distance: Aynı el sayılacak en büyük bilek yer değiştirmesi (normalize)
+            max_missed: Görülmeyen iz bu kadar kare sonra silinir
+            enter_confidence: Yeni hareketin aday sayılması için gereken güven
+            exit_confidence: Onaylanmış hareketin korunması için yeterli güven
+            min_hold_frames: Adayın onaylanması için art arda görülmesi gereken kare sayısı
+            exit_frames: Onaylanmış hareket bu kadar kare görülmezse biter
+        """
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.enter_confidence = enter_confidence
+        self.exit_confidence = exit_confidence
+        self.min_hold_frames = min_hold_frames
+        self.exit_frames = exit_frames
+
+        self.tracks = {}
+        self.next_id = 0
+        self.lost_ids = []
+        self.events = []
+
+    def assign(self, hands):
+        """
+        Bu karedeki elleri mevcut izlerle eşleştirir; eşleşmeyen ellere yeni
+        kimlik verilir, uzun süre görülmeyen izler silinir (kimlikleri lost_ids'te).
+
+        Args:
+            hands: MediaPipe el landmark listesi veya (H, 21, 3) dizi
+
+        Returns:
+            track_ids: Her ele karşılık gelen iz kimliği
+        """
+        if isinstance(hands, np.ndarray):
+            wrists = hands[:, 0, :2].astype(np.float64)
+        else:
+            wrists = np.array([landmarks_to_array(hand)[0, :2] for hand in hands]).reshape(-1, 2)
+        track_ids = [None] * len(wrists)
+        matched = set()
+
+        # Bilek mesafelerine göre açgözlü eşleştirme: en yakın çiftler önce
+        if self.tracks and len(wrists):
+            ids = list(self.tracks)
+            previous = np.array([self.tracks[track_id].wrist for track_id in ids])
+            distances = np.linalg.norm(previous[:, np.newaxis] - wrists[np.newaxis], axis=-1)
+            for flat in np.argsort(distances, axis=None):
+                row, column = divmod(int(flat), len(wrists))
+                if distances[row, column] > self.max_distance:
+                    break
+                if ids[row] in matched or track_ids[column] is not None:
+                    continue
+                track_ids[column] = ids[row]
+                matched.add(ids[row])
+
+        for column, wrist in enumerate(wrists):
+            if track_ids[column] is None:
+                track_ids[column] = self.next_id
+                self.tracks[self.next_id] = HandTrack(self.next_id, wrist)
+                matched.add(self.next_id)
+                self.next_id += 1
+            else:
+                track = self.tracks[track_ids[column]]
+                track.wrist = wrist
+                track.missed = 0
+
+        # Eşleşmeyen izler yaşlanır; silinen izin hareketi biter
+        self.lost_ids = []
+        for track_id in list(self.tracks):
+            if track_id in matched:
+                continue
+            track = self.tracks[track_id]
+            track.missed += 1
+            if track.missed > self.max_missed:
+                if track.gesture != "unknown":
+                    self.events.append(GestureEvent(track_id, "unknown", 0.0))
+                del self.tracks[track_id]
+                self.lost_ids.append(track_id)
+
+        return track_ids
+
+    def observe(self, track_id, gesture_name, confidence):
+        """
+        İzin bu karedeki ham tanıma sonucunu durum makinesine verir.
+        """
+        track = self.tracks[track_id]
+
+        # Onaylanmış hareket daha düşük eşikle korunur (çıkış histerezisi)
+        if track.gesture != "unknown" and gesture_name == track.gesture and confidence >= self.exit_confidence:
+            track.confidence = confidence
+            track.exit_count = 0
+            track.candidate = "unknown"
+            track.candidate_frames = 0
+            return
+
+        # Yeni hareket aday olmak için daha yüksek eşiği geçmeli (giriş histerezisi)
+        if gesture_name != "unknown" and confidence >= self.enter_confidence:
+            if gesture_name == track.candidate:
+                track.candidate_frames += 1
+            else:
+                track.candidate = gesture_name
+                track.candidate_frames = 1
+        else:
+            track.candidate = "unknown"
+            track.candidate_frames = 0
+
+        if track.candidate != "unknown" and track.candidate_frames >= self.min_hold_frames:
+            self._confirm(track, track.candidate, confidence)
+        elif track.gesture != "unknown":
+            track.exit_count += 1
+            if track.exit_count >= self.exit_frames:
+                self._confirm(track, "unknown", 0.0)
+
+    def trigger(self, track_id, gesture_name, confidence):
+        """
+        Kendi tanıyıcısı tarafından zaten onaylanmış anlık bir hareketi (ör. el
+        sallama) doğrudan onaylar; hareket görülmedikçe çıkış histerezisiyle biter.
+        """
+        self._confirm(self.tracks[track_id], gesture_name, confidence)
+
+    def _confirm(self, track, gesture_name, confidence):
+        track.gesture = gesture_name
+        track.confidence = confidence
+        track.candidate = "unknown"
+        track.candidate_frames = 0
+        track.exit_count = 0
+        self.events.append(GestureEvent(track.track_id, gesture_name, confidence))
+
+    def pop_events(self):
+        """
+        Son çağrıdan bu yana onaylanan geçişleri döndürür ve listeyi boşaltır.
+        """
+        events, self.events = self.events, []
+        return events
+
+    def active_gestures(self):
+        """
+        Onaylanmış hareketi olan izler, kimliğe göre sıralı (iz kimliği, hareket, güven) listesi.
+        """
+        return [(track_id, track.gesture, track.confidence) for track_id, track in sorted(self.tracks.items())
+                if track.gesture != "unknown"]
+
+    def reset(self):
+        self.tracks.clear()
+        self.lost_ids = []
+        self.events = []
@@ -0,0 +1,166 @@
+import os
+import json
+import itertools
+import numpy as np
+
+from dataset_shards import split_sharded_dataset
+from parallel_training import prepare_shared_dataset, run_parallel, train_candidate
+
+def sample_configurations(search_space, num_trials, seed=42):
+    """
+    Arama uzayından rastgele ve tekrarsız yapılandırmalar seçer.
+
+    Args:
+        search_space: Parametre adı -> olası değerler listesi
+        num_trials: Seçilecek yapılandırma sayısı (ızgaradan büyükse tüm ızgara)
+        seed: Rastgele tohum
+
+    Returns:
+        configurations: Yapılandırma sözlükleri listesi
+    """
+    names = sorted(search_space)
+    grid = list(itertools.product(*(search_space[name] for name in names)))
+
+    rng = np.random.default_rng(seed)
+    chosen = rng.permutation(len(grid))[:min(num_trials, len(grid))]
+    return [dict(zip(names, grid[i])) for i in chosen]
+
+def _pareto_front(results):
+    """
+    Doğruluk-gecikme dengesinde başka bir deneme tarafından geçilmeyen denemeleri
+    işaretler (hem daha doğru hem daha hızlı bir deneme yoksa).
+    """
+    for result in results:
+        result['pareto'] = not any(
+            other['val_accuracy'] >= result['val_accuracy'] and other['latency_ms_p50'] < result['latency_ms_p50']
+            or other['val_accuracy'] > result['val_accuracy'] and other['latency_ms_p50'] <= result['latency_ms_p50']
+            for other in results
+        )
+
+def print_leaderboard(results, top=20):
+    """
+    Denemeleri doğruluğa göre sıralı olarak yazdırır. Doğruluk-gecikme
+    dengesinde en iyi olanlar '*' ile işaretlenir.
+    """
+    print(f"\n{'':2}{'Deneme':>6} {'Doğruluk':>9} {'p50 (ms)':>9} {'Parametre':>11} {'Dönem':>6}  Ayarlar")
+    for result in results[:top]:
+        config = result['config']
+        settings = ', '.join(f"{name}={config[name]}" for name in sorted(config))
+        print(f"{'*' if result['pareto'] else '':2}{result['trial']:>6} {result['val_accuracy']:9.4f} "
+              f"{result['latency_ms_p50']:9.2f} {result['params']:11,} {result['epochs']:>6}  {settings}")
+
+def _trial_task(trial, config, dataset_dir, train_indices, val_indices, epochs, output_dir, seed, initial_epoch=0):
+    task = dict(config)
+    task.update({
+        'dataset_dir': dataset_dir,
+        'train_indices': train_indices,
+        'val_indices': val_indices,
+        'epochs': epochs,
+        'initial_epoch': initial_epoch,
+        'model_path': os.path.join(output_dir, f"trial_{trial}.h5"),
+        'seed': seed + trial
+    })
+    return task
+
+def _run_trials(trials, configurations, tasks, workers, threads_per_worker):
+    results = []
+    for i, result in run_parallel(train_candidate, tasks, workers=workers, threads_per_worker=threads_per_worker):
+        result.update({'trial': trials[i], 'config': configurations[i]})
+        print(f"Deneme {trials[i]}: doğruluk {result['val_accuracy']:.4f} ({result['epochs']} dönem)")
+        results.append(result)
+    return results
+
+def _measure_latencies(results, output_dir):
+    """
+    Deneme modellerinin CPU gecikmesini ana süreçte sırayla ölçer. Çalışanlar
+    eğitim sırasında çekirdekleri paylaştığı için ölçüm orada güvenilir olmaz.
+    """
+    from model import load_trained_model, measure_inference_latency
+
+    print("\nDeneme modellerinin gecikmesi ölçülüyor...")
+    for result in results:
+        model = load_trained_model(os.path.join(output_dir, f"trial_{result['trial']}.h5"))
+        result.update(measure_inference_latency(model))
+
+def run_search(data_dir, dataset_dir, search_space, output_dir, method='random', num_trials=8, epochs=10,
+               min_epochs=2, eta=3, test_size=0.2, workers=2, threads_per_worker=None, seed=42):
+    """
+    Hiperparametre aramasını yerel süreç havuzunda çalıştırır.
+
+    Veri seti bir kez en büyük aday görüntü boyutunda parçalı biçime çözümlenir;
+    çalışanlar parçaları salt okunur belleğe eşleyerek paylaşır ve küçük aday
+    boyutlarına batch sırasında ölçekler.
+
+    Args:
+        data_dir: Veri setinin yolu
+        dataset_dir: Paylaşılan parçalı veri setinin klasörü
+        search_space: Parametre adı -> olası değerler (arch, width_multiplier,
+            learning_rate, batch_size, image_size, augment)
+        output_dir: Deneme modellerinin ve skor tablosunun yazılacağı klasör
+        method: 'random' (her deneme epochs dönem) veya 'halving' (ardışık yarılama)
+        num_trials: Deneme sayısı
+        epochs: Denemelerin en fazla dönem sayısı
+        min_epochs: Ardışık yarılamada ilk turun dönem sayısı
+        eta: Ardışık yarılamada her turda tutulan oran (1/eta) ve dönem çarpanı
+        test_size: Doğrulama seti oranı
+        workers: Paralel süreç sayısı
+        threads_per_worker: Süreç başına iş parçacığı sayısı
+        seed: Rastgele tohum
+
+    Returns:
+        results: Doğruluğa göre sıralı deneme sonuçları
+    """
+    max_image_size = max(search_space['image_size'])
+    dataset = prepare_shared_dataset(data_dir, dataset_dir, (max_image_size, max_image_size))
+    train_indices, val_indices = split_sharded_dataset(dataset, test_size=test_size)
+    os.makedirs(output_dir, exist_ok=True)
+
+    configurations = sample_configurations(search_space, num_trials, seed)
+    trials = list(range(len(configurations)))
+
+    if method == 'random':
+        tasks = [_trial_task(trial, configurations[trial], dataset_dir, train_indices, val_indices, epochs,
+                             output_dir, seed) for trial in trials]
+        results = _run_trials(trials, configurations, tasks, workers, threads_per_worker)
+    elif method == 'halving':
+        # Her turda en iyi 1/eta deneme tutulur ve dönem bütçesi eta ile çarpılır;
+        # hayatta kalan denemeler kaydedilen modelden devam eder
+        final_results = {}
+        rung_epochs = min(min_epochs, epochs)
+        completed_epochs = 0
+        alive = trials
+
+        while True:
+            print(f"\nTur: {len(alive)} deneme, {rung_epochs} döneme kadar")
+            tasks = [_trial_task(trial, configurations[trial], dataset_dir, train_indices, val_indices, rung_epochs,
+                                 output_dir, seed, initial_epoch=completed_epochs) for trial in alive]
+            rung_results = _run_trials(alive, [configurations[trial] for trial in alive], tasks, workers,
+                                       threads_per_worker)
+            for result in rung_results:
+                final_results[result['trial']] = result
+
+            if rung_epochs >= epochs or len(alive) <= 1:
+                break
+
+            rung_results.sort(key=lambda result: result['val_accuracy'], reverse=True)
+            alive = [result['trial'] for result in rung_results[:max(1, len(rung_results) // eta)]]
+            completed_epochs = rung_epochs
+            rung_epochs = min(epochs, rung_epochs * eta)
+
+        results = list(final_results.values())
+    else:
+        raise ValueError(f"Bilinmeyen arama yöntemi: {method}")
+
+    _measure_latencies(results, output_dir)
+
+    # Daha uzun eğitilen denemeler aynı doğrulukta öne geçer
+    results.sort(key=lambda result: (result['val_accuracy'], result['epochs']), reverse=True)
+    _pareto_front(results)
+    print_leaderboard(results)
+
+    leaderboard_path = os.path.join(output_dir, 'leaderboard.json')
+    with open(leaderboard_path, 'w') as f:
+        json.dump({'method': method, 'search_space': search_space, 'results': results}, f, indent=2)
+    print(f"\nSkor tablosu kaydedildi: {leaderboard_path}")
+
+    return results
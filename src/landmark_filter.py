@@ -0,0 +1,95 @@
+import numpy as np
+
+class OneEuroFilter:
+    """
+    Landmark titreşimini azaltan One-Euro filtresi (Casiez vd., 2012). Yavaş
+    hareketlerde kesim frekansı düşük kalıp titreşimi bastırır, hızlı hareketlerde
+    artarak gecikmeyi azaltır. Tüm ellerin (H, 21, 3) noktaları tek seferde
+    NumPy ile filtrelenir; her elin durumu iz kimliğiyle saklanır.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=10.0, d_cutoff=1.0, capacity=4):
+        """
+        Args:
+            min_cutoff: Durağan eldeki en düşük kesim frekansı (Hz); küçüldükçe daha çok yumuşatır
+            beta: Hıza bağlı kesim artışı; büyüdükçe hızlı harekette gecikme azalır
+            d_cutoff: Hız tahmininin kesim frekansı (Hz)
+            capacity: Başlangıçta yer ayrılan el sayısı (gerekirse büyütülür)
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+
+        # İz kimliği -> durum dizilerindeki satır
+        self.slots = {}
+        self.values = np.zeros((capacity, 21, 3))
+        self.derivatives = np.zeros((capacity, 21, 3))
+        self.timestamps = np.zeros(capacity)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * np.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _slot(self, track_id):
+        slot = self.slots.get(track_id)
+        if slot is None:
+            used = set(self.slots.values())
+            slot = next((index for index in range(len(self.timestamps)) if index not in used), None)
+            if slot is None:
+                # Kapasite dolduysa durum dizileri iki katına çıkarılır
+                slot = len(self.timestamps)
+                self.values = np.concatenate((self.values, np.zeros_like(self.values)))
+                self.derivatives = np.concatenate((self.derivatives, np.zeros_like(self.derivatives)))
+                self.timestamps = np.concatenate((self.timestamps, np.zeros_like(self.timestamps)))
+            self.slots[track_id] = slot
+        return slot
+
+    def __call__(self, points, track_ids, timestamp):
+        """
+        Bu karedeki ellerin landmark noktalarını filtreler.
+
+        Args:
+            points: (H, 21, 3) landmark dizisi
+            track_ids: Her elin iz kimliği
+            timestamp: Karenin zamanı (saniye)
+
+        Returns:
+            filtered: (H, 21, 3) filtrelenmiş noktalar
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) == 0:
+            return points
+
+        is_new = np.array([track_id not in self.slots for track_id in track_ids])
+        slots = np.array([self._slot(track_id) for track_id in track_ids])
+
+        previous = self.values[slots]
+        previous_derivative = self.derivatives[slots]
+        dt = np.maximum(timestamp - self.timestamps[slots], 1e-3)[:, np.newaxis, np.newaxis]
+
+        # Hız tahmini de düşük geçiren filtreden geçirilir
+        derivative = (points - previous) / dt
+        derivative = previous_derivative + self._alpha(self.d_cutoff, dt) * (derivative - previous_derivative)
+
+        # Hıza göre uyarlanan kesim frekansı
+        cutoff = self.min_cutoff + self.beta * np.abs(derivative)
+        filtered = previous + self._alpha(cutoff, dt) * (points - previous)
+
+        # Yeni izler ilk karede filtrelenmeden başlar
+        filtered[is_new] = points[is_new]
+        derivative[is_new] = 0.0
+
+        self.values[slots] = filtered
+        self.derivatives[slots] = derivative
+        self.timestamps[slots] = timestamp
+        return filtered
+
+    def reset(self, track_id=None):
+        """
+        Bir izin (veya tüm izlerin) filtre durumunu siler.
+        """
+        if track_id is None:
+            self.slots.clear()
+        else:
+            self.slots.pop(track_id, None)
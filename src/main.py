@@ -1,6 +1,14 @@
 import os
+import sys
 import argparse
 import pickle
+
+# oneDNN ayarı TensorFlow yüklenirken okunur, bu yüzden içe aktarmadan önce uygulanmalı
+if '--onednn' in sys.argv:
+    os.environ['TF_ENABLE_ONEDNN_OPTS'] = '1'
+elif '--no-onednn' in sys.argv:
+    os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+
 import numpy as np
 import cv2
 import tensorflow as tf
@@ -8,7 +16,19 @@ from tensorflow.keras.models import load_model
 
 # Kendi modüllerimizi içe aktarın
 from data_processor import prepare_data_for_training
-from model import create_model, train_model, evaluate_model, plot_training_history, load_trained_model
+from model import (configure_cpu_training, create_model, train_model, train_model_on_sequence, evaluate_model,
+                   evaluate_model_on_sequence, plot_training_history, load_trained_model, save_model_report,
+                   measure_inference_latency, checkpoint_directory, load_training_state)
+from dataset_dedup import find_dataset_duplicates
+from distillation import distill_model
+from model_optimization import optimize_model, model_statistics
+from hyperparameter_search import run_search
+from cross_validation import run_cross_validation
+from model_export import export_saved_model, load_exported_model
+from evaluation import evaluate_predictor
+from dataset_manifest import (build_manifest, save_manifest, load_manifest, print_manifest_statistics,
+                              manifest_samples, split_manifest, ClassBalancedSampler, ManifestSequence)
+from dataset_shards import build_sharded_dataset, update_sharded_dataset, ShardedDataset, ShardedSequence, split_sharded_dataset
 from predictor import ASLPredictor, start_webcam_prediction, predict_from_image
 
 def train(args):
@@ -18,6 +38,37 @@ def train(args):
     Args:
         args: Komut satırı argümanları
     """
+    # CPU iş parçacığı ayarları TensorFlow işlem çalıştırmadan önce yapılmalı
+    if args.intra_op_threads or args.inter_op_threads:
+        configure_cpu_training(args.intra_op_threads, args.inter_op_threads)
+    
+    # Devam ederken önceki çalıştırmanın tohumu ve kontrol noktasının yapısını
+    # belirleyen seçenekleri kullanılır; böylece veri bölme, çoğaltma ve model aynı kalır
+    if args.resume:
+        state = load_training_state(checkpoint_directory(args.model_path))
+        if state and state.get('seed') is not None:
+            args.seed = state['seed']
+        for option, value in (state or {}).get('options', {}).items():
+            if getattr(args, option, value) != value:
+                print(f"Uyarı: --{option.replace('_', '-')} kontrol noktasındaki değerle ({value}) devam ediliyor.")
+                setattr(args, option, value)
+    if args.seed is None:
+        args.seed = int(np.random.SeedSequence().entropy % (2 ** 31))
+    
+    # Dropout katmanları tf.random.Generator kullanır; üreteç durumu model kontrol
+    # noktasına yazılır ve devam ederken işlem tohumları baştan başlamaz
+    tf.keras.backend.experimental.enable_tf_random_generator()
+    tf.keras.utils.set_random_seed(args.seed)
+    print(f"Rastgele tohum: {args.seed}")
+    
+    if args.dataset_dir:
+        train_from_shards(args)
+        return
+    
+    if args.sampling:
+        train_from_manifest(args)
+        return
+    
     print(f"Veri seti yükleniyor: {args.data_dir}")
     
     # Veriyi hazırla
@@ -25,7 +76,8 @@ def train(args):
         args.data_dir,
         image_size=(args.image_size, args.image_size),
         test_size=args.test_size,
-        apply_augmentation=args.augment
+        apply_augmentation=args.augment,
+        duplicates=args.duplicates
     )
     
     # Model giriş şeklini belirle
@@ -36,7 +88,7 @@ def train(args):
     
     # Modeli oluştur
     print("Model oluşturuluyor...")
-    model = create_model(input_shape, num_classes)
+    model = create_model(input_shape, num_classes, arch=args.arch, width_multiplier=args.width_multiplier)
     model.summary()
     
     # Modeli eğit
@@ -47,7 +99,8 @@ def train(args):
         X_test, y_test,
         batch_size=args.batch_size,
         epochs=args.epochs,
-        model_save_path=args.model_path
+        model_save_path=args.model_path,
+        **training_options(args)
     )
     
     # Eğitim geçmişini çizdir
@@ -55,16 +108,484 @@ def train(args):
     
     # Modeli değerlendir
     print("Model değerlendiriliyor...")
-    evaluate_model(trained_model, X_test, y_test)
+    test_loss, test_acc = evaluate_model(trained_model, X_test, y_test)
+    save_model_report(trained_model, args.model_path, test_acc, test_loss, extra=architecture_info(args))
+    
+    save_label_encoder(label_encoder, args.model_path)
+
+# Kontrol noktasının yapısını belirleyen ve devam ederken kontrol noktasından alınan seçenekler
+# (xla ve accumulation_steps eğitim döngüsü tarafından eklenir)
+RESUME_OPTIONS = ('arch', 'width_multiplier', 'image_size')
+
+def training_options(args):
+    """
+    Komut satırı argümanlarından ortak eğitim seçeneklerini oluşturur.
+    
+    Args:
+        args: Komut satırı argümanları
+        
+    Returns:
+        options: train_model/train_model_on_sequence için anahtar kelime argümanları
+    """
+    return {
+        'jit_compile': args.xla,
+        'accumulation_steps': args.accumulation_steps,
+        'report_throughput': args.throughput,
+        'profile_steps': tuple(args.profile_steps) if args.profile else None,
+        'checkpoint_every': args.checkpoint_every,
+        'resume': args.resume,
+        'seed': args.seed,
+        'run_options': {option: getattr(args, option) for option in RESUME_OPTIONS}
+    }
+
+def architecture_info(args):
+    """
+    Model raporuna eklenecek mimari bilgilerini döndürür.
+    """
+    return {'arch': args.arch, 'width_multiplier': args.width_multiplier}
+
+def train_from_shards(args):
+    """
+    Modeli belleğe eşlenmiş parçalı veri setinden (build-dataset çıktısı) eğitir.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    print(f"Parçalı veri seti açılıyor: {args.dataset_dir}")
+    dataset = ShardedDataset(args.dataset_dir)
+    train_indices, test_indices = split_sharded_dataset(dataset, test_size=args.test_size)
+    
+    print(f"Toplam {len(dataset)} görüntü (parçalardan).")
+    print(f"Eğitim seti: {len(train_indices)} örnek")
+    print(f"Test seti: {len(test_indices)} örnek")
+    print(f"Sınıf sayısı: {dataset.num_classes}")
+    
+    if args.duplicates:
+        print("Uyarı: --duplicates parçalı veri setiyle desteklenmiyor, yakın kopyalar ayıklanmayacak.")
+    
+    # Sınıf dengeli örnekleme isteğe bağlıdır
+    sampler = None
+    if args.sampling:
+        sampler = ClassBalancedSampler(dataset.labels[train_indices], mode=args.sampling, seed=args.seed + 1)
+        print(f"Sınıf dengeli örnekleme: {args.sampling}")
+    
+    train_sequence = ShardedSequence(dataset, train_indices, batch_size=args.batch_size, shuffle=True, seed=args.seed,
+                                     sampler=sampler, augment=args.augment)
+    test_sequence = ShardedSequence(dataset, test_indices, batch_size=args.batch_size, shuffle=False)
+    
+    # Model giriş şekli parçalardaki görüntü boyutundan alınır
+    print("Model oluşturuluyor...")
+    model = create_model(tuple(dataset.image_shape), dataset.num_classes, arch=args.arch,
+                         width_multiplier=args.width_multiplier)
+    model.summary()
+    
+    print("Model eğitiliyor...")
+    history, trained_model = train_model_on_sequence(
+        model,
+        train_sequence,
+        test_sequence,
+        epochs=args.epochs,
+        model_save_path=args.model_path,
+        **training_options(args)
+    )
+    
+    plot_training_history(history)
+    
+    print("Model değerlendiriliyor...")
+    test_loss, test_acc = evaluate_model_on_sequence(trained_model, test_sequence)
+    save_model_report(trained_model, args.model_path, test_acc, test_loss, extra=architecture_info(args))
+    
+    save_label_encoder(dataset.label_encoder(), args.model_path)
+
+def train_from_manifest(args):
+    """
+    Modeli, veri setini belleğe yüklemeden, manifest üzerinden diskten akışla
+    ve sınıf dengeli batch'lerle eğitir.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    if args.manifest:
+        manifest = load_manifest(args.manifest)
+    else:
+        manifest = build_manifest(args.data_dir)
+    print_manifest_statistics(manifest)
+    
+    (train_paths, train_labels), (test_paths, test_labels) = split_manifest(manifest, test_size=args.test_size)
+    num_classes = len(manifest['classes'])
+    image_size = (args.image_size, args.image_size)
+    
+    print(f"Eğitim seti: {len(train_paths)} örnek")
+    print(f"Test seti: {len(test_paths)} örnek")
+    print(f"Sınıf dengeli örnekleme: {args.sampling}")
+    
+    if args.augment or args.duplicates:
+        print("Uyarı: --augment ve --duplicates akışlı eğitimde desteklenmiyor.")
+    
+    sampler = ClassBalancedSampler(train_labels, mode=args.sampling, seed=args.seed + 1)
+    train_sequence = ManifestSequence(train_paths, train_labels, num_classes, image_size=image_size,
+                                      batch_size=args.batch_size, sampler=sampler, grayscale=args.grayscale)
+    test_sequence = ManifestSequence(test_paths, test_labels, num_classes, image_size=image_size,
+                                     batch_size=args.batch_size, grayscale=args.grayscale)
+    
+    print("Model oluşturuluyor...")
+    channels = 1 if args.grayscale else 3
+    model = create_model((args.image_size, args.image_size, channels), num_classes, arch=args.arch,
+                         width_multiplier=args.width_multiplier)
+    model.summary()
+    
+    print("Model eğitiliyor...")
+    history, trained_model = train_model_on_sequence(
+        model,
+        train_sequence,
+        test_sequence,
+        epochs=args.epochs,
+        model_save_path=args.model_path,
+        **training_options(args)
+    )
+    
+    plot_training_history(history)
+    
+    print("Model değerlendiriliyor...")
+    test_loss, test_acc = evaluate_model_on_sequence(trained_model, test_sequence)
+    save_model_report(trained_model, args.model_path, test_acc, test_loss, extra=architecture_info(args))
     
+    from sklearn.preprocessing import LabelEncoder
+    label_encoder = LabelEncoder()
+    label_encoder.fit(manifest['classes'])
+    save_label_encoder(label_encoder, args.model_path)
+
+def save_label_encoder(label_encoder, model_path):
+    """
+    Etiket kodlayıcıyı modelin yanına kaydeder.
+    
+    Args:
+        label_encoder: Etiket kodlayıcı
+        model_path: Model dosya yolu
+    """
     # Etiket kodlayıcıyı kaydet
-    label_encoder_path = os.path.join(os.path.dirname(args.model_path), 'label_encoder.pkl')
+    label_encoder_path = os.path.join(os.path.dirname(model_path), 'label_encoder.pkl')
     with open(label_encoder_path, 'wb') as f:
         pickle.dump(label_encoder, f)
     
-    print(f"Model kaydedildi: {args.model_path}")
+    print(f"Model kaydedildi: {model_path}")
     print(f"Etiket kodlayıcı kaydedildi: {label_encoder_path}")
 
+def distill(args):
+    """
+    Eğitilmiş modeli (öğretmen) daha küçük bir öğrenci modele damıtan fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    teacher = load_trained_model(args.teacher_path)
+    input_shape = tuple(teacher.input_shape[1:])
+    
+    if input_shape[-1] != 3:
+        print("Hata: Damıtma yalnızca renkli (3 kanallı) öğretmen modellerle desteklenir.")
+        return
+    
+    # Öğrenci, öğretmenle aynı girdiyi görmeli
+    image_size = (input_shape[1], input_shape[0])
+    print(f"Veri seti yükleniyor: {args.data_dir}")
+    X_train, X_test, y_train, y_test, label_encoder, num_classes = prepare_data_for_training(
+        args.data_dir,
+        image_size=image_size,
+        test_size=args.test_size,
+        apply_augmentation=args.augment
+    )
+    
+    if num_classes != teacher.output_shape[-1]:
+        print(f"Hata: Veri setinde {num_classes} sınıf var, öğretmen model {teacher.output_shape[-1]} sınıf bekliyor.")
+        return
+    
+    print("Öğrenci model oluşturuluyor...")
+    student = create_model(input_shape, num_classes, arch=args.arch, width_multiplier=args.width_multiplier)
+    student.summary()
+    
+    print(f"Öğrenci model damıtılıyor (sıcaklık={args.temperature}, alpha={args.alpha})...")
+    history, student = distill_model(
+        teacher, student,
+        X_train, y_train,
+        X_test, y_test,
+        temperature=args.temperature,
+        alpha=args.alpha,
+        batch_size=args.batch_size,
+        epochs=args.epochs,
+        model_save_path=args.model_path
+    )
+    
+    plot_training_history(history, save_path=os.path.join(os.path.dirname(args.model_path), 'distillation_history.png'))
+    
+    # Öğretmen ve öğrenciyi aynı test seti üzerinde karşılaştır
+    print("Öğretmen model değerlendiriliyor...")
+    teacher_loss, teacher_acc = evaluate_model(teacher, X_test, y_test)
+    teacher_latency = measure_inference_latency(teacher)
+    
+    print("Öğrenci model değerlendiriliyor...")
+    student_loss, student_acc = evaluate_model(student, X_test, y_test)
+    report = save_model_report(student, args.model_path, student_acc, student_loss, extra={
+        'arch': args.arch,
+        'width_multiplier': args.width_multiplier,
+        'teacher_path': args.teacher_path,
+        'temperature': args.temperature,
+        'alpha': args.alpha,
+        'teacher_params': int(teacher.count_params()),
+        'teacher_test_accuracy': float(teacher_acc),
+        'teacher_latency_ms_p50': teacher_latency['latency_ms_p50'],
+        'teacher_latency_ms_p90': teacher_latency['latency_ms_p90']
+    })
+    
+    print(f"{'':10} {'Doğruluk':>10} {'Parametre':>12} {'p50 (ms)':>10}")
+    print(f"{'Öğretmen':10} {teacher_acc:10.4f} {teacher.count_params():12,} {teacher_latency['latency_ms_p50']:10.2f}")
+    print(f"{'Öğrenci':10} {student_acc:10.4f} {student.count_params():12,} {report['latency_ms_p50']:10.2f}")
+    
+    save_label_encoder(label_encoder, args.model_path)
+
+def optimize(args):
+    """
+    Eğitilmiş modeli budayan veya kümeleyen, ince ayar yapıp kaydeden fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    model = load_trained_model(args.model_path)
+    input_shape = tuple(model.input_shape[1:])
+    
+    if input_shape[-1] != 3:
+        print("Hata: Optimizasyon yalnızca renkli (3 kanallı) modellerle desteklenir.")
+        return
+    
+    print(f"Veri seti yükleniyor: {args.data_dir}")
+    X_train, X_test, y_train, y_test, label_encoder, num_classes = prepare_data_for_training(
+        args.data_dir,
+        image_size=(input_shape[1], input_shape[0]),
+        test_size=args.test_size,
+        apply_augmentation=False
+    )
+    
+    if num_classes != model.output_shape[-1]:
+        print(f"Hata: Veri setinde {num_classes} sınıf var, model {model.output_shape[-1]} sınıf bekliyor.")
+        return
+    
+    print("Orijinal model değerlendiriliyor...")
+    original_loss, original_acc = evaluate_model(model, X_test, y_test)
+    original = model_statistics(model)
+    original['test_accuracy'] = float(original_acc)
+    
+    print(f"Model optimize ediliyor ({args.method})...")
+    optimized_model = optimize_model(
+        model, args.method,
+        X_train, y_train,
+        X_test, y_test,
+        sparsity=args.sparsity,
+        num_clusters=args.clusters,
+        batch_size=args.batch_size,
+        epochs=args.epochs
+    )
+    
+    os.makedirs(os.path.dirname(os.path.abspath(args.output_path)), exist_ok=True)
+    optimized_model.save(args.output_path, include_optimizer=False)
+    
+    print("Optimize edilmiş model değerlendiriliyor...")
+    optimized_loss, optimized_acc = evaluate_model(optimized_model, X_test, y_test)
+    optimized = model_statistics(optimized_model)
+    
+    print(f"{'':22} {'Önce':>14} {'Sonra':>14}")
+    print(f"{'Doğruluk':22} {original_acc:14.4f} {optimized_acc:14.4f}")
+    for key, title in (('params', 'Parametre'), ('nonzero_params', 'Sıfır olmayan ağırlık'),
+                       ('file_size_bytes', 'Dosya boyutu (bayt)'), ('compressed_size_bytes', 'Sıkıştırılmış (bayt)')):
+        print(f"{title:22} {original[key]:14,} {optimized[key]:14,}")
+    print(f"{'p50 gecikme (ms)':22} {original['latency_ms_p50']:14.2f} {optimized['latency_ms_p50']:14.2f}")
+    
+    save_model_report(optimized_model, args.output_path, optimized_acc, optimized_loss, extra={
+        'source_model': args.model_path,
+        'method': args.method,
+        'sparsity': args.sparsity if args.method != 'cluster' else None,
+        'clusters': args.clusters if args.method == 'cluster' else None,
+        'nonzero_params': optimized['nonzero_params'],
+        'file_size_bytes': optimized['file_size_bytes'],
+        'compressed_size_bytes': optimized['compressed_size_bytes'],
+        'original': original
+    })
+    
+    save_label_encoder(label_encoder, args.output_path)
+
+def tune(args):
+    """
+    Hiperparametre aramasını paralel süreçlerde çalıştıran fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    search_space = {
+        'arch': args.archs,
+        'width_multiplier': args.width_multipliers,
+        'learning_rate': args.learning_rates,
+        'batch_size': args.batch_sizes,
+        'image_size': args.image_sizes,
+        'augment': [False, True] if args.search_augment else [False]
+    }
+    
+    print(f"Hiperparametre araması ({args.method}): {args.data_dir}")
+    run_search(
+        args.data_dir,
+        args.dataset_dir,
+        search_space,
+        args.output_dir,
+        method=args.method,
+        num_trials=args.trials,
+        epochs=args.epochs,
+        min_epochs=args.min_epochs,
+        eta=args.eta,
+        test_size=args.test_size,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        seed=args.seed
+    )
+
+def cv(args):
+    """
+    Katmanlı k-katlı çapraz doğrulamayı paralel süreçlerde çalıştıran fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    print(f"{args.folds} katlı çapraz doğrulama: {args.data_dir}")
+    run_cross_validation(
+        args.data_dir,
+        args.dataset_dir,
+        args.output_dir,
+        folds=args.folds,
+        image_size=args.image_size,
+        arch=args.arch,
+        width_multiplier=args.width_multiplier,
+        learning_rate=args.learning_rate,
+        batch_size=args.batch_size,
+        epochs=args.epochs,
+        augment=args.augment,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        seed=args.seed
+    )
+
+def export(args):
+    """
+    Modeli ön işleme ve etiket sözlüğü gömülü bir SavedModel olarak dışa aktaran fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    label_encoder_path = os.path.join(os.path.dirname(args.model_path), 'label_encoder.pkl')
+    try:
+        with open(label_encoder_path, 'rb') as f:
+            label_encoder = pickle.load(f)
+    except FileNotFoundError:
+        print(f"Hata: Etiket kodlayıcı bulunamadı: {label_encoder_path}")
+        return
+    
+    model = load_trained_model(args.model_path)
+    export_saved_model(model, label_encoder.classes_, args.export_dir)
+    print(f"SavedModel kaydedildi: {args.export_dir}")
+    
+    # Gömülü ön işlemenin ASLPredictor ile aynı sonucu verdiğini doğrula
+    predictor = ASLPredictor(args.model_path, label_encoder)
+    sample = np.random.default_rng(0).integers(0, 256, size=(120, 100, 3), dtype=np.uint8)
+    expected = predictor.model.predict(predictor.preprocess_image(sample), verbose=0)[0]
+    
+    loaded = load_exported_model(args.export_dir)
+    outputs = loaded.signatures['serving_default'](images=tf.constant(sample[np.newaxis]))
+    difference = float(np.abs(outputs['probabilities'].numpy()[0] - expected).max())
+    
+    print(f"Sunum imzası: uint8 [None, None, None, 3] (BGR) -> probabilities, class_index, class_name, confidence")
+    print(f"ASLPredictor ile en büyük olasılık farkı: {difference:.2e}")
+
+def evaluate(args):
+    """
+    Modeli, test setini diskten akışla okuyarak ASLPredictor'ın tam son
+    işlemesiyle değerlendiren fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    label_encoder_path = os.path.join(os.path.dirname(args.model_path), 'label_encoder.pkl')
+    try:
+        with open(label_encoder_path, 'rb') as f:
+            label_encoder = pickle.load(f)
+    except FileNotFoundError:
+        print(f"Hata: Etiket kodlayıcı bulunamadı: {label_encoder_path}")
+        return
+    
+    if args.manifest:
+        dataset_manifest = load_manifest(args.manifest)
+    else:
+        dataset_manifest = build_manifest(args.data_dir)
+    
+    # Varsayılan olarak manifest ile eğitimdeki test bölmesi kullanılır
+    if args.all:
+        paths, labels = manifest_samples(dataset_manifest)
+    else:
+        _, (paths, labels) = split_manifest(dataset_manifest, test_size=args.test_size)
+    label_names = [dataset_manifest['classes'][code] for code in labels]
+    print(f"{len(paths)} görüntü değerlendirilecek")
+    
+    predictor = ASLPredictor(args.model_path, label_encoder, use_grayscale=args.grayscale)
+    evaluate_predictor(predictor, paths, label_names, batch_size=args.batch_size, output_dir=args.output_dir)
+
+def build_dataset(args):
+    """
+    Veri setini belleğe eşlenebilir parçalara dönüştüren fonksiyon.
+    Parçalı veri seti zaten varsa yalnızca eklenen/silinen/değişen dosyalar işlenir.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    image_size = (args.image_size, args.image_size)
+    
+    if args.rebuild:
+        print(f"Parçalı veri seti baştan oluşturuluyor: {args.data_dir} -> {args.output_dir}")
+        build_sharded_dataset(args.data_dir, args.output_dir, image_size=image_size, shard_size=args.shard_size)
+        return
+    
+    print(f"Parçalı veri seti güncelleniyor: {args.data_dir} -> {args.output_dir}")
+    report = update_sharded_dataset(args.data_dir, args.output_dir, image_size=image_size, shard_size=args.shard_size)
+    
+    # Değişiklikleri raporla
+    for kind, title in (('added', 'Eklenen'), ('removed', 'Silinen'), ('changed', 'Değişen')):
+        if report[kind] and not report['rebuilt']:
+            print(f"{title} dosyalar:")
+            for relative_path in report[kind]:
+                print(f"  {relative_path}")
+
+def manifest(args):
+    """
+    Görüntüleri çözümlemeden veri seti manifesti oluşturan fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    dataset_manifest = build_manifest(args.data_dir)
+    print_manifest_statistics(dataset_manifest)
+    
+    if args.output:
+        save_manifest(dataset_manifest, args.output)
+        print(f"Manifest kaydedildi: {args.output}")
+
+def dedup(args):
+    """
+    Veri setindeki kopya ve yakın kopya görüntüleri raporlayan fonksiyon.
+    
+    Args:
+        args: Komut satırı argümanları
+    """
+    print(f"Yakın kopyalar aranıyor: {args.data_dir}")
+    find_dataset_duplicates(
+        args.data_dir,
+        max_distance=args.max_distance,
+        workers=args.workers,
+        output_path=args.output
+    )
+
 def predict(args):
     """
     Tahmin yapan fonksiyon.
@@ -148,6 +669,237 @@ def main():
                              help='Veri çoğaltma uygula')
     train_parser.add_argument('--grayscale', action='store_true',
                              help='Görüntüleri gri tonlama olarak işle')
+    train_parser.add_argument('--duplicates', type=str, choices=['drop', 'group'],
+                             help='Yakın kopyalar: drop (tutulan örneğin aynı sınıftaki yakın kopyalarını çıkar), group (kümeyi bölmenin tek tarafında tut)')
+    train_parser.add_argument('--arch', type=str, default='cnn', choices=['cnn', 'mobilenet'],
+                             help='Model mimarisi (mobilenet: derinlemesine ayrılabilir evrişimli hafif model)')
+    train_parser.add_argument('--width-multiplier', type=float, default=1.0,
+                             help='Katmanlardaki filtre sayılarının çarpanı')
+    train_parser.add_argument('--xla', action='store_true',
+                             help='XLA derlemesini (jit_compile) etkinleştir')
+    train_parser.add_argument('--intra-op-threads', type=int,
+                             help='İşlem içi paralel iş parçacığı sayısı (varsayılan: otomatik)')
+    train_parser.add_argument('--inter-op-threads', type=int,
+                             help='Eşzamanlı bağımsız işlem sayısı (varsayılan: otomatik)')
+    train_parser.add_argument('--onednn', action='store_true',
+                             help='oneDNN optimizasyonlarını zorla etkinleştir')
+    train_parser.add_argument('--no-onednn', action='store_true',
+                             help='oneDNN optimizasyonlarını devre dışı bırak')
+    train_parser.add_argument('--accumulation-steps', type=int, default=1,
+                             help='Gradyan biriktirme adımı (etkin batch = batch-size * accumulation-steps)')
+    train_parser.add_argument('--throughput', action='store_true',
+                             help='Dönem başına eğitim hızını (örnek/sn) raporla')
+    train_parser.add_argument('--profile', action='store_true',
+                             help='Adım süresi, veri bekleme süresi ve örnek/sn ölçümü yap, TensorBoard profil izi al')
+    train_parser.add_argument('--profile-steps', type=int, nargs=2, default=[10, 20], metavar=('ILK', 'SON'),
+                             help='Profil izinin alınacağı genel adım aralığı (--profile ile)')
+    train_parser.add_argument('--checkpoint-every', type=int, default=0,
+                             help='Kaç dönemde bir devam ettirilebilir kontrol noktası alınacağı (varsayılan 0: kapalı)')
+    train_parser.add_argument('--resume', action='store_true',
+                             help='Yarıda kalan eğitime son kontrol noktasından devam et')
+    train_parser.add_argument('--seed', type=int,
+                             help='Rastgele tohum (varsayılan: rastgele seçilir ve kontrol noktasına yazılır)')
+    train_parser.add_argument('--sampling', type=str, choices=['balanced', 'sqrt', 'natural'],
+                             help='Sınıf dengeli akışlı örnekleme (veri seti belleğe yüklenmez)')
+    train_parser.add_argument('--manifest', type=str,
+                             help='--sampling ile kullanılacak önceden oluşturulmuş manifest dosyası')
+    train_parser.add_argument('--dataset-dir', type=str,
+                             help='build-dataset ile oluşturulan parçalı veri seti (belirtilirse --data-dir yerine kullanılır)')
+    
+    # Damıtma komutu
+    distill_parser = subparsers.add_parser('distill', help='Eğitilmiş modeli küçük bir öğrenci modele damıt')
+    distill_parser.add_argument('--data-dir', type=str,
+                               default='../datasets/asl',
+                               help='Veri seti dizini')
+    distill_parser.add_argument('--teacher-path', type=str,
+                               default='../models/asl_model.h5',
+                               help='Öğretmen model yolu')
+    distill_parser.add_argument('--model-path', type=str,
+                               default='../models/asl_student.h5',
+                               help='Öğrenci modelin kaydedileceği yol')
+    distill_parser.add_argument('--arch', type=str, default='mobilenet', choices=['cnn', 'mobilenet'],
+                               help='Öğrenci model mimarisi')
+    distill_parser.add_argument('--width-multiplier', type=float, default=0.5,
+                               help='Öğrenci modeldeki filtre sayılarının çarpanı')
+    distill_parser.add_argument('--temperature', type=float, default=4.0,
+                               help='Yumuşak hedefler için sıcaklık')
+    distill_parser.add_argument('--alpha', type=float, default=0.1,
+                               help='Gerçek etiket kaybının ağırlığı (kalanı damıtma kaybı)')
+    distill_parser.add_argument('--batch-size', type=int, default=32,
+                               help='Batch boyutu')
+    distill_parser.add_argument('--epochs', type=int, default=30,
+                               help='Eğitim dönem sayısı')
+    distill_parser.add_argument('--test-size', type=float, default=0.2,
+                               help='Test seti oranı')
+    distill_parser.add_argument('--augment', action='store_true',
+                               help='Veri çoğaltma uygula')
+    
+    # Budama / kümeleme komutu
+    optimize_parser = subparsers.add_parser('optimize', help='Eğitilmiş modeli buda veya kümele')
+    optimize_parser.add_argument('--data-dir', type=str,
+                                default='../datasets/asl',
+                                help='Veri seti dizini (ince ayar ve değerlendirme için)')
+    optimize_parser.add_argument('--model-path', type=str,
+                                default='../models/asl_model.h5',
+                                help='Optimize edilecek model yolu')
+    optimize_parser.add_argument('--output-path', type=str,
+                                default='../models/asl_model_pruned.h5',
+                                help='Optimize edilmiş modelin kaydedileceği yol')
+    optimize_parser.add_argument('--method', type=str, default='channels', choices=['channels', 'magnitude', 'cluster'],
+                                help='channels: yapısal kanal budaması, magnitude: büyüklük budaması, cluster: ağırlık kümeleme')
+    optimize_parser.add_argument('--sparsity', type=float, default=0.5,
+                                help='Budama oranı (channels ve magnitude için)')
+    optimize_parser.add_argument('--clusters', type=int, default=16,
+                                help='Katman başına küme sayısı (cluster için)')
+    optimize_parser.add_argument('--batch-size', type=int, default=32,
+                                help='Batch boyutu')
+    optimize_parser.add_argument('--epochs', type=int, default=5,
+                                help='İnce ayar dönem sayısı')
+    optimize_parser.add_argument('--test-size', type=float, default=0.2,
+                                help='Test seti oranı')
+    
+    # Hiperparametre arama komutu
+    tune_parser = subparsers.add_parser('tune', help='Paralel hiperparametre araması yap')
+    tune_parser.add_argument('--data-dir', type=str,
+                            default='../datasets/asl',
+                            help='Veri seti dizini')
+    tune_parser.add_argument('--dataset-dir', type=str,
+                            default='../datasets/asl_shards',
+                            help='Çalışanların paylaşacağı parçalı veri seti (gerekirse oluşturulur/güncellenir)')
+    tune_parser.add_argument('--output-dir', type=str,
+                            default='../models/tune',
+                            help='Deneme modellerinin ve skor tablosunun yazılacağı dizin')
+    tune_parser.add_argument('--method', type=str, default='random', choices=['random', 'halving'],
+                            help='random: rastgele arama, halving: ardışık yarılama')
+    tune_parser.add_argument('--trials', type=int, default=8,
+                            help='Deneme sayısı')
+    tune_parser.add_argument('--epochs', type=int, default=10,
+                            help='Denemelerin en fazla dönem sayısı')
+    tune_parser.add_argument('--min-epochs', type=int, default=2,
+                            help='Ardışık yarılamada ilk turun dönem sayısı')
+    tune_parser.add_argument('--eta', type=int, default=3,
+                            help='Ardışık yarılamada her turda tutulan oran (1/eta)')
+    tune_parser.add_argument('--test-size', type=float, default=0.2,
+                            help='Doğrulama seti oranı')
+    tune_parser.add_argument('--workers', type=int, default=2,
+                            help='Paralel süreç sayısı')
+    tune_parser.add_argument('--threads-per-worker', type=int,
+                            help='Süreç başına iş parçacığı sayısı (varsayılan: çekirdekler / süreçler)')
+    tune_parser.add_argument('--seed', type=int, default=42,
+                            help='Rastgele tohum')
+    tune_parser.add_argument('--archs', type=str, nargs='+', default=['cnn', 'mobilenet'],
+                            choices=['cnn', 'mobilenet'],
+                            help='Aranacak model mimarileri')
+    tune_parser.add_argument('--width-multipliers', type=float, nargs='+', default=[0.5, 1.0],
+                            help='Aranacak genişlik çarpanları')
+    tune_parser.add_argument('--learning-rates', type=float, nargs='+', default=[1e-3, 3e-4],
+                            help='Aranacak öğrenme oranları')
+    tune_parser.add_argument('--batch-sizes', type=int, nargs='+', default=[32, 64],
+                            help='Aranacak batch boyutları')
+    tune_parser.add_argument('--image-sizes', type=int, nargs='+', default=[48, 64],
+                            help='Aranacak görüntü boyutları')
+    tune_parser.add_argument('--search-augment', action='store_true',
+                            help='Veri çoğaltmalı ve çoğaltmasız eğitimi de ara')
+    
+    # Çapraz doğrulama komutu
+    cv_parser = subparsers.add_parser('cv', help='Paralel k-katlı çapraz doğrulama yap')
+    cv_parser.add_argument('--data-dir', type=str,
+                          default='../datasets/asl',
+                          help='Veri seti dizini')
+    cv_parser.add_argument('--dataset-dir', type=str,
+                          default='../datasets/asl_shards',
+                          help='Katmanların paylaşacağı parçalı veri seti (gerekirse oluşturulur/güncellenir)')
+    cv_parser.add_argument('--output-dir', type=str,
+                          default='../models/cv',
+                          help='Sonuçların yazılacağı dizin')
+    cv_parser.add_argument('--folds', type=int, default=5,
+                          help='Katman sayısı')
+    cv_parser.add_argument('--image-size', type=int, default=64,
+                          help='Görüntü boyutu')
+    cv_parser.add_argument('--arch', type=str, default='cnn', choices=['cnn', 'mobilenet'],
+                          help='Model mimarisi')
+    cv_parser.add_argument('--width-multiplier', type=float, default=1.0,
+                          help='Katmanlardaki filtre sayılarının çarpanı')
+    cv_parser.add_argument('--learning-rate', type=float, default=0.001,
+                          help='Öğrenme oranı')
+    cv_parser.add_argument('--batch-size', type=int, default=32,
+                          help='Batch boyutu')
+    cv_parser.add_argument('--epochs', type=int, default=10,
+                          help='Katman başına eğitim dönem sayısı')
+    cv_parser.add_argument('--augment', action='store_true',
+                          help='Veri çoğaltma uygula')
+    cv_parser.add_argument('--workers', type=int, default=2,
+                          help='Paralel süreç sayısı')
+    cv_parser.add_argument('--threads-per-worker', type=int,
+                          help='Süreç başına iş parçacığı sayısı (varsayılan: çekirdekler / süreçler)')
+    cv_parser.add_argument('--seed', type=int, default=42,
+                          help='Rastgele tohum')
+    
+    # SavedModel dışa aktarma komutu
+    export_parser = subparsers.add_parser('export', help='Ön işleme gömülü SavedModel olarak dışa aktar')
+    export_parser.add_argument('--model-path', type=str,
+                              default='../models/asl_model.h5',
+                              help='Model yolu (label_encoder.pkl aynı dizinde olmalı)')
+    export_parser.add_argument('--export-dir', type=str,
+                              default='../models/asl_saved_model',
+                              help='SavedModel dizini')
+    
+    # Akışlı değerlendirme komutu
+    evaluate_parser = subparsers.add_parser('evaluate', help='Test setini son işlemeyle birlikte değerlendir')
+    evaluate_parser.add_argument('--model-path', type=str,
+                                default='../models/asl_model.h5',
+                                help='Model yolu (label_encoder.pkl aynı dizinde olmalı)')
+    evaluate_parser.add_argument('--data-dir', type=str,
+                                default='../datasets/asl',
+                                help='Veri seti dizini')
+    evaluate_parser.add_argument('--manifest', type=str,
+                                help='Önceden oluşturulmuş manifest dosyası')
+    evaluate_parser.add_argument('--test-size', type=float, default=0.2,
+                                help='Test seti oranı (eğitimdeki bölmeyle aynı olmalı)')
+    evaluate_parser.add_argument('--all', action='store_true',
+                                help='Bölme yapmadan tüm veri setini değerlendir')
+    evaluate_parser.add_argument('--batch-size', type=int, default=64,
+                                help='Batch boyutu')
+    evaluate_parser.add_argument('--grayscale', action='store_true',
+                                help='Görüntüleri gri tonlama olarak işle (eski modeller için)')
+    evaluate_parser.add_argument('--output-dir', type=str,
+                                default='../models/evaluation',
+                                help='Raporun ve karışıklık matrisinin yazılacağı klasör')
+    
+    # Parçalı veri seti oluşturma komutu
+    build_parser = subparsers.add_parser('build-dataset', help='Veri setini belleğe eşlenebilir parçalara dönüştür')
+    build_parser.add_argument('--data-dir', type=str,
+                             default='../datasets/asl',
+                             help='Veri seti dizini')
+    build_parser.add_argument('--output-dir', type=str,
+                             default='../datasets/asl_shards',
+                             help='Parçaların yazılacağı dizin')
+    build_parser.add_argument('--image-size', type=int, default=64,
+                             help='Görüntü boyutu')
+    build_parser.add_argument('--shard-size', type=int, default=4096,
+                             help='Parça başına görüntü sayısı')
+    build_parser.add_argument('--rebuild', action='store_true',
+                             help='Artımlı güncelleme yerine tüm parçaları baştan oluştur')
+    
+    # Manifest komutu
+    manifest_parser = subparsers.add_parser('manifest', help='Sınıf istatistikleriyle veri seti manifesti oluştur')
+    manifest_parser.add_argument('--data-dir', type=str,
+                                default='../datasets/asl',
+                                help='Veri seti dizini')
+    manifest_parser.add_argument('--output', type=str,
+                                help='Manifestin yazılacağı JSON dosyası')
+    
+    # Yakın kopya tespit komutu
+    dedup_parser = subparsers.add_parser('dedup', help='Kopya ve yakın kopya görüntüleri raporla')
+    dedup_parser.add_argument('--data-dir', type=str,
+                             default='../datasets/asl',
+                             help='Veri seti dizini')
+    dedup_parser.add_argument('--max-distance', type=int, default=4,
+                             help='Yakın kopya sayılacak en büyük özet (dHash) mesafesi')
+    dedup_parser.add_argument('--workers', type=int,
+                             help='Paralel iş parçacığı sayısı (varsayılan: çekirdek sayısı)')
+    dedup_parser.add_argument('--output', type=str,
+                             help='Kümelerin yazılacağı JSON dosyası')
     
     # Tahmin komutu
     predict_parser = subparsers.add_parser('predict', help='Tahmin yap')
@@ -167,6 +919,24 @@ def main():
     
     if args.command == 'train':
         train(args)
+    elif args.command == 'distill':
+        distill(args)
+    elif args.command == 'optimize':
+        optimize(args)
+    elif args.command == 'tune':
+        tune(args)
+    elif args.command == 'cv':
+        cv(args)
+    elif args.command == 'export':
+        export(args)
+    elif args.command == 'evaluate':
+        evaluate(args)
+    elif args.command == 'build-dataset':
+        build_dataset(args)
+    elif args.command == 'manifest':
+        manifest(args)
+    elif args.command == 'dedup':
+        dedup(args)
     elif args.command == 'predict':
         predict(args)
     else:
@@ -1,86 +1,648 @@
 import os
+import json
+import math
+import time
+import random
 import numpy as np
 import tensorflow as tf
 from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout, BatchNormalization
-from tensorflow.keras.callbacks import ModelCheckpoint, EarlyStopping, ReduceLROnPlateau
+from tensorflow.keras.layers import (Conv2D, DepthwiseConv2D, MaxPooling2D, GlobalAveragePooling2D, Flatten,
+                                     Dense, Dropout, BatchNormalization, ReLU)
+from tensorflow.keras.callbacks import Callback, ModelCheckpoint, EarlyStopping, ReduceLROnPlateau
 from tensorflow.keras.optimizers import Adam
 from tensorflow.keras.utils import to_categorical
 import matplotlib.pyplot as plt
 
-def create_model(input_shape, num_classes):
+def _scale_filters(filters, width_multiplier):
     """
-    CNN modeli oluşturur.
-    
-    Args:
-        input_shape: Giriş görüntüsünün boyutu (yükseklik, genişlik, kanal)
-        num_classes: Sınıf sayısı
-        
-    Returns:
-        model: Oluşturulan CNN modeli
+    Filtre sayısını genişlik çarpanıyla ölçekler (8'in katına yuvarlanır).
     """
-    model = Sequential()
+    return max(8, int(filters * width_multiplier + 4) // 8 * 8)
+
+def _build_cnn(model, input_shape, num_classes, width_multiplier):
+    """
+    Varsayılan mimari: üç çift Conv2D bloğu ve düzleştirilmiş tam bağlantı başlığı.
+    """
+    f32 = _scale_filters(32, width_multiplier)
+    f64 = _scale_filters(64, width_multiplier)
+    f128 = _scale_filters(128, width_multiplier)
     
     # İlk evrişim bloğu
-    model.add(Conv2D(32, (3, 3), activation='relu', padding='same', input_shape=input_shape))
+    model.add(Conv2D(f32, (3, 3), activation='relu', padding='same', input_shape=input_shape))
     model.add(BatchNormalization())
-    model.add(Conv2D(32, (3, 3), activation='relu', padding='same'))
+    model.add(Conv2D(f32, (3, 3), activation='relu', padding='same'))
     model.add(BatchNormalization())
     model.add(MaxPooling2D((2, 2)))
     model.add(Dropout(0.25))
     
     # İkinci evrişim bloğu
-    model.add(Conv2D(64, (3, 3), activation='relu', padding='same'))
+    model.add(Conv2D(f64, (3, 3), activation='relu', padding='same'))
     model.add(BatchNormalization())
-    model.add(Conv2D(64, (3, 3), activation='relu', padding='same'))
+    model.add(Conv2D(f64, (3, 3), activation='relu', padding='same'))
     model.add(BatchNormalization())
     model.add(MaxPooling2D((2, 2)))
     model.add(Dropout(0.25))
     
     # Üçüncü evrişim bloğu
-    model.add(Conv2D(128, (3, 3), activation='relu', padding='same'))
+    model.add(Conv2D(f128, (3, 3), activation='relu', padding='same'))
     model.add(BatchNormalization())
-    model.add(Conv2D(128, (3, 3), activation='relu', padding='same'))
+    model.add(Conv2D(f128, (3, 3), activation='relu', padding='same'))
     model.add(BatchNormalization())
     model.add(MaxPooling2D((2, 2)))
     model.add(Dropout(0.25))
     
     # Düzleştirme ve tam bağlantı katmanları
     model.add(Flatten())
-    model.add(Dense(512, activation='relu'))
+    model.add(Dense(_scale_filters(512, width_multiplier), activation='relu'))
     model.add(BatchNormalization())
     model.add(Dropout(0.5))
     model.add(Dense(num_classes, activation='softmax'))
+
+def _build_mobilenet(model, input_shape, num_classes, width_multiplier):
+    """
+    MobileNet tarzı hafif mimari: derinlemesine ayrılabilir (depthwise + pointwise)
+    evrişim blokları ve global ortalama havuzlama. Parametrelerin çoğunu taşıyan
+    Flatten + Dense başlığı yoktur.
+    """
+    model.add(Conv2D(_scale_filters(32, width_multiplier), (3, 3), strides=2, padding='same',
+                     use_bias=False, input_shape=input_shape))
+    model.add(BatchNormalization())
+    model.add(ReLU())
+    
+    # (çıkış filtre sayısı, adım)
+    blocks = [(64, 1), (128, 2), (128, 1), (256, 2), (256, 1), (512, 2)]
+    for filters, strides in blocks:
+        model.add(DepthwiseConv2D((3, 3), strides=strides, padding='same', use_bias=False))
+        model.add(BatchNormalization())
+        model.add(ReLU())
+        model.add(Conv2D(_scale_filters(filters, width_multiplier), (1, 1), use_bias=False))
+        model.add(BatchNormalization())
+        model.add(ReLU())
+    
+    model.add(GlobalAveragePooling2D())
+    model.add(Dropout(0.2))
+    model.add(Dense(num_classes, activation='softmax'))
+
+# Seçilebilir model mimarileri
+MODEL_ARCHITECTURES = {
+    'cnn': _build_cnn,
+    'mobilenet': _build_mobilenet
+}
+
+def create_model(input_shape, num_classes, arch='cnn', width_multiplier=1.0, learning_rate=0.001):
+    """
+    CNN modeli oluşturur.
+    
+    Args:
+        input_shape: Giriş görüntüsünün boyutu (yükseklik, genişlik, kanal)
+        num_classes: Sınıf sayısı
+        arch: Model mimarisi ('cnn' veya 'mobilenet')
+        width_multiplier: Katmanlardaki filtre sayılarının çarpanı
+        learning_rate: Adam öğrenme oranı
+        
+    Returns:
+        model: Oluşturulan CNN modeli
+    """
+    if arch not in MODEL_ARCHITECTURES:
+        raise ValueError(f"Bilinmeyen model mimarisi: {arch}")
+    
+    model = Sequential(name=f"asl_{arch}")
+    MODEL_ARCHITECTURES[arch](model, input_shape, num_classes, width_multiplier)
     
     # Modeli derle
     model.compile(
-        optimizer=Adam(learning_rate=0.001),
+        optimizer=Adam(learning_rate=learning_rate),
         loss='categorical_crossentropy',
         metrics=['accuracy']
     )
     
     return model
 
-def train_model(model, X_train, y_train, X_test, y_test, batch_size=32, epochs=30, model_save_path='models/asl_model.h5'):
+def measure_inference_latency(model, runs=50, warmup=5):
     """
-    Modeli eğitir.
+    Tek görüntülük girdide modelin CPU gecikmesini ölçer.
     
     Args:
-        model: Eğitilecek model
-        X_train, y_train: Eğitim verileri
-        X_test, y_test: Test verileri
-        batch_size: Batch boyutu
-        epochs: Eğitim dönem sayısı
-        model_save_path: Modelin kaydedileceği yol
+        model: Ölçülecek model
+        runs: Ölçüm tekrar sayısı
+        warmup: Ölçüme katılmayan ısınma çağrısı sayısı
         
     Returns:
-        history: Eğitim geçmişi
+        latency: Milisaniye cinsinden p50 ve p90 gecikme
+    """
+    sample = tf.zeros((1,) + tuple(model.input_shape[1:]), dtype='float32')
+    timings = []
+    
+    # Katman başına Python yükünü ölçmemek için grafik olarak çalıştır
+    infer = tf.function(lambda x: model(x, training=False))
+    
+    with tf.device('/CPU:0'):
+        for i in range(warmup + runs):
+            start = time.perf_counter()
+            infer(sample).numpy()
+            if i >= warmup:
+                timings.append((time.perf_counter() - start) * 1000.0)
+    
+    return {
+        'latency_ms_p50': float(np.percentile(timings, 50)),
+        'latency_ms_p90': float(np.percentile(timings, 90))
+    }
+
+def save_model_report(model, model_path, test_accuracy, test_loss, extra=None):
+    """
+    Modelin doğruluğunu, parametre sayısını ve ölçülen CPU gecikmesini modelin
+    yanına JSON olarak kaydeder (ör. asl_model.h5 -> asl_model_info.json).
+    
+    Args:
         model: Eğitilmiş model
+        model_path: Model dosya yolu
+        test_accuracy: Test doğruluğu
+        test_loss: Test kaybı
+        extra: Rapora eklenecek ek bilgiler (mimari vb.)
+        
+    Returns:
+        report: Kaydedilen rapor sözlüğü
     """
-    # Etiketleri one-hot kodlamasına dönüştürün
-    y_train_categorical = to_categorical(y_train)
-    y_test_categorical = to_categorical(y_test)
+    report = {
+        'model_path': model_path,
+        'input_shape': list(model.input_shape[1:]),
+        'params': int(model.count_params()),
+        'test_accuracy': float(test_accuracy),
+        'test_loss': float(test_loss)
+    }
+    report.update(measure_inference_latency(model))
+    if extra:
+        report.update(extra)
+    
+    report_path = os.path.splitext(model_path)[0] + '_info.json'
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    print(f"Parametre sayısı: {report['params']:,}")
+    print(f"Tek görüntü CPU gecikmesi: p50 {report['latency_ms_p50']:.2f} ms, p90 {report['latency_ms_p90']:.2f} ms")
+    print(f"Model raporu kaydedildi: {report_path}")
+    
+    return report
+
+def configure_cpu_training(intra_op_threads=None, inter_op_threads=None):
+    """
+    CPU üzerinde eğitim için TensorFlow iş parçacığı sayılarını ayarlar.
+    TensorFlow herhangi bir işlem çalıştırmadan önce çağrılmalıdır.
+    
+    Not: oneDNN optimizasyonları (TF_ENABLE_ONEDNN_OPTS) TensorFlow yüklenirken
+    okunur, bu yüzden main.py bu ayarı içe aktarmadan önce uygular.
+    
+    Args:
+        intra_op_threads: Tek bir işlem içindeki paralel iş parçacığı sayısı
+        inter_op_threads: Aynı anda çalışabilecek bağımsız işlem sayısı
+    """
+    try:
+        if intra_op_threads:
+            tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        if inter_op_threads:
+            tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except RuntimeError as e:
+        print(f"Uyarı: İş parçacığı ayarları uygulanamadı (TensorFlow zaten başlatılmış): {e}")
+        return
+    
+    print(f"İş parçacıkları: intra-op={tf.config.threading.get_intra_op_parallelism_threads() or 'otomatik'}, "
+          f"inter-op={tf.config.threading.get_inter_op_parallelism_threads() or 'otomatik'}, "
+          f"oneDNN={os.environ.get('TF_ENABLE_ONEDNN_OPTS', 'varsayılan')}")
+
+class GradientAccumulationModel(tf.keras.Model):
+    """
+    Gradyanları birkaç batch boyunca biriktirip tek seferde uygulayan model sarmalayıcısı.
+    Bellekte küçük batch'ler tutarken daha büyük etkin batch boyutu sağlar.
+    Ağırlıklar iç modelle paylaşılır ve kaydetme iç model üzerinden yapılır.
+    """
+    
+    def __init__(self, inner_model, accumulation_steps, **kwargs):
+        """
+        Args:
+            inner_model: Eğitilecek model
+            accumulation_steps: Gradyanların uygulanacağı batch aralığı
+        """
+        super().__init__(**kwargs)
+        self.inner_model = inner_model
+        self.accumulation_steps = accumulation_steps
+        self.step_counter = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self.accumulated_gradients = [
+            tf.Variable(tf.zeros_like(variable), trainable=False)
+            for variable in inner_model.trainable_variables
+        ]
+    
+    def call(self, inputs, training=None):
+        return self.inner_model(inputs, training=training)
+    
+    def compile(self, *args, **kwargs):
+        super().compile(*args, **kwargs)
+        # Optimizer değişkenleri koşullu dal içinde oluşturulamayacağı için önceden oluştur
+        self.optimizer.build(self.inner_model.trainable_variables)
+    
+    def _apply_accumulated_gradients(self):
+        self.optimizer.apply_gradients(zip(
+            [gradient.read_value() for gradient in self.accumulated_gradients],
+            self.inner_model.trainable_variables
+        ))
+        for gradient in self.accumulated_gradients:
+            gradient.assign(tf.zeros_like(gradient))
+    
+    def train_step(self, data):
+        x, y, sample_weight = tf.keras.utils.unpack_x_y_sample_weight(data)
+        
+        with tf.GradientTape() as tape:
+            y_pred = self(x, training=True)
+            loss = self.compute_loss(x, y, y_pred, sample_weight)
+        
+        gradients = tape.gradient(loss, self.inner_model.trainable_variables)
+        for accumulated, gradient in zip(self.accumulated_gradients, gradients):
+            accumulated.assign_add(gradient / self.accumulation_steps)
+        
+        self.step_counter.assign_add(1)
+        tf.cond(
+            tf.equal(self.step_counter % self.accumulation_steps, 0),
+            self._apply_accumulated_gradients,
+            lambda: None
+        )
+        
+        return self.compute_metrics(x, y, y_pred, sample_weight)
+    
+    def save(self, *args, **kwargs):
+        # Kontrol noktaları sarmalayıcıyı değil, düz iç modeli kaydeder
+        return self.inner_model.save(*args, **kwargs)
+
+class ThroughputCallback(Callback):
+    """
+    Her dönem için eğitim hızını (örnek/saniye) ölçen ve raporlayan callback.
+    Ölçülen değer geçmişe 'samples_per_sec' olarak eklenir.
+    """
+    
+    def __init__(self, num_samples):
+        """
+        Args:
+            num_samples: Bir dönemde işlenen eğitim örneği sayısı
+        """
+        super().__init__()
+        self.num_samples = num_samples
+        self.epoch_rates = []
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        self.epoch_start = time.perf_counter()
+        self.train_end = self.epoch_start
+    
+    def on_train_batch_end(self, batch, logs=None):
+        # Doğrulama süresini dışarıda bırakmak için son eğitim batch'inin zamanı
+        self.train_end = time.perf_counter()
+    
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = max(self.train_end - self.epoch_start, 1e-9)
+        rate = self.num_samples / elapsed
+        self.epoch_rates.append(rate)
+        if logs is not None:
+            logs['samples_per_sec'] = rate
+        print(f"\nDönem {epoch + 1}: {rate:.1f} örnek/sn ({elapsed:.1f} sn)")
+    
+    def on_train_end(self, logs=None):
+        if not self.epoch_rates:
+            return
+        # İlk dönem derleme (özellikle XLA) süresini içerdiği için ayrı raporlanır
+        steady = self.epoch_rates[1:] or self.epoch_rates
+        print(f"Eğitim hızı: ilk dönem {self.epoch_rates[0]:.1f}, "
+              f"sonraki dönemler ortalaması {np.mean(steady):.1f} örnek/sn")
+
+class TrainingProfiler(Callback):
+    """
+    Eğitimin girdi mi yoksa hesaplama mı sınırlı olduğunu anlamak için adım başına
+    süreleri ölçen callback. Her adım için hesaplama süresi (batch başı -> sonu) ve
+    bekleme süresi (önceki batch sonu -> sonraki batch başı) kaydedilir. İstenen adım
+    aralığı için TensorBoard profil izi alınır ve sonunda özet JSON yazılır.
+    
+    Not: Bellekteki diziler ve Sequence'lar için veri hazırlığının bir kısmı adım
+    süresine dahil olur; ayrıntılı girdi hattı analizi için profil izi kullanılmalıdır.
+    """
+    
+    def __init__(self, batch_size, profile_steps=(10, 20), log_dir='models/profile',
+                 summary_path='models/training_profile.json'):
+        """
+        Args:
+            batch_size: Batch boyutu (örnek/saniye hesabı için)
+            profile_steps: Profil izi alınacak (ilk, son) genel adım aralığı; None ise iz alınmaz
+            log_dir: TensorBoard profil izinin yazılacağı dizin
+            summary_path: Özet JSON dosyasının yolu
+        """
+        super().__init__()
+        self.batch_size = batch_size
+        self.profile_steps = profile_steps
+        self.log_dir = log_dir
+        self.summary_path = summary_path
+        self.step_times = []
+        self.wait_times = []
+        self.global_step = 0
+        self.tracing = False
+        self.last_batch_end = None
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        # Dönemler arası doğrulama süresi bekleme olarak sayılmaz
+        self.last_batch_end = time.perf_counter()
+    
+    def on_train_batch_begin(self, batch, logs=None):
+        if self.profile_steps and self.global_step == self.profile_steps[0]:
+            tf.profiler.experimental.start(self.log_dir)
+            self.tracing = True
+        
+        self.batch_start = time.perf_counter()
+        self.wait_times.append(self.batch_start - self.last_batch_end)
+    
+    def on_train_batch_end(self, batch, logs=None):
+        self.last_batch_end = time.perf_counter()
+        self.step_times.append(self.last_batch_end - self.batch_start)
+        
+        if self.tracing and self.global_step >= self.profile_steps[1]:
+            self._stop_trace()
+        self.global_step += 1
+    
+    def _stop_trace(self):
+        tf.profiler.experimental.stop()
+        self.tracing = False
+        print(f"\nProfil izi kaydedildi: {self.log_dir} (tensorboard --logdir {self.log_dir})")
+    
+    def summary(self):
+        """
+        Ölçülen adım sürelerinin özetini döndürür. İlk adım derleme süresini
+        içerdiği için istatistiklere katılmaz.
+        """
+        step_times = np.array(self.step_times[1:] or self.step_times) * 1000.0
+        wait_times = np.array(self.wait_times[1:] or self.wait_times) * 1000.0
+        if len(step_times) == 0:
+            return {}
+        
+        total_time = step_times.sum() + wait_times.sum()
+        wait_fraction = float(wait_times.sum() / total_time) if total_time > 0 else 0.0
+        
+        return {
+            'steps': len(self.step_times),
+            'batch_size': self.batch_size,
+            'first_step_ms': float(self.step_times[0] * 1000.0),
+            'step_time_ms_mean': float(step_times.mean()),
+            'step_time_ms_p50': float(np.percentile(step_times, 50)),
+            'step_time_ms_p90': float(np.percentile(step_times, 90)),
+            'data_wait_ms_mean': float(wait_times.mean()),
+            'data_wait_ms_p90': float(np.percentile(wait_times, 90)),
+            'data_wait_fraction': wait_fraction,
+            'samples_per_sec': float(self.batch_size * len(step_times) / (total_time / 1000.0)),
+            # Adım arası bekleme toplam sürenin %20'sinden fazlaysa girdi hattı darboğazdır
+            'bound': 'input' if wait_fraction > 0.2 else 'compute',
+            'profile_steps': list(self.profile_steps) if self.profile_steps else None,
+            'profile_log_dir': self.log_dir if self.profile_steps else None
+        }
+    
+    def on_train_end(self, logs=None):
+        if self.tracing:
+            self._stop_trace()
+        
+        summary = self.summary()
+        os.makedirs(os.path.dirname(self.summary_path) or '.', exist_ok=True)
+        with open(self.summary_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        
+        if summary:
+            print(f"Adım süresi: ort. {summary['step_time_ms_mean']:.1f} ms, p90 {summary['step_time_ms_p90']:.1f} ms; "
+                  f"bekleme: ort. {summary['data_wait_ms_mean']:.1f} ms (%{100 * summary['data_wait_fraction']:.1f}); "
+                  f"{summary['samples_per_sec']:.1f} örnek/sn -> {'girdi' if summary['bound'] == 'input' else 'hesaplama'} sınırlı")
+        print(f"Profil özeti kaydedildi: {self.summary_path}")
+
+# Devam ettirmede geri yüklenen callback durumları
+_CALLBACK_STATE_ATTRIBUTES = {
+    'ModelCheckpoint': ('best',),
+    'EarlyStopping': ('wait', 'best', 'best_epoch', 'stopped_epoch'),
+    'ReduceLROnPlateau': ('wait', 'cooldown_counter', 'best')
+}
+
+def checkpoint_directory(model_save_path):
+    """
+    Modelin eğitim kontrol noktalarının tutulduğu dizini döndürür
+    (ör. models/asl_model.h5 -> models/asl_model_checkpoints).
+    """
+    return os.path.splitext(model_save_path)[0] + '_checkpoints'
+
+def load_training_state(checkpoint_dir):
+    """
+    Son kontrol noktasının eğitim durumunu (dönem, tohum, callback durumları,
+    geçmiş) okur.
+    
+    Args:
+        checkpoint_dir: Kontrol noktası dizini
+        
+    Returns:
+        state: Durum sözlüğü (kontrol noktası yoksa None)
+    """
+    state_path = os.path.join(checkpoint_dir, 'training_state.json')
+    if not os.path.exists(state_path):
+        return None
+    
+    with open(state_path, 'r') as f:
+        return json.load(f)
+
+class ArraySequence(tf.keras.utils.Sequence):
+    """
+    Bellekteki diziler üzerinden her dönem karıştırılan batch'ler üreten Keras
+    Sequence sınıfı. Karıştırma, durumu kontrol noktasına yazılabilen bir NumPy
+    üreteciyle yapılır; böylece devam ettirilen eğitim kesintisiz eğitimle aynı
+    batch'leri görür (fit(shuffle=True) TensorFlow işlem tohumlarını kullanır ve
+    bu durum kaydedilemez).
+    """
+    
+    def __init__(self, X, y, batch_size=32, seed=None):
+        """
+        Args:
+            X: Görüntü dizisi
+            y: One-hot etiket dizisi
+            batch_size: Batch boyutu
+            seed: Karıştırma için rastgele tohum
+        """
+        super().__init__()
+        self.X = X
+        self.y = y
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+        self.indices = self.rng.permutation(len(X))
+    
+    def __len__(self):
+        return math.ceil(len(self.X) / self.batch_size)
+    
+    def __getitem__(self, index):
+        # Sıralı okuma için batch indeksleri artan sırada alınır
+        batch_indices = np.sort(self.indices[index * self.batch_size:(index + 1) * self.batch_size])
+        return self.X[batch_indices], self.y[batch_indices]
+    
+    def on_epoch_end(self):
+        self.indices = self.rng.permutation(len(self.X))
+    
+    def get_state(self):
+        """
+        Rastgele sayı üretecinin durumunu döndürür (kontrol noktasına yazmak için).
+        """
+        return {'rng': self.rng.bit_generator.state}
     
+    def set_state(self, state):
+        """
+        Bir dönem sonunda get_state ile alınan durumu geri yükler ve sonraki
+        dönemin sıralamasını kesintisiz eğitimdeki gibi hazırlar.
+        """
+        self.rng.bit_generator.state = state['rng']
+        self.on_epoch_end()
+
+def _layer_random_generators(model):
+    """
+    Modeldeki rastgele katmanların (Dropout vb.) tf.random.Generator nesnelerini
+    döndürür. Keras bunları model kontrol noktasına yazmaz; yalnızca
+    enable_tf_random_generator etkinse oluşturulurlar.
+    """
+    generators = []
+    for layer in model.submodules:
+        generator = getattr(getattr(layer, '_random_generator', None), '_generator', None)
+        if isinstance(generator, tf.random.Generator):
+            generators.append(generator)
+    return generators
+
+class TrainingCheckpoint(Callback):
+    """
+    Belirli aralıklarla model ve optimizer durumunu (tf.train.CheckpointManager ile),
+    dönem sayacını, öğrenme oranını, callback durumlarını ve rastgele sayı üreteci
+    durumlarını kaydeden callback. Devam ettirmede bu durumları, diğer callback'ler
+    on_train_begin'de kendilerini sıfırladıktan sonra geri yükler; bu yüzden
+    callback listesinin sonunda olmalıdır.
+    
+    Not: Dropout katmanlarının rastgele durumu yalnızca katmanlar tf.random.Generator
+    kullanıyorsa (tf.keras.backend.experimental.enable_tf_random_generator) kaydedilir;
+    aksi halde işlem tohumları baştan başlar ve devam edilen eğitim kesintisiz
+    eğitimle yalnızca istatistiksel olarak eşdeğerdir.
+    """
+    
+    def __init__(self, checkpoint_dir, callbacks, every_epochs=1, resume_state=None, seed=None, max_to_keep=2,
+                 sequences=(), options=None):
+        """
+        Args:
+            checkpoint_dir: Kontrol noktalarının yazılacağı dizin
+            callbacks: Durumu kaydedilecek diğer callback'ler
+            every_epochs: Kaç dönemde bir kontrol noktası alınacağı
+            resume_state: load_training_state ile okunan durum (devam ettirmek için)
+            seed: Eğitimde kullanılan rastgele tohum (devam ederken yeniden kullanılır)
+            max_to_keep: Saklanacak kontrol noktası sayısı
+            sequences: Rastgele durumu (get_state/set_state) kaydedilecek veri Sequence'ları
+            options: Kontrol noktasının yapısını belirleyen eğitim seçenekleri
+                (devam ederken aynı olmaları gerekir)
+        """
+        super().__init__()
+        self.checkpoint_dir = checkpoint_dir
+        self.tracked_callbacks = callbacks
+        self.every_epochs = every_epochs
+        self.resume_state = resume_state
+        self.seed = seed
+        self.max_to_keep = max_to_keep
+        self.sequences = list(sequences)
+        self.options = options or {}
+        self.history = {key: list(values) for key, values in resume_state['history'].items()} if resume_state else {}
+    
+    def _early_stopping_weights_path(self):
+        return os.path.join(self.checkpoint_dir, 'early_stopping_best_weights.npz')
+    
+    def on_train_begin(self, logs=None):
+        self.checkpoint = tf.train.Checkpoint(
+            model=self.model,
+            optimizer=self.model.optimizer,
+            rng=tf.random.get_global_generator(),
+            layer_rng=_layer_random_generators(self.model)
+        )
+        self.manager = tf.train.CheckpointManager(self.checkpoint, self.checkpoint_dir, max_to_keep=self.max_to_keep)
+        
+        if self.resume_state is None:
+            return
+        
+        # Optimizer değişkenleri ilk güncellemede oluşturulduğu için geri yüklemeden önce oluştur
+        self.model.optimizer.build(self.model.trainable_variables)
+        try:
+            self.checkpoint.restore(self.resume_state['checkpoint']).assert_existing_objects_matched()
+        except AssertionError:
+            raise ValueError(f"Kontrol noktası bu modelle uyuşmuyor (farklı mimari veya giriş boyutu?): "
+                             f"{self.resume_state['checkpoint']}") from None
+        
+        for callback in self.tracked_callbacks:
+            saved = self.resume_state['callbacks'].get(callback.__class__.__name__, {})
+            for attribute, value in saved.items():
+                setattr(callback, attribute, value)
+            
+            if callback.__class__.__name__ == 'EarlyStopping' and os.path.exists(self._early_stopping_weights_path()):
+                with np.load(self._early_stopping_weights_path()) as saved_weights:
+                    callback.best_weights = [saved_weights[f'arr_{i}'] for i in range(len(saved_weights.files))]
+        
+        self.model.optimizer.learning_rate.assign(self.resume_state['learning_rate'])
+        
+        numpy_state = self.resume_state['numpy_rng']
+        np.random.set_state((numpy_state[0], np.array(numpy_state[1], dtype=np.uint32)) + tuple(numpy_state[2:]))
+        python_state = self.resume_state['python_rng']
+        random.setstate((python_state[0], tuple(python_state[1]), python_state[2]))
+        
+        for sequence, sequence_state in zip(self.sequences, self.resume_state.get('sequence_rng', [])):
+            sequence.set_state(sequence_state)
+        
+        print(f"Eğitim {self.resume_state['epoch']}. dönemden devam ediyor: {self.resume_state['checkpoint']}")
+    
+    def on_epoch_end(self, epoch, logs=None):
+        for key, value in (logs or {}).items():
+            self.history.setdefault(key, []).append(float(value))
+        
+        if (epoch + 1) % self.every_epochs == 0 or self.model.stop_training:
+            self._save(epoch + 1)
+    
+    def _save(self, epoch):
+        checkpoint_path = self.manager.save(checkpoint_number=epoch)
+        
+        callback_state = {}
+        for callback in self.tracked_callbacks:
+            attributes = _CALLBACK_STATE_ATTRIBUTES.get(callback.__class__.__name__, ())
+            callback_state[callback.__class__.__name__] = {
+                attribute: getattr(callback, attribute).item() if hasattr(getattr(callback, attribute), 'item')
+                else getattr(callback, attribute)
+                for attribute in attributes
+            }
+            
+            if callback.__class__.__name__ == 'EarlyStopping' and callback.best_weights is not None:
+                np.savez(self._early_stopping_weights_path(), *callback.best_weights)
+        
+        numpy_state = np.random.get_state()
+        state = {
+            'checkpoint': checkpoint_path,
+            'epoch': epoch,
+            'seed': self.seed,
+            'learning_rate': float(tf.keras.backend.get_value(self.model.optimizer.learning_rate)),
+            'early_stopped': bool(self.model.stop_training),
+            'callbacks': callback_state,
+            'numpy_rng': [numpy_state[0], numpy_state[1].tolist()] + list(numpy_state[2:]),
+            'python_rng': random.getstate(),
+            # Sequence'ların durumu kendi on_epoch_end'lerinden önce (Keras callback'lerden
+            # sonra çağırır) alınır; set_state sonraki dönemin sıralamasını kendisi hazırlar
+            'sequence_rng': [sequence.get_state() for sequence in self.sequences],
+            'options': self.options,
+            'history': self.history
+        }
+        
+        # Yarım yazılmış durum dosyası bırakmamak için önce geçici dosyaya yaz
+        state_path = os.path.join(self.checkpoint_dir, 'training_state.json')
+        with open(state_path + '.tmp', 'w') as f:
+            json.dump(state, f)
+        os.replace(state_path + '.tmp', state_path)
+
+def _create_callbacks(model_save_path):
+    """
+    Eğitimde kullanılan standart geri çağırma (callback) listesini oluşturur.
+    
+    Args:
+        model_save_path: Modelin kaydedileceği yol
+        
+    Returns:
+        callbacks: Callback listesi
+    """
     # Model kontrol noktası
     os.makedirs(os.path.dirname(model_save_path), exist_ok=True)
     checkpoint = ModelCheckpoint(
@@ -107,13 +669,204 @@ def train_model(model, X_train, y_train, X_test, y_test, batch_size=32, epochs=3
         verbose=1
     )
     
+    return [checkpoint, early_stopping, reduce_lr]
+
+def _prepare_model_for_fit(model, jit_compile=False, accumulation_steps=1):
+    """
+    Modeli istenen eğitim seçenekleriyle (XLA, gradyan biriktirme) yeniden derler.
+    
+    Returns:
+        fit_model: fit çağrılacak model (gerekirse sarmalayıcı)
+    """
+    if not jit_compile and accumulation_steps <= 1:
+        return model
+    
+    fit_model = model
+    optimizer = model.optimizer
+    if accumulation_steps > 1:
+        fit_model = GradientAccumulationModel(model, accumulation_steps)
+        # Sarmalayıcı kendi optimizer durumunu tutar
+        optimizer = Adam(learning_rate=float(tf.keras.backend.get_value(model.optimizer.learning_rate)))
+        print(f"Gradyan biriktirme: her {accumulation_steps} batch'te bir güncelleme")
+    
+    fit_model.compile(
+        optimizer=optimizer,
+        loss=model.loss,
+        metrics=['accuracy'],
+        jit_compile=jit_compile
+    )
+    
+    if jit_compile:
+        print("XLA derlemesi etkin (jit_compile=True)")
+    
+    return fit_model
+
+def _fit(model, train_data, validation_data, epochs, model_save_path, num_samples,
+         batch_size=None, jit_compile=False, accumulation_steps=1, report_throughput=False,
+         profile_steps=None, checkpoint_every=0, resume=False, seed=None, run_options=None):
+    """
+    train_model ve train_model_on_sequence için ortak eğitim döngüsü.
+    """
+    options = dict(run_options or {}, xla=jit_compile, accumulation_steps=accumulation_steps)
+    fit_model = _prepare_model_for_fit(model, jit_compile, accumulation_steps)
+    
+    callbacks = _create_callbacks(model_save_path)
+    standard_callbacks = list(callbacks)
+    if report_throughput:
+        callbacks.append(ThroughputCallback(num_samples))
+    if profile_steps is not None:
+        callbacks.append(TrainingProfiler(batch_size or train_data.batch_size, profile_steps=profile_steps or None))
+    
+    initial_epoch = 0
+    resume_state = None
+    if resume:
+        resume_state = load_training_state(checkpoint_directory(model_save_path))
+        if resume_state is None:
+            print("Uyarı: Devam edilecek kontrol noktası bulunamadı, eğitim baştan başlıyor.")
+        elif resume_state['early_stopped']:
+            print(f"Eğitim {resume_state['epoch']}. dönemde erken durdurulmuş, devam edilecek dönem yok.")
+            initial_epoch = epochs
+        else:
+            initial_epoch = resume_state['epoch']
+        
+        # Kontrol noktasının yapısını değiştiren seçenekler aynı olmalı
+        for option, value in (resume_state or {}).get('options', {}).items():
+            if option in options and options[option] != value:
+                raise ValueError(f"Kontrol noktası --{option.replace('_', '-')} {value} ile alınmış, "
+                                 f"şimdiki değer {options[option]}; aynı değerle devam edin.")
+    
+    if checkpoint_every > 0 or resume_state is not None:
+        # Diğer callback'lerin durumunu geri yükleyebilmesi için listenin sonunda olmalı
+        callbacks.append(TrainingCheckpoint(
+            checkpoint_directory(model_save_path),
+            standard_callbacks,
+            every_epochs=max(1, checkpoint_every),
+            resume_state=resume_state,
+            seed=seed,
+            sequences=[train_data] if hasattr(train_data, 'get_state') else [],
+            options=options
+        ))
+    
+    history = fit_model.fit(
+        train_data,
+        # Kendi rastgele durumunu tutan Sequence'lar kendileri karıştırır; Keras'ın
+        # batch sırası karıştırması Python random'ını kullanır
+        shuffle=not hasattr(train_data, 'get_state'),
+        epochs=epochs,
+        initial_epoch=initial_epoch,
+        validation_data=validation_data,
+        callbacks=callbacks
+    )
+    
+    # Geçmiş, önceki çalıştırmanın dönemleriyle birleştirilir
+    if resume_state is not None:
+        for key, values in resume_state['history'].items():
+            history.history[key] = values + history.history.get(key, [])
+        history.epoch = list(range(resume_state['epoch'])) + history.epoch
+    
+    return history
+
+def train_model(model, X_train, y_train, X_test, y_test, batch_size=32, epochs=30, model_save_path='models/asl_model.h5',
+                jit_compile=False, accumulation_steps=1, report_throughput=False, profile_steps=None,
+                checkpoint_every=0, resume=False, seed=None, run_options=None):
+    """
+    Modeli eğitir.
+    
+    Args:
+        model: Eğitilecek model
+        X_train, y_train: Eğitim verileri
+        X_test, y_test: Test verileri
+        batch_size: Batch boyutu
+        epochs: Eğitim dönem sayısı
+        model_save_path: Modelin kaydedileceği yol
+        jit_compile: XLA derlemesi kullanılsın mı?
+        accumulation_steps: Gradyanların kaç batch boyunca biriktirileceği
+            (etkin batch boyutu = batch_size * accumulation_steps)
+        report_throughput: Dönem başına örnek/saniye raporlansın mı?
+        profile_steps: Verilirse adım profili çıkarılır; (ilk, son) adım aralığı için
+            TensorBoard izi alınır (boş demet: yalnızca süre ölçümü)
+        checkpoint_every: Kaç dönemde bir devam ettirilebilir kontrol noktası alınacağı (0: alınmaz)
+        resume: Son kontrol noktasından devam edilsin mi?
+        seed: Eğitimde kullanılan rastgele tohum (kontrol noktasına yazılır; eğitim
+            verisinin karıştırılmasında da kullanılır)
+        run_options: Kontrol noktasına yazılan ve devam ederken aynı olması gereken
+            ek seçenekler (ör. mimari)
+        
+    Returns:
+        history: Eğitim geçmişi
+        model: Eğitilmiş model
+    """
+    # Etiketleri one-hot kodlamasına dönüştürün
+    y_train_categorical = to_categorical(y_train)
+    y_test_categorical = to_categorical(y_test)
+    
+    # Karıştırma durumu kontrol noktasına yazılabilsin diye eğitim verisi Sequence ile verilir
+    train_sequence = ArraySequence(X_train, y_train_categorical, batch_size=batch_size, seed=seed)
+    
     # Modeli eğitin
-    history = model.fit(
-        X_train, y_train_categorical,
+    history = _fit(
+        model,
+        train_sequence,
+        (X_test, y_test_categorical),
+        epochs,
+        model_save_path,
+        num_samples=len(X_train),
         batch_size=batch_size,
-        epochs=epochs,
-        validation_data=(X_test, y_test_categorical),
-        callbacks=[checkpoint, early_stopping, reduce_lr]
+        jit_compile=jit_compile,
+        accumulation_steps=accumulation_steps,
+        report_throughput=report_throughput,
+        profile_steps=profile_steps,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
+        seed=seed,
+        run_options=run_options
+    )
+    
+    return history, model
+
+def train_model_on_sequence(model, train_sequence, val_sequence, epochs=30, model_save_path='models/asl_model.h5',
+                            jit_compile=False, accumulation_steps=1, report_throughput=False, profile_steps=None,
+                            checkpoint_every=0, resume=False, seed=None, run_options=None):
+    """
+    Modeli bellekte tutulmayan bir veri kaynağından (Keras Sequence) eğitir.
+    Batch boyutu Sequence tarafından belirlenir.
+    
+    Args:
+        model: Eğitilecek model
+        train_sequence: Eğitim verisi Sequence'ı
+        val_sequence: Doğrulama verisi Sequence'ı
+        epochs: Eğitim dönem sayısı
+        model_save_path: Modelin kaydedileceği yol
+        jit_compile: XLA derlemesi kullanılsın mı?
+        accumulation_steps: Gradyanların kaç batch boyunca biriktirileceği
+        report_throughput: Dönem başına örnek/saniye raporlansın mı?
+        profile_steps: Verilirse adım profili çıkarılır; (ilk, son) adım aralığı için
+            TensorBoard izi alınır (boş demet: yalnızca süre ölçümü)
+        checkpoint_every: Kaç dönemde bir devam ettirilebilir kontrol noktası alınacağı (0: alınmaz)
+        resume: Son kontrol noktasından devam edilsin mi?
+        seed: Eğitimde kullanılan rastgele tohum (kontrol noktasına yazılır)
+        run_options: Kontrol noktasına yazılan ve devam ederken aynı olması gereken
+            ek seçenekler (ör. mimari)
+        
+    Returns:
+        history: Eğitim geçmişi
+        model: Eğitilmiş model
+    """
+    history = _fit(
+        model,
+        train_sequence,
+        val_sequence,
+        epochs,
+        model_save_path,
+        num_samples=len(train_sequence) * train_sequence.batch_size,
+        jit_compile=jit_compile,
+        accumulation_steps=accumulation_steps,
+        report_throughput=report_throughput,
+        profile_steps=profile_steps,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
+        seed=seed,
+        run_options=run_options
     )
     
     return history, model
@@ -137,6 +890,24 @@ def evaluate_model(model, X_test, y_test):
     
     return test_loss, test_acc
 
+def evaluate_model_on_sequence(model, test_sequence):
+    """
+    Modeli bir Keras Sequence üzerinden değerlendirir.
+    
+    Args:
+        model: Değerlendirilecek model
+        test_sequence: Test verisi Sequence'ı
+        
+    Returns:
+        test_loss: Test kaybı
+        test_acc: Test doğruluğu
+    """
+    test_loss, test_acc = model.evaluate(test_sequence, verbose=1)
+    print(f"Test doğruluğu: {test_acc:.4f}")
+    print(f"Test kaybı: {test_loss:.4f}")
+    
+    return test_loss, test_acc
+
 def plot_training_history(history, save_path='models/training_history.png'):
     """
     Eğitim geçmişini görselleştirir.
@@ -0,0 +1,84 @@
+import os
+import tensorflow as tf
+
+class ServingModule(tf.Module):
+    """
+    Ön işlemeyi ve etiket sözlüğünü grafiğe gömen sunum modülü. İmza, herhangi
+    boyuttaki ham uint8 BGR kırpıntıları (OpenCV'nin verdiği biçim) batch olarak
+    alır; yeniden boyutlandırma, gerekirse gri tonlamaya çevirme ve /255
+    normalizasyonu ASLPredictor.preprocess_image ile aynı şekilde grafikte yapılır.
+    """
+
+    def __init__(self, model, class_names):
+        """
+        Args:
+            model: Eğitilmiş Keras modeli
+            class_names: Etiket kodu sırasıyla sınıf adları
+        """
+        super().__init__()
+        self.model = model
+        self.image_size = tuple(model.input_shape[1:3])
+        self.grayscale = model.input_shape[-1] == 1
+        self.class_names = tf.Variable(list(class_names), trainable=False, dtype=tf.string, name='class_names')
+
+    def preprocess(self, images):
+        """
+        uint8 BGR görüntüleri modelin girdisine çevirir.
+        """
+        # cv2.resize (INTER_LINEAR, kenar yumuşatmasız) ile aynı örnekleme
+        resized = tf.image.resize(tf.cast(images, tf.float32), self.image_size, method='bilinear', antialias=False)
+        if self.grayscale:
+            # BGR -> RGB, ardından cv2.COLOR_BGR2GRAY ile aynı katsayılar
+            resized = tf.image.rgb_to_grayscale(tf.reverse(resized, axis=[-1]))
+        return resized / 255.0
+
+    @tf.function(input_signature=[tf.TensorSpec([None, None, None, 3], tf.uint8, name='images')])
+    def serve(self, images):
+        probabilities = self.model(self.preprocess(images), training=False)
+        class_index = tf.argmax(probabilities, axis=-1, output_type=tf.int32)
+        return {
+            'probabilities': probabilities,
+            'class_index': class_index,
+            'class_name': tf.gather(self.class_names, class_index),
+            'confidence': tf.reduce_max(probabilities, axis=-1)
+        }
+
+    @tf.function(input_signature=[])
+    def labels(self):
+        return {'class_names': tf.identity(self.class_names)}
+
+def export_saved_model(model, class_names, export_dir):
+    """
+    Modeli ön işleme ve etiket sözlüğüyle birlikte tek başına çalışabilen bir
+    SavedModel olarak dışa aktarır. İstemcilerin label_encoder.pkl dosyasına veya
+    Python tarafında ön işlemeye ihtiyacı kalmaz.
+
+    Args:
+        model: Eğitilmiş Keras modeli
+        class_names: Etiket kodu sırasıyla sınıf adları (label_encoder.classes_)
+        export_dir: SavedModel dizini
+
+    Returns:
+        module: Dışa aktarılan sunum modülü
+    """
+    if len(class_names) != model.output_shape[-1]:
+        raise ValueError(f"Sınıf sayısı ({len(class_names)}) model çıkışıyla ({model.output_shape[-1]}) uyuşmuyor")
+
+    module = ServingModule(model, [str(name) for name in class_names])
+    os.makedirs(export_dir, exist_ok=True)
+    tf.saved_model.save(module, export_dir, signatures={
+        'serving_default': module.serve,
+        'labels': module.labels
+    })
+    return module
+
+def load_exported_model(export_dir):
+    """
+    Dışa aktarılan SavedModel'i yükler. Sunum imzası
+    loaded.signatures['serving_default'](images=...) ile çağrılır ve
+    probabilities, class_index, class_name ve confidence döndürür.
+
+    Returns:
+        loaded: Yüklenen SavedModel nesnesi
+    """
+    return tf.saved_model.load(export_dir)
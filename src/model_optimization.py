@@ -0,0 +1,319 @@
+import os
+import gzip
+import shutil
+import tempfile
+import numpy as np
+from tensorflow.keras.models import Sequential, load_model
+from tensorflow.keras.layers import (InputLayer, Conv2D, DepthwiseConv2D, BatchNormalization, Dense, Flatten,
+                                     GlobalAveragePooling2D)
+from tensorflow.keras.callbacks import EarlyStopping
+from tensorflow.keras.optimizers import Adam
+from tensorflow.keras.utils import to_categorical
+
+from model import _scale_filters, measure_inference_latency
+
+def _import_tfmot():
+    """
+    tensorflow-model-optimization paketini yükler. Paket yalnızca büyüklük
+    budaması ve ağırlık kümelemesi için gereklidir.
+    """
+    try:
+        import tensorflow_model_optimization as tfmot
+    except ImportError:
+        raise ImportError("Bu yöntem için tensorflow-model-optimization gerekli: "
+                          "pip install tensorflow-model-optimization")
+    return tfmot
+
+def _select_channels(weights, axis, keep_ratio):
+    """
+    L1 normu en büyük kanalların indekslerini (orijinal sırayla) döndürür.
+
+    Args:
+        weights: Ağırlık tensörü
+        axis: Kanal ekseni
+        keep_ratio: Tutulacak kanal oranı
+
+    Returns:
+        keep: Tutulacak kanal indeksleri
+    """
+    num_channels = weights.shape[axis]
+    other_axes = tuple(i for i in range(weights.ndim) if i != axis)
+    norms = np.abs(weights).sum(axis=other_axes)
+
+    # Kanal sayısı CPU vektör genişliği için 8'in katına yuvarlanır
+    num_keep = min(num_channels, _scale_filters(num_channels, keep_ratio))
+    return np.sort(np.argsort(norms)[::-1][:num_keep])
+
+def prune_channels(model, sparsity=0.5):
+    """
+    Sequential modeldeki Conv2D filtrelerini ve gizli Dense birimlerini L1 normuna göre
+    budayarak daha dar bir model oluşturur. Sonraki katmanların (BatchNormalization,
+    DepthwiseConv2D, Conv2D, Dense) ağırlıkları buna göre kesilir. Çıkış katmanına
+    dokunulmaz. Büyüklük budamasının aksine gerçek bir CPU hızlanması sağlar.
+
+    Args:
+        model: create_model ile oluşturulmuş Sequential model
+        sparsity: Her katmandan çıkarılacak kanal oranı
+
+    Returns:
+        pruned_model: Daha az kanallı yeni model (derlenmemiş)
+    """
+    if not isinstance(model, Sequential):
+        raise ValueError("Kanal budaması yalnızca Sequential modellerle desteklenir")
+
+    keep_ratio = 1.0 - sparsity
+    output_layer = model.layers[-1]
+
+    # Bir önceki katmanın tuttuğu kanallar (None: tümü)
+    keep = None
+    layers = [InputLayer(input_shape=model.input_shape[1:])]
+    layer_weights = []
+
+    for layer in model.layers:
+        config = layer.get_config()
+        weights = layer.get_weights()
+
+        if isinstance(layer, DepthwiseConv2D):
+            # Kanal başına bir filtre: giriş kanallarıyla birlikte kesilir
+            if keep is not None:
+                weights[0] = weights[0][:, :, keep, :]
+                if layer.use_bias:
+                    weights[1] = weights[1][keep]
+        elif isinstance(layer, Conv2D):
+            if keep is not None:
+                weights[0] = weights[0][:, :, keep, :]
+            keep = _select_channels(weights[0], 3, keep_ratio)
+            weights[0] = weights[0][:, :, :, keep]
+            if layer.use_bias:
+                weights[1] = weights[1][keep]
+            config['filters'] = len(keep)
+        elif isinstance(layer, BatchNormalization):
+            if keep is not None:
+                weights = [w[keep] for w in weights]
+        elif isinstance(layer, Flatten):
+            # (yükseklik, genişlik, kanal) sırasıyla düzleştirilen indeksleri hesapla
+            if keep is not None:
+                height, width, channels = layer.input_shape[1:]
+                offsets = np.arange(height * width) * channels
+                keep = (offsets[:, None] + keep[None, :]).reshape(-1)
+        elif isinstance(layer, Dense):
+            if keep is not None:
+                weights[0] = weights[0][keep, :]
+            if layer is output_layer:
+                keep = None
+            else:
+                keep = _select_channels(weights[0], 1, keep_ratio)
+                weights[0] = weights[0][:, keep]
+                if layer.use_bias:
+                    weights[1] = weights[1][keep]
+                config['units'] = len(keep)
+        elif not isinstance(layer, GlobalAveragePooling2D) and weights:
+            raise ValueError(f"Kanal budaması bu katmanı desteklemiyor: {layer.name}")
+
+        # Giriş şekli InputLayer'dan gelir
+        config.pop('batch_input_shape', None)
+        layers.append(layer.__class__.from_config(config))
+        layer_weights.append(weights)
+
+    pruned_model = Sequential(layers, name=model.name)
+    for layer, weights in zip(pruned_model.layers, layer_weights):
+        layer.set_weights(weights)
+
+    return pruned_model
+
+def apply_magnitude_pruning(model, sparsity=0.5, end_step=1000):
+    """
+    Ağırlıkları büyüklüğüne göre sıfırlayan budama sarmalayıcılarını ekler.
+    Seyreklik ince ayar boyunca 0'dan hedef değere kadar artırılır.
+
+    Args:
+        model: Budanacak model
+        sparsity: Hedef seyreklik oranı
+        end_step: Hedef seyrekliğe ulaşılacak eğitim adımı
+
+    Returns:
+        pruned_model: Budama sarmalayıcılı model (derlenmemiş)
+    """
+    tfmot = _import_tfmot()
+    schedule = tfmot.sparsity.keras.PolynomialDecay(
+        initial_sparsity=0.0,
+        final_sparsity=sparsity,
+        begin_step=0,
+        end_step=end_step,
+        # Maske en az 10 kez güncellenir (varsayılan 100 adım küçük veri setlerinde hiç tetiklenmez)
+        frequency=max(1, min(100, end_step // 10))
+    )
+    return tfmot.sparsity.keras.prune_low_magnitude(model, pruning_schedule=schedule)
+
+def apply_weight_clustering(model, num_clusters=16):
+    """
+    Her katmanın ağırlıklarını num_clusters ortak değere kümeleyen sarmalayıcıları ekler.
+
+    Args:
+        model: Kümelenecek model
+        num_clusters: Katman başına küme (benzersiz ağırlık) sayısı
+
+    Returns:
+        clustered_model: Kümeleme sarmalayıcılı model (derlenmemiş)
+    """
+    tfmot = _import_tfmot()
+    return tfmot.clustering.keras.cluster_weights(
+        model,
+        number_of_clusters=num_clusters,
+        cluster_centroids_init=tfmot.clustering.keras.CentroidInitialization.KMEANS_PLUS_PLUS
+    )
+
+def strip_optimization_wrappers(model):
+    """
+    Budama ve kümeleme sarmalayıcılarını kaldırarak düz bir Keras modeli döndürür.
+    Sarmalayıcı yoksa model olduğu gibi döner.
+    """
+    wrapped = any(layer.__class__.__name__ in ('PruneLowMagnitude', 'ClusterWeights') for layer in model.layers)
+    if not wrapped:
+        return model
+
+    tfmot = _import_tfmot()
+    model = tfmot.sparsity.keras.strip_pruning(model)
+    return tfmot.clustering.keras.strip_clustering(model)
+
+def load_optimized_model(model_path):
+    """
+    Modeli yükler. Sarmalayıcıları kaldırılmadan kaydedilmiş budanmış veya
+    kümelenmiş modeller de yüklenir ve düz modele çevrilir.
+
+    Args:
+        model_path: Model dosya yolu
+
+    Returns:
+        model: Yüklenen model
+    """
+    try:
+        return load_model(model_path)
+    except ValueError as e:
+        if 'PruneLowMagnitude' not in str(e) and 'ClusterWeights' not in str(e):
+            raise
+
+    tfmot = _import_tfmot()
+    with tfmot.sparsity.keras.prune_scope(), tfmot.clustering.keras.cluster_scope():
+        model = load_model(model_path)
+    return strip_optimization_wrappers(model)
+
+def fine_tune(model, X_train, y_train, X_test, y_test, batch_size=32, epochs=5, learning_rate=1e-4,
+              callbacks=None, early_stopping=True):
+    """
+    Budanmış veya kümelenmiş modele kısa bir ince ayar uygular.
+
+    Args:
+        model: İnce ayar yapılacak model
+        X_train, y_train: Eğitim verileri
+        X_test, y_test: Test verileri
+        batch_size: Batch boyutu
+        epochs: İnce ayar dönem sayısı
+        learning_rate: Öğrenme oranı
+        callbacks: Ek callback'ler (ör. budama adımı)
+        early_stopping: Erken durdurma kullanılsın mı? En iyi ağırlıkları geri
+            yüklediği için seyrekliği artan budamada kapatılmalıdır.
+
+    Returns:
+        history: İnce ayar geçmişi
+    """
+    num_classes = model.output_shape[-1]
+    model.compile(
+        optimizer=Adam(learning_rate=learning_rate),
+        loss='categorical_crossentropy',
+        metrics=['accuracy']
+    )
+
+    # Sarmalayıcılar kaldırılmadan önce diske yazılmaması için kontrol noktası kullanılmaz
+    callbacks = list(callbacks or [])
+    if early_stopping:
+        callbacks.append(EarlyStopping(monitor='val_loss', patience=3, restore_best_weights=True, verbose=1))
+
+    return model.fit(
+        X_train, to_categorical(y_train, num_classes=num_classes),
+        batch_size=batch_size,
+        epochs=epochs,
+        validation_data=(X_test, to_categorical(y_test, num_classes=num_classes)),
+        callbacks=callbacks
+    )
+
+def optimize_model(model, method, X_train, y_train, X_test, y_test, sparsity=0.5, num_clusters=16,
+                   batch_size=32, epochs=5):
+    """
+    Modeli seçilen yöntemle budar veya kümeler, ince ayar yapar ve sarmalayıcıları kaldırır.
+
+    Args:
+        model: Eğitilmiş model
+        method: 'channels' (yapısal kanal budaması), 'magnitude' (büyüklük budaması)
+            veya 'cluster' (ağırlık kümeleme)
+        X_train, y_train: Eğitim verileri
+        X_test, y_test: Test verileri
+        sparsity: Budama oranı
+        num_clusters: Kümeleme için katman başına küme sayısı
+        batch_size: Batch boyutu
+        epochs: İnce ayar dönem sayısı
+
+    Returns:
+        optimized_model: Kaydedilmeye hazır düz Keras modeli
+    """
+    callbacks = []
+    if method == 'channels':
+        optimized_model = prune_channels(model, sparsity)
+    elif method == 'magnitude':
+        steps_per_epoch = int(np.ceil(len(X_train) / batch_size))
+        # Seyreklik ince ayarın ilk yarısında hedefe ulaşır, kalanında doğruluk toparlanır
+        optimized_model = apply_magnitude_pruning(model, sparsity, end_step=max(1, steps_per_epoch * epochs // 2))
+        callbacks.append(_import_tfmot().sparsity.keras.UpdatePruningStep())
+    elif method == 'cluster':
+        optimized_model = apply_weight_clustering(model, num_clusters)
+    else:
+        raise ValueError(f"Bilinmeyen optimizasyon yöntemi: {method}")
+
+    if epochs > 0:
+        fine_tune(optimized_model, X_train, y_train, X_test, y_test, batch_size=batch_size, epochs=epochs,
+                  callbacks=callbacks, early_stopping=method != 'magnitude')
+
+    optimized_model = strip_optimization_wrappers(optimized_model)
+    optimized_model.compile(
+        optimizer=Adam(learning_rate=1e-4),
+        loss='categorical_crossentropy',
+        metrics=['accuracy']
+    )
+    return optimized_model
+
+def _compressed_size(path):
+    """
+    Dosyanın gzip ile sıkıştırılmış boyutunu döndürür. Seyrek ve kümelenmiş
+    ağırlıkların kazancı ham dosya boyutunda değil, sıkıştırılmış boyutta görünür.
+    """
+    with tempfile.TemporaryFile() as compressed:
+        with open(path, 'rb') as source, gzip.GzipFile(fileobj=compressed, mode='wb') as target:
+            shutil.copyfileobj(source, target)
+        return compressed.tell()
+
+def model_statistics(model):
+    """
+    Modelin parametre sayısını, sıfır olmayan ağırlık sayısını, dosya boyutlarını
+    ve CPU gecikmesini döndürür. Dosya boyutu, optimizer durumu olmadan kaydedilmiş
+    .h5 dosyası üzerinden ölçülür.
+
+    Args:
+        model: Model
+
+    Returns:
+        statistics: İstatistik sözlüğü
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_path = os.path.join(temp_dir, 'model.h5')
+        model.save(model_path, include_optimizer=False)
+        file_size = os.path.getsize(model_path)
+        compressed_size = _compressed_size(model_path)
+
+    statistics = {
+        'params': int(model.count_params()),
+        'nonzero_params': int(sum(np.count_nonzero(w) for w in model.get_weights())),
+        'file_size_bytes': file_size,
+        'compressed_size_bytes': compressed_size
+    }
+    statistics.update(measure_inference_latency(model))
+    return statistics
@@ -0,0 +1,277 @@
+import math
+import numpy as np
+
+from gesture_recognizer import landmarks_to_array
+
+# Avuç merkezi için kullanılan noktalar: bilek ve parmak kökleri (MCP)
+PALM_POINTS = [0, 5, 9, 13, 17]
+
+def palm_center(points):
+    """
+    Avuç merkezinin (x, y) konumu.
+    """
+    return points[PALM_POINTS, :2].mean(axis=0)
+
+class LandmarkRingBuffer:
+    """
+    Son karelerin landmark noktalarını ve zaman damgalarını sabit boyutlu,
+    önceden ayrılmış dizilerde tutan halka tampon. Ekleme ve en eskiyi atma O(1)'dir.
+    """
+
+    def __init__(self, capacity=64, num_features=0):
+        """
+        Args:
+            capacity: Tutulacak en fazla kare sayısı
+            num_features: Kare başına saklanacak ek özellik sayısı
+        """
+        self.capacity = capacity
+        self.points = np.zeros((capacity, 21, 3))
+        self.timestamps = np.zeros(capacity)
+        self.features = np.zeros((capacity, num_features))
+        self.start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, points, timestamp, features=()):
+        """
+        Yeni kareyi ekler. Tampon doluysa en eski kare atılır.
+
+        Returns:
+            evicted: Atılan karenin özellikleri (atılmadıysa None)
+        """
+        evicted = None
+        if self.size == self.capacity:
+            evicted = self.pop_oldest()
+
+        slot = (self.start + self.size) % self.capacity
+        self.points[slot] = points
+        self.timestamps[slot] = timestamp
+        self.features[slot] = features
+        self.size += 1
+        return evicted
+
+    def pop_oldest(self):
+        """
+        En eski kareyi atar.
+
+        Returns:
+            features: Atılan karenin özellikleri (kopya)
+        """
+        features = self.features[self.start].copy()
+        self.start = (self.start + 1) % self.capacity
+        self.size -= 1
+        return features
+
+    def latest(self, age=0):
+        """
+        Baştan age kare önceki (noktalar, zaman damgası) çiftini döndürür.
+        """
+        # age 0: en yeni kare, size - 1: en eski kare
+        slot = (self.start + self.size - 1 - age) % self.capacity
+        return self.points[slot], self.timestamps[slot]
+
+    def oldest(self):
+        """
+        En eski (noktalar, zaman damgası) çiftini döndürür.
+        """
+        return self.points[self.start], self.timestamps[self.start]
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+class _HandMotion:
+    """
+    Tek bir elin hareket geçmişi. Kare başına özellikler (yön değişimi, dönüş
+    açısı, yol uzunluğu, tutma) halka tamponda saklanır ve zaman penceresi
+    üzerindeki toplamları artımlı olarak güncellenir.
+    """
+
+    # Kare özelliklerinin sütunları
+    REVERSAL, TURN, STEP, PINCH = range(4)
+
+    def __init__(self, capacity):
+        self.buffer = LandmarkRingBuffer(capacity, num_features=4)
+        self.sums = np.zeros(4)
+        self.last_center = None
+        self.last_velocity = None
+        self.last_direction_x = 0
+
+    def reset(self):
+        self.buffer.clear()
+        self.sums[:] = 0
+        self.last_center = None
+        self.last_velocity = None
+        self.last_direction_x = 0
+
+class MotionGestureRecognizer:
+    """
+    Kaydırma, el sallama, daire çizme ve tutup sürükleme gibi hareketli el
+    hareketlerini tanır. Her el için son karelerin halka tamponu tutulur ve
+    yörünge özellikleri her karede O(1) işle artımlı olarak güncellenir.
+    """
+
+    def __init__(self, window_seconds=0.8, capacity=64, min_duration=0.15, min_step=0.05,
+                 swipe_distance=0.25, wave_reversals=3, wave_amplitude=0.5, circle_turn=1.6 * math.pi,
+                 circle_radius=0.5, drag_distance=0.15, pinch_ratio=0.35):
+        """
+        Args:
+            window_seconds: Hareketin değerlendirildiği zaman penceresi (saniye)
+            capacity: El başına tutulacak en fazla kare sayısı
+            min_duration: Karar vermek için gereken en kısa pencere süresi (saniye)
+            min_step: Hareket sayılacak en küçük kare başına yer değiştirme (avuç boyuna oranı)
+            swipe_distance: Kaydırma için gereken yatay yer değiştirme (normalize)
+            wave_reversals: El sallama için gereken yatay yön değişimi sayısı
+            wave_amplitude: El sallamanın en küçük genliği (avuç boyuna oranı)
+            circle_turn: Daire için gereken toplam dönüş açısı (radyan)
+            circle_radius: Daire için en küçük yarıçap (avuç boyuna oranı)
+            drag_distance: Tutup sürükleme için gereken yer değiştirme (normalize)
+            pinch_ratio: Başparmak-işaret ucu mesafesinin avuç boyuna oranı bunun altındaysa tutma
+        """
+        self.window_seconds = window_seconds
+        self.capacity = capacity
+        self.min_duration = min_duration
+        self.min_step = min_step
+        self.swipe_distance = swipe_distance
+        self.wave_reversals = wave_reversals
+        self.wave_amplitude = wave_amplitude
+        self.circle_turn = circle_turn
+        self.circle_radius = circle_radius
+        self.drag_distance = drag_distance
+        self.pinch_ratio = pinch_ratio
+
+        # Tanınabilecek hareketler - Türkçe karakter sorunlarını önlemek için ASCII karakterlere çevir
+        self.GESTURES = {
+            "swipe_left": "Sola Kaydirma",
+            "swipe_right": "Saga Kaydirma",
+            "wave": "El Sallama",
+            "circle": "Daire",
+            "pinch_drag": "Tutup Surukleme"
+        }
+
+        # El kimliği -> _HandMotion
+        self.hands = {}
+
+    def update(self, hand_id, hand_landmarks, timestamp):
+        """
+        Elin yeni karesini ekler ve tamamlanan hareketli el hareketini döndürür.
+
+        Args:
+            hand_id: El kimliği (ör. 'Left'/'Right' veya iz kimliği)
+            hand_landmarks: MediaPipe el landmark noktaları veya (21, 3) dizi
+            timestamp: Karenin zamanı (saniye)
+
+        Returns:
+            gesture_name: Tanınan hareketli el hareketi (yoksa "unknown")
+            confidence: Tanıma güveni
+        """
+        points = landmarks_to_array(hand_landmarks)
+        motion = self.hands.get(hand_id)
+        if motion is None:
+            motion = self.hands[hand_id] = _HandMotion(self.capacity)
+
+        center = palm_center(points)
+        palm_size = math.hypot(*(points[9, :2] - points[0, :2]))
+        features = self._frame_features(motion, points, center, palm_size)
+        motion.last_center = center
+
+        # Pencereden çıkan karelerin katkısı toplamlardan düşülür
+        buffer = motion.buffer
+        evicted = buffer.push(points, timestamp, features)
+        if evicted is not None:
+            motion.sums -= evicted
+        motion.sums += features
+        while len(buffer) > 1 and timestamp - buffer.oldest()[1] > self.window_seconds:
+            motion.sums -= buffer.pop_oldest()
+
+        gesture = self._classify(motion, center, timestamp, palm_size)
+        if gesture is None:
+            return "unknown", 0.0
+
+        # Aynı hareket tekrar tetiklenmesin diye geçmiş temizlenir
+        motion.reset()
+        return gesture
+
+    def _frame_features(self, motion, points, center, palm_size):
+        """
+        Yeni karenin önceki kareye göre özelliklerini hesaplar.
+        """
+        features = np.zeros(4)
+        # Eşik avuç boyuyla ölçeklenir: kameradan uzaklık değişse de landmark titremesi hareket sayılmaz
+        min_step = self.min_step * palm_size
+
+        if motion.last_center is not None:
+            velocity = center - motion.last_center
+            step = math.hypot(velocity[0], velocity[1])
+
+            if step >= min_step:
+                features[_HandMotion.STEP] = step
+
+                # Yatay yön değişimi (el sallama)
+                direction_x = 1 if velocity[0] > 0 else -1
+                if abs(velocity[0]) >= min_step:
+                    if motion.last_direction_x and direction_x != motion.last_direction_x:
+                        features[_HandMotion.REVERSAL] = 1
+                    motion.last_direction_x = direction_x
+
+                # Hız vektörünün işaretli dönüş açısı (daire)
+                if motion.last_velocity is not None:
+                    previous = motion.last_velocity
+                    cross = previous[0] * velocity[1] - previous[1] * velocity[0]
+                    dot = previous[0] * velocity[0] + previous[1] * velocity[1]
+                    turn = math.atan2(cross, dot)
+                    # Geri dönüşler (el sallama) dönüş sayılmaz; işaretleri gürültüye bağlıdır
+                    if abs(turn) < 0.75 * math.pi:
+                        features[_HandMotion.TURN] = turn
+                motion.last_velocity = velocity
+
+        # Tutma: başparmak-işaret ucu mesafesi avuç boyuna göre küçük
+        pinch_distance = math.hypot(*(points[4, :2] - points[8, :2]))
+        features[_HandMotion.PINCH] = pinch_distance < self.pinch_ratio * palm_size
+
+        return features
+
+    def _classify(self, motion, center, timestamp, palm_size):
+        """
+        Pencere toplamlarından ve pencerenin ilk/son konumlarından karar verir (O(1)).
+        """
+        buffer = motion.buffer
+        oldest_points, oldest_timestamp = buffer.oldest()
+        if timestamp - oldest_timestamp < self.min_duration:
+            return None
+
+        displacement = center - palm_center(oldest_points)
+        distance = math.hypot(displacement[0], displacement[1])
+        reversals, turn, path_length, pinch_frames = motion.sums
+
+        # Tutup sürükleme: penceredeki tüm karelerde tutma ve yeterli yer değiştirme
+        if pinch_frames >= len(buffer) and distance >= self.drag_distance:
+            return "pinch_drag", 0.8
+
+        # Daire: yaklaşık tam tur dönüş, en az circle_radius yarıçaplı bir çevre kadar yol
+        # ve başladığı yere yakın bitiş (yerinde titreyen elin rastgele dönüşleri elenir)
+        if (abs(turn) >= self.circle_turn and path_length >= 2 * math.pi * self.circle_radius * palm_size and
+                distance < 0.3 * path_length):
+            return "circle", 0.8
+
+        # El sallama: birden fazla yatay yön değişimi ve her yarım salınımda en az iki genlik kadar yol
+        if reversals >= self.wave_reversals and path_length >= 2 * reversals * self.wave_amplitude * palm_size:
+            return "wave", 0.8
+
+        # Kaydırma: tek yönde, düze yakın bir yolla baskın yatay yer değiştirme (ekran koordinatlarında)
+        if (reversals == 0 and distance >= 0.8 * path_length and abs(displacement[0]) >= self.swipe_distance and
+                abs(displacement[0]) > 2 * abs(displacement[1])):
+            return ("swipe_right" if displacement[0] > 0 else "swipe_left"), 0.85
+
+        return None
+
+    def reset(self, hand_id=None):
+        """
+        Bir elin (veya tüm ellerin) hareket geçmişini siler.
+        """
+        if hand_id is None:
+            self.hands.clear()
+        else:
+            self.hands.pop(hand_id, None)
@@ -0,0 +1,142 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+from dataset_shards import ShardedDataset, ShardedSequence, update_sharded_dataset
+
+# Her çalışan süreçte bir kez açılan parçalı veri setleri (dizin -> ShardedDataset)
+_DATASETS = {}
+
+def default_threads_per_worker(workers):
+    """
+    Çalışanlar arasında çekirdekleri paylaştırır (çalışan başına en az 1 iş parçacığı).
+    """
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+def _init_worker(threads_per_worker):
+    """
+    Çalışan süreç başlatıcısı. TensorFlow işlem çalıştırmadan önce iş parçacığı
+    sayılarını sınırlar; böylece çalışanlar aynı çekirdekler için yarışmaz.
+    """
+    for variable in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ[variable] = str(threads_per_worker)
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+    import cv2
+    import tensorflow as tf
+
+    cv2.setNumThreads(threads_per_worker)
+    tf.config.threading.set_intra_op_parallelism_threads(threads_per_worker)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+def get_dataset(dataset_dir):
+    """
+    Parçalı veri setini süreç başına bir kez açar. Parçalar salt okunur olarak
+    belleğe eşlendiği için tüm çalışanlar aynı sayfa önbelleğini paylaşır;
+    veri seti her çalışanda yeniden çözümlenmez.
+    """
+    if dataset_dir not in _DATASETS:
+        _DATASETS[dataset_dir] = ShardedDataset(dataset_dir)
+    return _DATASETS[dataset_dir]
+
+def prepare_shared_dataset(data_dir, dataset_dir, image_size):
+    """
+    Çalışanların paylaşacağı parçalı veri setini oluşturur veya günceller.
+
+    Args:
+        data_dir: Veri setinin yolu (None veya yoksa mevcut parçalar kullanılır)
+        dataset_dir: Parçalı veri seti klasörü
+        image_size: Parçalardaki görüntü boyutu (genişlik, yükseklik)
+
+    Returns:
+        dataset: Ana süreçte açılmış ShardedDataset
+    """
+    if data_dir and os.path.isdir(data_dir):
+        update_sharded_dataset(data_dir, dataset_dir, image_size=image_size)
+    return ShardedDataset(dataset_dir)
+
+def run_parallel(function, tasks, workers=2, threads_per_worker=None):
+    """
+    Görevleri 'spawn' ile başlatılan yerel süreç havuzunda çalıştırır ve
+    tamamlandıkça sonuçları döndürür.
+
+    Args:
+        function: Modül düzeyinde tanımlı (pickle edilebilir) görev fonksiyonu
+        tasks: Görev argümanları listesi
+        workers: Paralel süreç sayısı
+        threads_per_worker: Çalışan başına TensorFlow/OpenCV iş parçacığı sayısı
+
+    Yields:
+        (task_index, result): Görev sırası ve sonucu
+    """
+    threads_per_worker = threads_per_worker or default_threads_per_worker(workers)
+    print(f"{len(tasks)} görev, {workers} süreç, süreç başına {threads_per_worker} iş parçacığı")
+
+    # fork, ana süreçte başlatılmış TensorFlow durumunu kopyalayacağı için kullanılmaz
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(threads_per_worker,)) as executor:
+        futures = {executor.submit(function, task): i for i, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def train_candidate(task):
+    """
+    Bir çalışan süreçte parçalı veri setinin verilen indeksleriyle bir modeli eğitir
+    ve doğrulama indeksleri üzerinde değerlendirir.
+
+    Args:
+        task: Görev sözlüğü:
+            dataset_dir, train_indices, val_indices: Veri seti ve bölme
+            arch, width_multiplier, learning_rate, batch_size, image_size, augment:
+                Model ve eğitim ayarları
+            epochs: Bu görevde ulaşılacak toplam dönem sayısı
+            model_path: Verilirse model buraya kaydedilir; dosya varsa eğitim oradan
+                devam eder (ardışık yarılama için)
+            seed: Rastgele tohum
+            return_predictions: Doğrulama tahminleri sonuçla döndürülsün mü?
+
+    Returns:
+        result: Doğruluk, kayıp, parametre sayısı ve isteğe bağlı tahminler
+    """
+    import tensorflow as tf
+    from model import create_model, load_trained_model
+
+    tf.keras.utils.set_random_seed(task.get('seed', 42))
+    dataset = get_dataset(task['dataset_dir'])
+    image_size = (task['image_size'], task['image_size'])
+
+    train_sequence = ShardedSequence(dataset, task['train_indices'], batch_size=task['batch_size'], shuffle=True,
+                                     seed=task.get('seed', 42), image_size=image_size, augment=task['augment'])
+    val_sequence = ShardedSequence(dataset, task['val_indices'], batch_size=task['batch_size'], shuffle=False,
+                                   image_size=image_size)
+
+    model_path = task.get('model_path')
+    initial_epoch = task.get('initial_epoch', 0)
+    if model_path and initial_epoch > 0 and os.path.exists(model_path):
+        model = load_trained_model(model_path)
+    else:
+        initial_epoch = 0
+        model = create_model((task['image_size'], task['image_size'], dataset.image_shape[-1]), dataset.num_classes,
+                             arch=task['arch'], width_multiplier=task['width_multiplier'],
+                             learning_rate=task['learning_rate'])
+
+    model.fit(train_sequence, epochs=task['epochs'], initial_epoch=initial_epoch, verbose=0)
+    if model_path:
+        model.save(model_path)
+
+    val_loss, val_accuracy = model.evaluate(val_sequence, verbose=0)
+    result = {
+        'val_accuracy': float(val_accuracy),
+        'val_loss': float(val_loss),
+        'params': int(model.count_params()),
+        'epochs': task['epochs']
+    }
+
+    if task.get('return_predictions'):
+        probabilities = model.predict(val_sequence, verbose=0)
+        result['y_true'] = dataset.labels[np.asarray(task['val_indices'])].tolist()
+        result['y_pred'] = np.argmax(probabilities, axis=1).tolist()
+
+    return result
@@ -1,14 +1,75 @@
 import cv2
 import numpy as np
 import tensorflow as tf
-from tensorflow.keras.models import load_model
+import time
 import mediapipe as mp  # MediaPipe kütüphanesi
 
+from model_optimization import load_optimized_model
+from landmark_filter import OneEuroFilter
+from gesture_recognizer import LandmarkFrame
+
 # MediaPipe el izleme modüllerini başlat
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 mp_drawing_styles = mp.solutions.drawing_styles
 
+# hand_detection'ın her karede yeniden kullandığı landmark dizisi
+_landmark_frame = LandmarkFrame(max_hands=1)
+
+def postprocess_predictions(predictions, class_names, class_weights, class_thresholds, min_confidence):
+    """
+    Model olasılıklarına üretimdeki son işlemeyi uygular: sınıf ağırlıkları,
+    sınıfa özgü güven eşikleri ve 'b' tahminleri için ikinci tahmine geçiş.
+    
+    Args:
+        predictions: Tek görüntünün olasılık vektörü
+        class_names: Etiket kodu sırasıyla sınıf adları
+        class_weights: Sınıf adı -> ağırlık
+        class_thresholds: Sınıf adı -> güven eşiği
+        min_confidence: Eşiği olmayan sınıflar için genel güven eşiği
+        
+    Returns:
+        top_index: Tahmin edilen sınıf kodu
+        confidence: Tahmin güveni (ağırlıksız)
+        weighted_predictions: Ağırlıklı olasılıklar
+        sorted_indices: Ağırlıklı olasılığa göre azalan sınıf kodları
+    """
+    # Tahminlere ağırlık uygula
+    weighted_predictions = predictions.copy()
+    for i, class_name in enumerate(class_names):
+        if class_name in class_weights:
+            weighted_predictions[i] *= class_weights[class_name]
+    
+    # Tahminleri güven değerine göre sırala
+    sorted_indices = np.argsort(weighted_predictions)[::-1]  # En yüksekten en düşüğe
+    
+    # En yüksek olasılıklı sınıfı bul
+    top_index = sorted_indices[0]
+    confidence = predictions[top_index]  # Orijinal (ağırlıksız) güven değeri
+    predicted_class = class_names[top_index]
+    
+    # Sınıf-spesifik güven eşiğini kontrol et
+    threshold = class_thresholds.get(predicted_class, min_confidence)
+    
+    # Eğer güven eşiğinin altındaysa veya 'b' tahminini doğrulamak istiyorsak
+    if confidence < threshold or predicted_class == 'b':
+        # İlk 3 tahmini hesapla
+        top_3_indices = sorted_indices[:3]
+        top_3_classes = [class_names[i] for i in top_3_indices]
+        top_3_confidences = predictions[top_3_indices]
+        
+        # b harfi için özel kontrol
+        if predicted_class == 'b' and len(top_3_indices) > 1:
+            # Eğer 2. tahmin 'a', 'c' veya 'bye' ise ve yeterince yüksek güvene sahipse
+            if top_3_classes[1] in ['a', 'c', 'bye', 'o'] and top_3_confidences[1] > 0.25:
+                # Güvenler arasındaki fark yeterince az ise, 2. tahmini kullan
+                confidence_diff = top_3_confidences[0] - top_3_confidences[1]
+                if confidence_diff < 0.2:  # %20'den az fark varsa
+                    top_index = top_3_indices[1]
+                    confidence = top_3_confidences[1]
+    
+    return top_index, confidence, weighted_predictions, sorted_indices
+
 class ASLPredictor:
     def __init__(self, model_path, label_encoder, image_size=(64, 64), use_grayscale=False):
         """
@@ -20,7 +81,8 @@ class ASLPredictor:
             image_size: Görüntü boyutu
             use_grayscale: Gri tonlama kullanılsın mı?
         """
-        self.model = load_model(model_path)
+        # Budanmış veya kümelenmiş modeller de düz model olarak yüklenir
+        self.model = load_optimized_model(model_path)
         self.label_encoder = label_encoder
         self.class_names = label_encoder.classes_
         self.use_grayscale = use_grayscale
@@ -106,6 +168,37 @@ class ASLPredictor:
         
         return batch
     
+    def postprocess(self, predictions):
+        """
+        Bir olasılık vektörüne tahmin edicinin ağırlık ve eşik ayarlarıyla
+        son işlemeyi uygular (bkz. postprocess_predictions).
+        """
+        return postprocess_predictions(predictions, self.class_names, self.class_weights,
+                                       self.class_thresholds, self.min_confidence)
+    
+    def predict_batch(self, images):
+        """
+        Birden fazla görüntüyü tek model çağrısıyla tahmin eder. Son işleme
+        predict ile aynıdır.
+        
+        Args:
+            images: Tahmin edilecek görüntüler (farklı boyutlarda olabilir)
+            
+        Returns:
+            predicted_indices: Son işlemeden sonra tahmin edilen sınıf kodları
+            confidences: Tahmin güvenleri
+            predictions: Ham olasılıklar (N, sınıf sayısı)
+        """
+        batch = np.concatenate([self.preprocess_image(image) for image in images])
+        predictions = np.asarray(self.model.predict_on_batch(batch))
+        
+        predicted_indices = np.empty(len(predictions), dtype=np.int64)
+        confidences = np.empty(len(predictions), dtype=np.float32)
+        for i, probabilities in enumerate(predictions):
+            predicted_indices[i], confidences[i], _, _ = self.postprocess(probabilities)
+        
+        return predicted_indices, confidences, predictions
+    
     def predict(self, image):
         """
         Görüntüyü tahmin eder.
@@ -124,39 +217,9 @@ class ASLPredictor:
         # Tahmin yap
         predictions = self.model.predict(processed_image, verbose=0)[0]
         
-        # Tahminlere ağırlık uygula
-        weighted_predictions = predictions.copy()
-        for i, class_name in enumerate(self.class_names):
-            if class_name in self.class_weights:
-                weighted_predictions[i] *= self.class_weights[class_name]
-        
-        # Tahminleri güven değerine göre sırala
-        sorted_indices = np.argsort(weighted_predictions)[::-1]  # En yüksekten en düşüğe
-        
-        # En yüksek olasılıklı sınıfı bul
-        top_index = sorted_indices[0]
-        confidence = predictions[top_index]  # Orijinal (ağırlıksız) güven değeri
-        predicted_class = self.label_encoder.inverse_transform([top_index])[0]
-        
-        # Sınıf-spesifik güven eşiğini kontrol et
-        threshold = self.class_thresholds.get(predicted_class, self.min_confidence)
-        
-        # Eğer güven eşiğinin altındaysa veya 'b' tahminini doğrulamak istiyorsak
-        if confidence < threshold or predicted_class == 'b':
-            # İlk 3 tahmini hesapla
-            top_3_indices = sorted_indices[:3]
-            top_3_classes = self.label_encoder.inverse_transform(top_3_indices)
-            top_3_confidences = predictions[top_3_indices]
-            
-            # b harfi için özel kontrol
-            if predicted_class == 'b':
-                # Eğer 2. tahmin 'a', 'c' veya 'bye' ise ve yeterince yüksek güvene sahipse
-                if top_3_classes[1] in ['a', 'c', 'bye', 'o'] and top_3_confidences[1] > 0.25:
-                    # Güvenler arasındaki fark yeterince az ise, 2. tahmini kullan
-                    confidence_diff = top_3_confidences[0] - top_3_confidences[1]
-                    if confidence_diff < 0.2:  # %20'den az fark varsa
-                        predicted_class = top_3_classes[1]
-                        confidence = top_3_confidences[1]
+        # Ağırlık, eşik ve 'b' düzeltmesini uygula
+        top_index, confidence, weighted_predictions, sorted_indices = self.postprocess(predictions)
+        predicted_class = self.class_names[top_index]
         
         # Tüm tahminleri hazırla
         all_predictions = []
@@ -169,12 +232,13 @@ class ASLPredictor:
         
         return predicted_class, confidence, all_predictions
 
-def hand_detection(frame):
+def hand_detection(frame, landmark_filter=None):
     """
     Kare içindeki el bölgesini tespit eder.
     
     Args:
         frame: Kamera karesi
+        landmark_filter: Verilirse ROI, titreşimi yumuşatılmış noktalardan hesaplanır (OneEuroFilter)
         
     Returns:
         hand_region: El bölgesi
@@ -210,31 +274,32 @@ def hand_detection(frame):
     
     # Eğer el tespit edilmediyse standart merkez bölgeyi kullan
     if not mp_hand_detected:
+        # El kaybolunca filtre durumu sıfırlanır
+        if landmark_filter:
+            landmark_filter.reset(0)
+        
         # Standart merkez bölge için koordinatlar
-    box_size = min(height, width) // 2
-    x = (width - box_size) // 2
-    y = (height - box_size) // 2
+        box_size = min(height, width) // 2
+        x = (width - box_size) // 2
+        y = (height - box_size) // 2
         roi = frame[y:y+box_size, x:x+box_size].copy() if y+box_size <= height and x+box_size <= width else np.zeros((box_size, box_size, 3), dtype=np.uint8)
         roi_box = (x, y, box_size, box_size)
         hand_landmarks = None
         return roi, roi_box, False, hand_landmarks
     
-    # El noktalarının sınırlarını belirle
-    landmarks = results.multi_hand_landmarks[0].landmark
-    landmark_points = []
+    # El noktaları bir kez diziye çevrilir (tek el tespit edildiği için iz kimliği 0)
+    normalized_points = _landmark_frame.update(results)
+    if landmark_filter:
+        normalized_points = landmark_filter(normalized_points, [0], time.time())
     
-    for landmark in landmarks:
-        # Koordinatları piksel konumlarına dönüştür
-        landmark_x = int(landmark.x * width)
-        landmark_y = int(landmark.y * height)
-        landmark_points.append((landmark_x, landmark_y))
+    # Koordinatları piksel konumlarına dönüştür
+    landmark_points = (normalized_points[0, :, :2] * (width, height)).astype(int)
     
     # El sınırlarını belirle (biraz boşluk bırakarak)
     padding = 30  # El bölgesi etrafında daha fazla boşluk bırak
-    min_x = max(0, min([pt[0] for pt in landmark_points]) - padding)
-    min_y = max(0, min([pt[1] for pt in landmark_points]) - padding)
-    max_x = min(width, max([pt[0] for pt in landmark_points]) + padding)
-    max_y = min(height, max([pt[1] for pt in landmark_points]) + padding)
+    min_x, min_y = np.maximum(landmark_points.min(axis=0) - padding, 0)
+    max_x, max_y = np.minimum(landmark_points.max(axis=0) + padding, (width, height))
+    min_x, min_y, max_x, max_y = int(min_x), int(min_y), int(max_x), int(max_y)
     
     # Karesel bir bölge elde etmek için
     box_size = max(max_x - min_x, max_y - min_y)
@@ -283,6 +348,9 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
     mp_drawing = mp.solutions.drawing_utils
     mp_drawing_styles = mp.solutions.drawing_styles
     
+    # ROI kutusunun kareden kareye titrememesi için landmark filtresi
+    landmark_filter = OneEuroFilter()
+    
     # Kamera açılma durumunu kontrol et
     if not cap.isOpened():
         print(f"Hata: Kamera {camera_id} açılamadı!")
@@ -361,9 +429,9 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
     max_empty_frames = 10  # Arka arkaya 10 boş kare alırsak hata ver
     
     try:
-    while True:
-        # Kare oku
-        ret, frame = cap.read()
+        while True:
+            # Kare oku
+            ret, frame = cap.read()
         
             if not ret or frame is None:
                 empty_frame_count += 1
@@ -371,7 +439,7 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                 
                 if empty_frame_count >= max_empty_frames:
                     print("Hata: Kamera veri akışı yok. Lütfen kamera bağlantınızı kontrol edin.")
-            break
+                    break
                 
                 # Kısa bir süre bekle ve tekrar dene
                 cv2.waitKey(100)
@@ -389,21 +457,21 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                 cv2.imwrite(test_file, frame)
                 print(f"Test karesi kaydedildi: {test_file}")
         
-        # Görüntüyü çevir (ayna efekti)
-        if flip_image:
-            frame = cv2.flip(frame, 1)
+            # Görüntüyü çevir (ayna efekti)
+            if flip_image:
+                frame = cv2.flip(frame, 1)
         
             # Kamera görüntü boyutunu küçült (büyük görüntüler için, daha hızlı işlem)
             display_frame = cv2.resize(frame, (0, 0), fx=0.7, fy=0.7)
             
             # El bölgesini al ve el tespit edilip edilmediğini kontrol et
-            hand_roi, roi_box, hand_detected, hand_landmarks = hand_detection(frame)
+            hand_roi, roi_box, hand_detected, hand_landmarks = hand_detection(frame, landmark_filter)
             
             # Debug ekranı için elle ilgili ek bilgiler
             debug_image = hand_roi.copy()
             
             # Çerçeveyi çiz - el tespiti durumuna göre renk değiştir
-        x, y, w, h = roi_box
+            x, y, w, h = roi_box
             rect_color = (0, 255, 0) if hand_detected else (0, 0, 255)  # Yeşil veya kırmızı
             cv2.rectangle(display_frame, (int(x*0.7), int(y*0.7)), 
                         (int((x+w)*0.7), int((y+h)*0.7)), rect_color, 2)
@@ -510,30 +578,30 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                         all_predictions = []
                         debug_note = ""
             
-            # Tahminleri kaydet
-            recent_predictions.append((predicted_class, confidence))
-            if len(recent_predictions) > smoothing_window:
-                recent_predictions.pop(0)
+                    # Tahminleri kaydet
+                    recent_predictions.append((predicted_class, confidence))
+                    if len(recent_predictions) > smoothing_window:
+                        recent_predictions.pop(0)
             
-            # En sık tahmini bul
-            prediction_counts = {}
-            for pred, conf in recent_predictions:
-                if pred in prediction_counts:
-                    prediction_counts[pred] += 1
-                else:
-                    prediction_counts[pred] = 1
+                    # En sık tahmini bul
+                    prediction_counts = {}
+                    for pred, conf in recent_predictions:
+                        if pred in prediction_counts:
+                            prediction_counts[pred] += 1
+                        else:
+                            prediction_counts[pred] = 1
             
                     # Alternatif tahminleri hesapla (ilk 3 en yüksek tahmin)
                     sorted_predictions = sorted(prediction_counts.items(), key=lambda x: x[1], reverse=True)
                     
                     # En yaygın tahmin
                     most_common_prediction = sorted_predictions[0][0]
-            prediction_ratio = prediction_counts[most_common_prediction] / len(recent_predictions)
+                    prediction_ratio = prediction_counts[most_common_prediction] / len(recent_predictions)
             
-            # Yeterince kararlı ise tahmini göster
+                    # Yeterince kararlı ise tahmini göster
                     if prediction_ratio > 0.5:  # Tahminlerin en az %50'si aynı ise
                         # Ana tahmini göster
-            display_text = f"{most_common_prediction}"
+                        display_text = f"{most_common_prediction}"
                         cv2.putText(display_frame, display_text, (int(x*0.7), int(y*0.7)-10), 
                                 cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 0), 3)
                         
@@ -550,8 +618,8 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                                     (10, alt_y_pos + i*25), 
                                     cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 0), 1)
             
-            # Güven değerini göster
-            avg_confidence = np.mean([conf for pred, conf in recent_predictions if pred == most_common_prediction])
+                    # Güven değerini göster
+                    avg_confidence = np.mean([conf for pred, conf in recent_predictions if pred == most_common_prediction])
                     cv2.putText(display_frame, f"Güven: {avg_confidence:.2f}", (10, 30), 
                             cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                     
@@ -561,7 +629,7 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                         cv2.putText(display_frame, correction_text, (10, 60), 
                                 cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 165, 0), 2)
             
-            # Kullanıcıya bilgi ver
+                    # Kullanıcıya bilgi ver
                     cv2.putText(display_frame, "El işaretinizi kare içine yerleştirin", 
                             (10, display_frame.shape[0]-20), 
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
@@ -606,8 +674,8 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
                                 (10, 180 + i*25), 
                                 cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 0), 2)
             
-        except Exception as e:
-            print(f"Tahmin hatası: {e}")
+            except Exception as e:
+                print(f"Tahmin hatası: {e}")
                 cv2.putText(debug_image, f"Hata: {e}", (10, 25), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
         
@@ -616,10 +684,10 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
             cv2.imshow(debug_window, debug_image)
         
             # Kullanıcının görebilmesi için görüntüyü biraz beklet
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord(exit_key):
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord(exit_key):
                 print("Kullanıcı çıkış yaptı.")
-            break
+                break
     
     except Exception as e:
         print(f"Beklenmeyen hata: {e}")
@@ -627,8 +695,8 @@ def start_webcam_prediction(predictor, camera_id=0, flip_image=True, exit_key='q
     finally:
         # Kaynakları serbest bırak
         print("Kamera kapatılıyor...")
-    cap.release()
-    cv2.destroyAllWindows()
+        cap.release()
+        cv2.destroyAllWindows()
         print("Program sonlandırıldı.")
 
 def predict_from_image(predictor, image_path):
@@ -653,7 +721,7 @@ def predict_from_image(predictor, image_path):
     try:
         predicted_class, confidence, all_predictions = predictor.predict(image)
     except ValueError:  # Eski versiyonla uyumluluk için
-    predicted_class, confidence = predictor.predict(image)
+        predicted_class, confidence = predictor.predict(image)
         all_predictions = []
     
     print(f"Tahmin: {predicted_class}")
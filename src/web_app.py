@@ -19,6 +19,11 @@ from flask_socketio import SocketIO
 import mediapipe as mp
 from gesture_recognizer import GestureRecognizer
 from gesture_actions import GestureActions
+from motion_gestures import MotionGestureRecognizer
+from custom_gestures import CustomGestureStore
+from hand_tracker import HandTracker
+from landmark_filter import OneEuroFilter
+from gesture_recognizer import LandmarkFrame
 
 # Flask uygulamasını oluştur
 app = Flask(__name__)
@@ -28,6 +33,17 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 # Sınıfları başlat
 gesture_recognizer = GestureRecognizer()
 gesture_actions = GestureActions()
+motion_recognizer = MotionGestureRecognizer()
+hand_tracker = HandTracker()
+landmark_frame = LandmarkFrame()
+landmark_filter = OneEuroFilter()
+gesture_names = {**gesture_recognizer.GESTURES, **motion_recognizer.GESTURES}
+
+# gesture_demo.py --record ile kaydedilen özel hareketler
+custom_store = CustomGestureStore()
+for custom_name in custom_store.names:
+    gesture_names[custom_name] = custom_name
+    gesture_actions.register_action(custom_name)
 
 # Kamera nesnesi ve değişkenler
 camera = None
@@ -37,9 +53,6 @@ frame_height = 480
 flip_image = True
 is_camera_running = False
 is_processing = False
-current_gesture = None
-current_confidence = 0
-heart_detected = False
 
 # İki el izleme için değişkenler
 max_hands = 2
@@ -89,52 +102,9 @@ def stop_camera():
         camera = None
     return True
 
-# İki el arasında kalp tespiti
-def check_heart_gesture_two_hands(left_hand_landmarks, right_hand_landmarks):
-    """
-    İki el kullanarak kalp hareketi yapılıp yapılmadığını kontrol eder.
-    """
-    if left_hand_landmarks is None or right_hand_landmarks is None:
-        return False
-    
-    # Sol elin başparmak ve işaret parmağı uçları
-    left_thumb_tip = left_hand_landmarks.landmark[4]
-    left_index_tip = left_hand_landmarks.landmark[8]
-    
-    # Sağ elin başparmak ve işaret parmağı uçları
-    right_thumb_tip = right_hand_landmarks.landmark[4]
-    right_index_tip = right_hand_landmarks.landmark[8]
-    
-    # Her elin başparmak ve işaret parmağı arasındaki mesafe
-    left_distance = ((left_thumb_tip.x - left_index_tip.x)**2 + 
-                    (left_thumb_tip.y - left_index_tip.y)**2)**0.5
-    
-    right_distance = ((right_thumb_tip.x - right_index_tip.x)**2 + 
-                     (right_thumb_tip.y - right_index_tip.y)**2)**0.5
-    
-    # İki elin birbirine yakınlığı
-    hand_distance = ((left_thumb_tip.x - right_thumb_tip.x)**2 + 
-                    (left_thumb_tip.y - right_thumb_tip.y)**2)**0.5
-    
-    # Başparmakların Y konumu (ekranda aşağı)
-    thumbs_down = (left_thumb_tip.y > left_hand_landmarks.landmark[0].y and 
-                  right_thumb_tip.y > right_hand_landmarks.landmark[0].y)
-    
-    # Kalp hareketi: 
-    # 1. Her elin başparmak ve işaret parmakları açık olmalı (kısa mesafe)
-    # 2. İki el birbirine yakın olmalı
-    # 3. İki elin başparmakları aşağı doğru olmalı
-    if left_distance < 0.15 and right_distance < 0.15 and hand_distance < 0.3 and thumbs_down:
-        return True
-    
-    return False
-
 # Görüntü işleme fonksiyonu
 def process_frame():
-    global camera, is_processing, current_gesture, current_confidence, heart_detected
-    
-    left_hand_landmarks = None
-    right_hand_landmarks = None
+    global camera, is_processing
     
     while is_camera_running:
         if camera is None or not camera.isOpened():
@@ -172,41 +142,36 @@ def process_frame():
         # Panel kenarlarını belirginleştir
         cv2.rectangle(frame, (0, 0), (frame_width, 120), panel_color, 2)
         
-        # İki el arasında kalp tespiti için değişkenleri sıfırla
-        left_hand_landmarks = None
-        right_hand_landmarks = None
-        heart_detected = False
+        # MediaPipe sonucu karede bir kez diziye çevrilir; sonraki tüm adımlar bu diziyi
+        # kullanır, protobuf landmark'ları yalnızca iskelet çizimi için tutulur
+        hand_points = landmark_frame.update(results)
+        multi_hand_landmarks = landmark_frame.hand_landmarks
+        
+        # Elleri izlerle eşleştir; kaybolan izlerin yörünge geçmişi silinir
+        track_ids = hand_tracker.assign(hand_points)
+        for track_id in hand_tracker.lost_ids:
+            motion_recognizer.reset(track_id)
+            landmark_filter.reset(track_id)
+        
+        # Tanıyıcılar yumuşatılmış noktaları kullanır; iskelet ham noktalarla çizilir
+        if len(hand_points):
+            hand_points = landmark_filter(hand_points, track_ids, time.time())
         
         # Eğer el tespit edildiyse
-        if results.multi_hand_landmarks:
-            # Her el için
-            multi_hand_landmarks = results.multi_hand_landmarks
-            
-            # Elleri belirleme (Sağ/Sol)
-            if len(multi_hand_landmarks) == 2 and max_hands == 2:
-                # İki el varsa, hangi el sol/sağ olduğunu belirleme 
-                hand1_x = multi_hand_landmarks[0].landmark[0].x
-                hand2_x = multi_hand_landmarks[1].landmark[0].x
-                
-                # Ekranda solda görünen el (flip varsa gerçekte sağ el)
-                if hand1_x < hand2_x:
-                    left_hand_landmarks = multi_hand_landmarks[0]
-                    right_hand_landmarks = multi_hand_landmarks[1]
-                else:
-                    left_hand_landmarks = multi_hand_landmarks[1]
-                    right_hand_landmarks = multi_hand_landmarks[0]
-                
-                # İki elle kalp tespiti
-                heart_detected = check_heart_gesture_two_hands(left_hand_landmarks, right_hand_landmarks)
-                if heart_detected:
-                    current_gesture = "heart"
-                    current_confidence = 0.95  # İki elle kalp daha yüksek güven
-                    
-                    # Eylemi işle
-                    gesture_actions.process_gesture("heart", current_confidence)
+        if multi_hand_landmarks:
+            # İki elle yapılan hareketler (kalp, alkış, mola, çerçeve); çifti oluşturan
+            # ellerin ikisi de bu hareketi gözler ve tek el tanımasına girmez
+            paired = ()
+            if len(multi_hand_landmarks) >= 2 and max_hands == 2:
+                two_hand_gesture, two_hand_confidence, pair = gesture_recognizer.recognize_two_hand_gesture(
+                    hand_points, landmark_frame.handedness)
+                if pair:
+                    paired = pair
+                    for index in pair:
+                        hand_tracker.observe(track_ids[index], two_hand_gesture, two_hand_confidence)
             
             # Her el için döngü
-            for idx, hand_landmarks in enumerate(multi_hand_landmarks):
+            for index, (hand_landmarks, points, track_id) in enumerate(zip(multi_hand_landmarks, hand_points, track_ids)):
                 # El iskeletini çiz
                 if show_skeleton:
                     mp_drawing.draw_landmarks(
@@ -216,30 +181,44 @@ def process_frame():
                         mp_drawing_styles.get_default_hand_landmarks_style(),
                         mp_drawing_styles.get_default_hand_connections_style())
                 
-                # İki elle kalp tespit edilmediyse, normal tanıma
-                if not heart_detected:
-                    # Hareketi tanı
-                    gesture_name, confidence = gesture_recognizer.recognize_gesture(hand_landmarks)
+                # İki el hareketine katılmadıysa, normal tanıma
+                if index not in paired:
+                    # Kullanıcının kaydettiği özel hareketler kurallardan önce denenir
+                    gesture_name, confidence = custom_store.classify(points)
+                    if gesture_name == "unknown":
+                        # Hareketi tanı
+                        gesture_name, confidence = gesture_recognizer.recognize_gesture(points)
                     
-                    # Mevcut hareketi güncelle
-                    if gesture_name != "unknown" and confidence > 0.6:
-                        current_gesture = gesture_name
-                        current_confidence = confidence
-                        
-                        # Eylemi işle
-                        gesture_actions.process_gesture(gesture_name, confidence)
-        else:
-            # El tespit edilemedi mesajını kaldırıyoruz
-            current_gesture = None
-            current_confidence = 0
+                    # Ham sonuç elin durum makinesine verilir
+                    hand_tracker.observe(track_id, gesture_name, confidence)
+                
+                # Hareketli el hareketleri (iz başına yörünge geçmişi)
+                motion_name, motion_confidence = motion_recognizer.update(track_id, points, time.time())
+                if motion_name != "unknown":
+                    hand_tracker.trigger(track_id, motion_name, motion_confidence)
         
-        # Mevcut hareketi büyük olarak göster (eğer varsa)
-        if current_gesture:
-            # Hareket adını Türkçe olarak al
-            gesture_display_name = gesture_recognizer.GESTURES.get(current_gesture, "Bilinmeyen Hareket")
-            
-            # ASCII olmayan karakterleri temizle veya değiştir
-            gesture_display_name = gesture_display_name.replace("ş", "s").replace("ğ", "g").replace("ü", "u").replace("ö", "o").replace("ç", "c").replace("ı", "i")
+        # Yalnızca onaylanmış geçişler eylem tetikler ve istemciye gönderilir
+        events = hand_tracker.pop_events()
+        performed = set()
+        for event in events:
+            if event.gesture != "unknown" and event.gesture not in performed:
+                performed.add(event.gesture)
+                gesture_actions.process_gesture(event.gesture, event.confidence)
+        
+        if events:
+            # Gösterilecek hareket: onaylanmış hareketler arasında en güvenlisi (yoksa "unknown")
+            active_gestures = hand_tracker.active_gestures()
+            if active_gestures:
+                _, current_gesture, current_confidence = max(active_gestures, key=lambda item: item[2])
+                
+                # Hareket adını Türkçe olarak al
+                gesture_display_name = gesture_names.get(current_gesture, "Bilinmeyen Hareket")
+                
+                # ASCII olmayan karakterleri temizle veya değiştir
+                gesture_display_name = gesture_display_name.replace("ş", "s").replace("ğ", "g").replace("ü", "u").replace("ö", "o").replace("ç", "c").replace("ı", "i")
+            else:
+                current_gesture, current_confidence = "unknown", 0.0
+                gesture_display_name = "unknown"
             
             # WebSocket ile hareketi gönder
             socketio.emit('gesture_detected', {
@@ -0,0 +1,64 @@
+import pickle
+import shutil
+
+import numpy as np
+
+from custom_gestures import CustomGestureStore
+
+def _prototype(rng):
+    points = rng.uniform(0.2, 0.8, size=(21, 3))
+    points[9] = points[0] + [0, -0.2, 0]
+    return points
+
+def _frames(rng, prototype, n=30):
+    return [prototype + rng.normal(0, 0.004, size=(21, 3)) for _ in range(n)]
+
+def test_add_save_reload_and_classify(tmp_path):
+    rng = np.random.default_rng(0)
+    path = str(tmp_path / 'custom.npz')
+    prototypes = {name: _prototype(rng) for name in ('wave_hi', 'salute', 'spock')}
+
+    store = CustomGestureStore(path)
+    for name, prototype in prototypes.items():
+        assert store.add_gesture(name, _frames(rng, prototype), max_samples=10) == 10
+    store.save()
+
+    reloaded = CustomGestureStore(path)
+    # Örnekler ve indeks ilk ihtiyaç duyulana kadar yüklenmez
+    assert reloaded._vectors is None and reloaded._index is None
+    assert reloaded.names == list(prototypes)
+    assert len(reloaded) == 30
+
+    for name, prototype in prototypes.items():
+        # Konum ve el boyutu değişse de aynı hareket tanınır
+        gesture, confidence = reloaded.classify(prototype * 1.5 + 0.1)
+        assert gesture == name and 0.6 <= confidence <= 1.0
+    assert reloaded.classify(rng.uniform(0, 1, size=(21, 3))) == ("unknown", 0.0)
+
+    reloaded.remove_gesture('salute')
+    reloaded.save()
+    assert CustomGestureStore(path).names == ['wave_hi', 'spock']
+    assert CustomGestureStore(path).classify(prototypes['spock'])[0] == 'spock'
+
+def test_stale_index_is_rebuilt(tmp_path):
+    rng = np.random.default_rng(1)
+    path = str(tmp_path / 'custom.npz')
+    first, second = _prototype(rng), _prototype(rng)
+
+    store = CustomGestureStore(path)
+    store.add_gesture('first', _frames(rng, first))
+    store.save()
+    stale_index = str(tmp_path / 'stale.pkl')
+    shutil.copy(store.index_path, stale_index)
+
+    store.add_gesture('second', _frames(rng, second))
+    store.save()
+    # Örnekler güncel, indeks dosyası eski örneklerden kalma
+    shutil.copy(stale_index, store.index_path)
+
+    reloaded = CustomGestureStore(path)
+    assert reloaded.classify(second)[0] == 'second'
+    with open(reloaded.index_path, 'rb') as f:
+        stored = pickle.load(f)
+    assert stored['fingerprint'] == reloaded._fingerprint()
+    assert stored['index'].data.shape[0] == len(reloaded)
@@ -0,0 +1,82 @@
+import numpy as np
+
+from dataset_dedup import (find_duplicate_clusters, find_droppable_duplicates, cluster_ids, hamming_distance,
+                           BKTree)
+
+# Ardışık özetler 3 bit uzakta, uçlar birbirinden 9 bit uzakta: geçişli zincir
+CHAIN = [0, 0b111, 0b111111, 0b111111111]
+
+def _check_drop(hashes, labels, max_distance):
+    """
+    Çıkarılan her örneğin, tutulan aynı etiketli bir temsilciye max_distance
+    içinde olduğunu ve tutulanların birbirinin kopyası olmadığını doğrular.
+    """
+    dropped, num_representatives = find_droppable_duplicates(hashes, max_distance, labels)
+    kept = [i for i in range(len(hashes)) if i not in set(dropped) and hashes[i] is not None]
+
+    for i in dropped:
+        assert any(labels[k] == labels[i] and hamming_distance(hashes[k], hashes[i]) <= max_distance
+                   for k in kept)
+    for a in kept:
+        for b in kept:
+            if a < b and labels[a] == labels[b]:
+                assert hamming_distance(hashes[a], hashes[b]) > max_distance
+    return dropped, num_representatives
+
+def test_chained_near_duplicates_keep_representatives():
+    labels = ['A'] * 4
+    assert find_duplicate_clusters(CHAIN, max_distance=4, labels=labels) == [[0, 1, 2, 3]]
+
+    # Zincirin tamamı tek kümede olsa da yalnızca temsilcinin yakın kopyaları çıkarılır
+    dropped, num_representatives = _check_drop(CHAIN, labels, max_distance=4)
+    assert dropped == [1, 3]
+    assert num_representatives == 2
+
+def test_cross_label_near_duplicates_are_kept():
+    labels = ['A', 'B', 'A', 'A']
+    assert find_duplicate_clusters(CHAIN, max_distance=4, labels=labels) == [[2, 3]]
+    assert cluster_ids(CHAIN, max_distance=4, labels=labels).tolist() == [0, 1, 2, 2]
+
+    dropped, num_representatives = _check_drop(CHAIN, labels, max_distance=4)
+    assert dropped == [3]
+    assert num_representatives == 1
+
+    # Birebir aynı görüntü farklı sınıftaysa da çıkarılmaz
+    assert find_droppable_duplicates([5, 5, 5], labels=['A', 'B', 'A']) == ([2], 1)
+
+def test_random_hashes_never_group_across_labels():
+    rng = np.random.default_rng(0)
+    # Birkaç kaynak özetin çevresinde az sayıda bit çevrilmiş yakın kopyalar
+    sources = [int(value) for value in rng.integers(0, 2 ** 63, size=20)]
+    hashes = []
+    for _ in range(400):
+        value = sources[rng.integers(len(sources))]
+        for bit in rng.choice(64, size=rng.integers(0, 5), replace=False):
+            value ^= 1 << int(bit)
+        hashes.append(value)
+    hashes[7] = None
+    labels = rng.choice(['A', 'B', 'C'], size=len(hashes)).tolist()
+
+    clusters = find_duplicate_clusters(hashes, max_distance=4, labels=labels)
+    assert clusters
+    for cluster in clusters:
+        assert len({labels[i] for i in cluster}) == 1
+        assert 7 not in cluster
+
+    groups = cluster_ids(hashes, max_distance=4, labels=labels)
+    for group in np.unique(groups):
+        assert len({labels[i] for i in np.flatnonzero(groups == group)}) == 1
+
+    dropped, _ = _check_drop(hashes, labels, max_distance=4)
+    assert dropped and 7 not in dropped
+
+def test_bktree_search_matches_brute_force():
+    rng = np.random.default_rng(1)
+    hashes = [int(value) for value in rng.integers(0, 2 ** 16, size=300)]
+    tree = BKTree()
+    for i, hash_value in enumerate(hashes):
+        tree.add(hash_value, i)
+
+    for query in hashes[:30]:
+        expected = [i for i, hash_value in enumerate(hashes) if hamming_distance(query, hash_value) <= 3]
+        assert sorted(tree.search(query, 3)) == expected
@@ -0,0 +1,65 @@
+import os
+
+import cv2
+import numpy as np
+
+from dataset_shards import build_sharded_dataset, update_sharded_dataset, ShardedDataset
+
+IMAGE_SIZE = (16, 16)
+
+def _write_image(path, seed):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image = np.random.default_rng(seed).integers(0, 255, (24, 24, 3), dtype=np.uint8)
+    cv2.imwrite(str(path), image)
+
+def _contents(dataset_dir):
+    """
+    Geçerli örnekleri göreli yol -> (sınıf adı, görüntü) olarak döndürür.
+    """
+    dataset = ShardedDataset(str(dataset_dir))
+    indices = dataset.valid_indices()
+    images = dataset.get_images(indices)
+    samples = dataset.manifest['samples']
+    return dataset.classes, {samples[i]: (dataset.classes[dataset.labels[i]], image)
+                             for i, image in zip(indices, images)}
+
+def test_incremental_update_matches_fresh_build(tmp_path):
+    data_dir = tmp_path / 'images'
+    for label, seeds in (('A', range(0, 5)), ('B', range(10, 14)), ('D', range(30, 32))):
+        for seed in seeds:
+            _write_image(data_dir / label / f'{seed}.jpg', seed)
+
+    incremental_dir = tmp_path / 'incremental'
+    # Küçük parçalar: güncelleme birden fazla yeni parça yazsın
+    build_sharded_dataset(str(data_dir), str(incremental_dir), image_size=IMAGE_SIZE, shard_size=3)
+
+    # Ekle (yeni sınıf dahil), sil (bir sınıfın tamamı dahil), içeriği değiştir, yalnızca zamanı değiştir
+    _write_image(data_dir / 'A' / '100.jpg', 100)
+    _write_image(data_dir / 'C' / '200.jpg', 200)
+    os.remove(data_dir / 'B' / '10.jpg')
+    for seed in (30, 31):
+        os.remove(data_dir / 'D' / f'{seed}.jpg')
+    _write_image(data_dir / 'A' / '1.jpg', 300)
+    os.utime(data_dir / 'A' / '1.jpg', (1, 1))
+    os.utime(data_dir / 'A' / '2.jpg', (2, 2))
+
+    report = update_sharded_dataset(str(data_dir), str(incremental_dir), image_size=IMAGE_SIZE, shard_size=3)
+    assert sorted(report['added']) == [os.path.join('A', '100.jpg'), os.path.join('C', '200.jpg')]
+    assert sorted(report['removed']) == [os.path.join('B', '10.jpg'), os.path.join('D', '30.jpg'),
+                                         os.path.join('D', '31.jpg')]
+    assert report['changed'] == [os.path.join('A', '1.jpg')]
+
+    fresh_dir = tmp_path / 'fresh'
+    build_sharded_dataset(str(data_dir), str(fresh_dir), image_size=IMAGE_SIZE, shard_size=3)
+
+    incremental_classes, incremental = _contents(incremental_dir)
+    fresh_classes, fresh = _contents(fresh_dir)
+    assert incremental_classes == fresh_classes == ['A', 'B', 'C']
+    assert set(incremental) == set(fresh)
+    for relative_path, (label, image) in fresh.items():
+        assert incremental[relative_path][0] == label
+        np.testing.assert_array_equal(incremental[relative_path][1], image)
+
+    # Değişiklik yoksa ikinci güncelleme hiçbir şey yapmaz
+    report = update_sharded_dataset(str(data_dir), str(incremental_dir), image_size=IMAGE_SIZE, shard_size=3)
+    assert report == {'added': [], 'removed': [], 'changed': [], 'rebuilt': False}
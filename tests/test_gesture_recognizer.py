@@ -0,0 +1,125 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gesture_recognizer import GestureRecognizer, GestureRule, GESTURE_RULES
+
+def _random_hands(n, seed):
+    # Farklı el boyutlarında rastgele noktalar; MediaPipe gibi float32 hassasiyetinde
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.3, 0.7, size=(n, 1, 3))
+    spread = rng.choice([0.02, 0.05, 0.1, 0.3], size=(n, 1, 1))
+    points = base + rng.normal(0, 1, size=(n, 21, 3)) * spread
+    return points.astype(np.float32).astype(np.float64)
+
+def _as_landmarks(points):
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points])
+
+def _angle(p, i, j):
+    v1 = (p[i][0] - p[0][0], p[i][1] - p[0][1])
+    v2 = (p[j][0] - p[0][0], p[j][1] - p[0][1])
+    cos_angle = (v1[0] * v2[0] + v1[1] * v2[1]) / (math.hypot(*v1) * math.hypot(*v2))
+    return math.degrees(math.acos(max(-1, min(1, cos_angle))))
+
+def _distance(p, i, j):
+    return math.sqrt(sum((p[i][k] - p[j][k]) ** 2 for k in range(3)))
+
+def _thumb_direction(p):
+    dx, dy = p[4][0] - p[1][0], p[4][1] - p[1][1]
+    if abs(dy) > abs(dx):
+        return "up" if dy < 0 else "down"
+    return "right" if dx > 0 else "left"
+
+def _baseline_recognize(points):
+    """
+    Kurallar tablosundan önceki if zincirinin tek el için birebir kopyası.
+    """
+    p = points.tolist()
+    if p[0][0] > p[4][0]:
+        thumb = 1 if p[4][0] < p[2][0] else 0
+    else:
+        thumb = 1 if p[4][0] > p[2][0] else 0
+    fingers = [thumb] + [1 if p[tip][1] < p[tip - 1][1] else 0 for tip in (8, 12, 16, 20)]
+    direction = _thumb_direction(p)
+
+    if fingers == [1, 0, 0, 0, 0] and direction == "up":
+        return "thumbs_up", 0.9
+    if fingers == [1, 0, 0, 0, 0] and direction == "down":
+        return "thumbs_down", 0.9
+    if fingers == [0, 1, 1, 0, 0] and _angle(p, 8, 12) > 20:
+        return "peace", 0.85
+    if fingers[0] == 1 and _distance(p, 4, 8) < 0.07:
+        return "ok", 0.85
+    if fingers == [0, 0, 0, 0, 0]:
+        return "fist", 0.85
+    if fingers == [1, 1, 1, 1, 1]:
+        angles = [_angle(p, tip, tip + 4) for tip in (4, 8, 12, 16)]
+        if sum(angles) / len(angles) > 15:
+            return "open_hand", 0.8
+    if fingers == [0, 1, 0, 0, 0]:
+        return "pointing", 0.85
+    if fingers == [0, 1, 0, 0, 1]:
+        return "rock", 0.85
+    if fingers[1] == 1 and _distance(p, 4, 8) < 0.1:
+        return "pinch", 0.8
+    if fingers == [1, 1, 0, 0, 0] and direction == "up" and _angle(p, 4, 8) > 45:
+        return "gun", 0.85
+    # count_one "pointing" ile aynı desende ondan sonra denendiği için hiç dönmez
+    if fingers == [0, 1, 1, 0, 0] and p[8][1] < p[0][1] and p[12][1] < p[0][1] and _angle(p, 8, 12) < 15:
+        return "count_two", 0.9
+    if fingers == [1, 0, 0, 0, 1] and p[20][1] < p[0][1] - 0.1:
+        return "phone", 0.85
+    if p[4][1] > p[0][1] and p[20][1] > p[0][1]:
+        inward = (direction == "right" and p[4][0] < p[0][0]) or (direction == "left" and p[4][0] > p[0][0])
+        if fingers[1] == 0 and fingers[2] == 0 and _distance(p, 4, 20) < 0.15 and inward:
+            return "heart", 0.75
+    return "unknown", 0.4
+
+@pytest.fixture(scope='module')
+def hands():
+    return _random_hands(20000, seed=0)
+
+def test_batch_matches_single_hand(hands):
+    recognizer = GestureRecognizer()
+    gesture_ids, confidences = recognizer.recognize_gestures(hands, chunk_size=7919)
+
+    for points, gesture_id, confidence in zip(hands, gesture_ids, confidences):
+        assert (recognizer.GESTURE_IDS[gesture_id], confidence) == recognizer.recognize_gesture(points)
+
+def test_landmark_objects_match_arrays(hands):
+    recognizer = GestureRecognizer()
+    subset = hands[:500]
+
+    gesture_ids, _ = recognizer.recognize_gestures([_as_landmarks(points) for points in subset])
+    assert (gesture_ids == recognizer.recognize_gestures(subset)[0]).all()
+    for points in subset:
+        assert recognizer.recognize_gesture(_as_landmarks(points)) == recognizer.recognize_gesture(points)
+
+def test_batch_supports_added_rules(hands):
+    recognizer = GestureRecognizer(rules=GESTURE_RULES + [GestureRule("three", 0.9, "01110", 5, ())])
+    gesture_ids, confidences = recognizer.recognize_gestures(hands[:5000])
+
+    names = [recognizer.GESTURE_IDS[gesture_id] for gesture_id in gesture_ids]
+    assert "three" in names
+    assert recognizer.GESTURES["three"] == "three"
+    for points, name, confidence in zip(hands[:5000], names, confidences):
+        assert (name, confidence) == recognizer.recognize_gesture(points)
+
+def test_batch_matches_baseline_rules(hands):
+    recognizer = GestureRecognizer()
+    gesture_ids, confidences = recognizer.recognize_gestures(hands)
+
+    recognized = set()
+    for points, gesture_id, confidence in zip(hands, gesture_ids, confidences):
+        expected = _baseline_recognize(points)
+        actual = (recognizer.GESTURE_IDS[gesture_id], float(confidence))
+        if actual != expected:
+            # Tek izin verilen fark: vektörel ve skaler açı hesabının tam 45 derecede
+            # farklı yuvarlandığı "gun" eşiği
+            assert "gun" in (actual[0], expected[0]) and abs(_angle(points.tolist(), 4, 8) - 45) < 1e-9
+        recognized.add(expected[0])
+
+    # Veri seti kuralların çoğunu gerçekten deniyor
+    assert len(recognized) >= 10
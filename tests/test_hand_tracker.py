@@ -0,0 +1,68 @@
+import numpy as np
+
+from hand_tracker import HandTracker, GestureEvent
+
+def _hand(x, y):
+    points = np.zeros((21, 3))
+    points[:, 0] = x
+    points[:, 1] = y
+    return points
+
+def _feed(tracker, gestures, x=0.3, y=0.5):
+    """
+    Aynı konumdaki tek ele sırayla ham tanımaları verir ve olayları toplar.
+    """
+    events = []
+    track_ids = []
+    for gesture in gestures:
+        track_id, = tracker.assign([_hand(x, y)])
+        track_ids.append(track_id)
+        tracker.observe(track_id, gesture, 0.9 if gesture != "unknown" else 0.0)
+        events += tracker.pop_events()
+    assert len(set(track_ids)) == 1
+    return events
+
+def test_gesture_is_confirmed_after_hold_frames():
+    tracker = HandTracker(min_hold_frames=3)
+    assert _feed(tracker, ['fist', 'fist']) == []
+    assert _feed(tracker, ['fist']) == [GestureEvent(0, 'fist', 0.9)]
+    assert tracker.active_gestures() == [(0, 'fist', 0.9)]
+    # Onaylanmış hareket sürdükçe yeni olay yok
+    assert _feed(tracker, ['fist'] * 10) == []
+
+def test_short_flicker_emits_no_event():
+    tracker = HandTracker(min_hold_frames=3, exit_frames=5)
+    events = _feed(tracker, ['fist'] * 3)
+    # 1-2 karelik başka hareket veya kayıp, onaylanmış hareketi değiştirmez
+    events += _feed(tracker, ['ok', 'fist', 'fist', 'ok', 'ok', 'fist', 'unknown', 'unknown', 'fist'])
+    assert events == [GestureEvent(0, 'fist', 0.9)]
+
+    # Onaylanmış hareket yokken de 1-2 karelik tanıma olay üretmez
+    tracker = HandTracker(min_hold_frames=3)
+    assert _feed(tracker, ['ok', 'unknown', 'ok', 'ok', 'unknown', 'peace']) == []
+    assert tracker.active_gestures() == []
+
+def test_lost_track_ends_gesture_after_max_missed():
+    tracker = HandTracker(max_missed=5)
+    assert _feed(tracker, ['peace'] * 3) == [GestureEvent(0, 'peace', 0.9)]
+
+    for _ in range(5):
+        tracker.assign([])
+        assert tracker.pop_events() == []
+        assert tracker.lost_ids == []
+
+    tracker.assign([])
+    assert tracker.pop_events() == [GestureEvent(0, 'unknown', 0.0)]
+    assert tracker.lost_ids == [0]
+    assert tracker.tracks == {}
+
+def test_tracks_follow_nearest_wrist():
+    tracker = HandTracker()
+    first = tracker.assign([_hand(0.2, 0.5), _hand(0.8, 0.5)])
+    for step in range(1, 10):
+        left, right = _hand(0.2 + 0.01 * step, 0.5), _hand(0.8 - 0.01 * step, 0.5)
+        # MediaPipe el sırası kareden kareye değişebilir
+        if step % 2:
+            assert tracker.assign([right, left]) == first[::-1]
+        else:
+            assert tracker.assign([left, right]) == first
@@ -0,0 +1,47 @@
+import numpy as np
+
+from landmark_filter import OneEuroFilter
+
+def test_new_track_passes_through():
+    rng = np.random.default_rng(0)
+    landmark_filter = OneEuroFilter()
+    first = rng.uniform(0, 1, size=(1, 21, 3))
+    np.testing.assert_array_equal(landmark_filter(first, [7], 0.0), first)
+
+    # Var olan iz filtrelenirken aynı karedeki yeni iz olduğu gibi geçer
+    points = rng.uniform(0, 1, size=(2, 21, 3))
+    filtered = landmark_filter(points, [7, 8], 1 / 30)
+    assert not np.allclose(filtered[0], points[0])
+    np.testing.assert_array_equal(filtered[1], points[1])
+
+def test_jitter_is_smoothed():
+    rng = np.random.default_rng(1)
+    landmark_filter = OneEuroFilter()
+    base = rng.uniform(0.3, 0.7, size=(21, 3))
+    raw = base + rng.normal(0, 0.003, size=(120, 21, 3))
+    filtered = np.array([landmark_filter(points[np.newaxis], [0], k / 30)[0] for k, points in enumerate(raw)])
+    assert filtered[30:].std(axis=0).mean() < 0.5 * raw[30:].std(axis=0).mean()
+
+def test_slot_is_reused_after_reset():
+    rng = np.random.default_rng(2)
+    landmark_filter = OneEuroFilter(capacity=2)
+    landmark_filter(rng.uniform(0, 1, size=(2, 21, 3)), [0, 1], 0.0)
+    landmark_filter(rng.uniform(0, 1, size=(2, 21, 3)), [0, 1], 1 / 30)
+    slot = landmark_filter.slots[0]
+
+    landmark_filter.reset(0)
+    assert 0 not in landmark_filter.slots
+
+    # Yeni iz boşalan satırı alır, durum dizileri büyümez ve eski durumu devralmaz
+    points = rng.uniform(0, 1, size=(1, 21, 3))
+    np.testing.assert_array_equal(landmark_filter(points, [5], 2 / 30), points)
+    assert landmark_filter.slots[5] == slot
+    assert len(landmark_filter.timestamps) == 2
+
+    # Sıfırlanan iz geri dönerse yine filtrelenmeden başlar
+    points = rng.uniform(0, 1, size=(1, 21, 3))
+    np.testing.assert_array_equal(landmark_filter(points, [0], 3 / 30), points)
+    assert len(landmark_filter.timestamps) == 4
+
+    landmark_filter.reset()
+    assert landmark_filter.slots == {}
@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from motion_gestures import MotionGestureRecognizer
+
+FPS = 30
+
+def _hand(rng, scale=1.0):
+    # Bilek ile orta parmak kökü arası (avuç boyu) 0.15 * scale; başparmak ve işaret ucu açık
+    points = rng.uniform(-0.08, 0.08, size=(21, 3))
+    points[0] = [0, 0.1, 0]
+    points[9] = [0, -0.05, 0]
+    points[4] = [0.1, 0.1, 0]
+    points[8] = [0, -0.1, 0]
+    return points * scale
+
+def _run(trajectory, seed=0, noise=0.001, scale=1.0, pinch=False):
+    """
+    Avuç merkezini verilen yörüngede gezdirir ve tanınan hareketleri döndürür.
+    """
+    rng = np.random.default_rng(seed)
+    hand = _hand(rng, scale)
+    if pinch:
+        hand[8] = hand[4] + 0.01
+    recognizer = MotionGestureRecognizer()
+    gestures = []
+    for i, (x, y) in enumerate(trajectory):
+        points = hand + [x, y, 0] + rng.normal(0, noise, size=(21, 3))
+        gesture, _ = recognizer.update('Right', points, i / FPS)
+        if gesture != "unknown":
+            gestures.append(gesture)
+    return gestures
+
+N = 24
+
+@pytest.mark.parametrize('expected, trajectory, pinch', [
+    ('swipe_right', [(0.2 + 0.5 * i / N, 0.5) for i in range(N)], False),
+    ('swipe_left', [(0.7 - 0.5 * i / N, 0.5) for i in range(N)], False),
+    ('wave', [(0.5 + 0.08 * math.sin(i / N * 8 * math.pi), 0.5) for i in range(N)], False),
+    ('circle', [(0.5 + 0.15 * math.cos(i / N * 2 * math.pi), 0.5 + 0.15 * math.sin(i / N * 2 * math.pi))
+                for i in range(N + 2)], False),
+    ('pinch_drag', [(0.3 + 0.3 * i / N, 0.5 + 0.1 * i / N) for i in range(N)], True),
+])
+def test_synthetic_motion_is_recognized(expected, trajectory, pinch):
+    gestures = _run(trajectory, pinch=pinch)
+    assert gestures and set(gestures) == {expected}
+
+@pytest.mark.parametrize('scale', [0.5, 1.0, 1.5])
+@pytest.mark.parametrize('noise', [0.003, 0.005])
+def test_still_hand_with_jitter_triggers_nothing(scale, noise):
+    # 30 saniye boyunca yerinde duran, landmark'ları titreyen el
+    assert _run([(0.5, 0.5)] * (30 * FPS), noise=noise, scale=scale) == []
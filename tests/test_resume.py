@@ -0,0 +1,97 @@
+import os
+
+import cv2
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from model import create_model, train_model, train_model_on_sequence
+from dataset_manifest import ClassBalancedSampler
+from dataset_shards import build_sharded_dataset, ShardedDataset, ShardedSequence, split_sharded_dataset
+
+SEED = 7
+NUM_CLASSES = 3
+IMAGE_SIZE = 16
+
+def _seed():
+    # main.train ile aynı: Dropout üreteçleri kontrol noktasına yazılır
+    tf.keras.backend.experimental.enable_tf_random_generator()
+    tf.keras.utils.set_random_seed(SEED)
+
+def _synthetic_arrays():
+    rng = np.random.default_rng(0)
+    y = np.repeat(np.arange(NUM_CLASSES), 16)
+    X = rng.random((len(y), IMAGE_SIZE, IMAGE_SIZE, 3)).astype('float32')
+    X[..., 0] += y[:, np.newaxis, np.newaxis] * 0.3
+    return X[::2], y[::2], X[1::2], y[1::2]
+
+def _train_arrays(model_path, epochs, resume):
+    _seed()
+    X_train, y_train, X_test, y_test = _synthetic_arrays()
+    model = create_model((IMAGE_SIZE, IMAGE_SIZE, 3), NUM_CLASSES)
+    history, model = train_model(model, X_train, y_train, X_test, y_test, batch_size=8, epochs=epochs,
+                                 model_save_path=model_path, checkpoint_every=1, resume=resume, seed=SEED)
+    return history.history, model.get_weights()
+
+@pytest.fixture(scope='module')
+def shard_dir(tmp_path_factory):
+    rng = np.random.default_rng(1)
+    data_dir = tmp_path_factory.mktemp('images')
+    for label in ('A', 'B', 'C'):
+        os.makedirs(data_dir / label)
+        # Dengesiz sınıflar: örnekleyicinin gerçekten kullanıldığını görmek için
+        for i in range({'A': 12, 'B': 6, 'C': 4}[label]):
+            cv2.imwrite(str(data_dir / label / f'{i}.jpg'), rng.integers(0, 255, (IMAGE_SIZE, IMAGE_SIZE, 3),
+                                                                          dtype=np.uint8))
+    output_dir = tmp_path_factory.mktemp('shards')
+    build_sharded_dataset(str(data_dir), str(output_dir), image_size=(IMAGE_SIZE, IMAGE_SIZE))
+    return str(output_dir)
+
+def _train_shards(dataset_dir, model_path, epochs, resume):
+    _seed()
+    dataset = ShardedDataset(dataset_dir)
+    train_indices, test_indices = split_sharded_dataset(dataset, test_size=0.25)
+    sampler = ClassBalancedSampler(dataset.labels[train_indices], seed=SEED + 1)
+    train_sequence = ShardedSequence(dataset, train_indices, batch_size=4, seed=SEED, sampler=sampler, augment=True)
+    test_sequence = ShardedSequence(dataset, test_indices, batch_size=4, shuffle=False)
+    model = create_model(tuple(dataset.image_shape), dataset.num_classes)
+    history, model = train_model_on_sequence(model, train_sequence, test_sequence, epochs=epochs,
+                                             model_save_path=model_path, checkpoint_every=1, resume=resume,
+                                             seed=SEED)
+    return history.history, model.get_weights()
+
+def _assert_same_run(uninterrupted, resumed):
+    history, weights = uninterrupted
+    resumed_history, resumed_weights = resumed
+    assert set(history) == set(resumed_history)
+    for key in history:
+        np.testing.assert_allclose(resumed_history[key], history[key], rtol=1e-5, err_msg=key)
+    for expected, actual in zip(weights, resumed_weights):
+        np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+def test_resumed_array_training_matches_uninterrupted(tmp_path):
+    uninterrupted = _train_arrays(str(tmp_path / 'full' / 'model.h5'), 3, resume=False)
+
+    _train_arrays(str(tmp_path / 'split' / 'model.h5'), 2, resume=False)
+    resumed = _train_arrays(str(tmp_path / 'split' / 'model.h5'), 3, resume=True)
+
+    _assert_same_run(uninterrupted, resumed)
+
+def test_resumed_sequence_training_matches_uninterrupted(tmp_path, shard_dir):
+    uninterrupted = _train_shards(shard_dir, str(tmp_path / 'full' / 'model.h5'), 3, resume=False)
+
+    _train_shards(shard_dir, str(tmp_path / 'split' / 'model.h5'), 2, resume=False)
+    resumed = _train_shards(shard_dir, str(tmp_path / 'split' / 'model.h5'), 3, resume=True)
+
+    _assert_same_run(uninterrupted, resumed)
+
+def test_resume_with_different_options_fails_clearly(tmp_path):
+    model_path = str(tmp_path / 'model.h5')
+    _train_arrays(model_path, 1, resume=False)
+
+    _seed()
+    X_train, y_train, X_test, y_test = _synthetic_arrays()
+    model = create_model((IMAGE_SIZE, IMAGE_SIZE, 3), NUM_CLASSES)
+    with pytest.raises(ValueError, match='accumulation-steps'):
+        train_model(model, X_train, y_train, X_test, y_test, batch_size=8, epochs=2, model_save_path=model_path,
+                    accumulation_steps=2, resume=True, seed=SEED)